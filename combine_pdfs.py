@@ -15,6 +15,10 @@ Same as above but pick an explicit output file:
 
     python combine_pdfs.py /path/to/dir -o /tmp/all_docs.pdf
 
+Tune parallelism (4 documents at a time, 2 OCR threads each):
+
+    python combine_pdfs.py /path/to/dir --parallel-files 4 --ocr-jobs 2
+
 Dry-run / health-check only (no merge, no OCR):
 
     python combine_pdfs.py /path/to/dir --check
@@ -31,6 +35,10 @@ Dependencies
 * python-docx (`pip install python-docx`)
 * docx2pdf (`pip install docx2pdf`)  – Windows/macOS only
 * For Linux: libreoffice (`sudo apt-get install libreoffice`)
+* pikepdf (`pip install pikepdf`)  – optional, fastest text detection and merging
+* PyMuPDF (`pip install PyMuPDF`)  – optional, much faster text detection
+* unoserver (`pip install unoserver`)  – optional on Linux, keeps one LibreOffice
+  instance running instead of starting a new one per DOC/DOCX
 
 The script logs to STDOUT at INFO level by default.  Use --verbose for DEBUG.
 """
@@ -38,18 +46,30 @@ The script logs to STDOUT at INFO level by default.  Use --verbose for DEBUG.
 from __future__ import annotations
 
 import argparse
+import atexit
+import concurrent.futures
+import contextlib
+import gc
+import hashlib
+import json
 import logging
+import mmap
 import os
 import platform
+import queue
+import re
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Iterator, List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 try:
-    from PyPDF2 import PdfReader, PdfMerger
+    from PyPDF2 import PdfReader, PdfWriter
     from PyPDF2.errors import PdfReadError
 except ImportError:
     print("PyPDF2 is required. Install with: pip install PyPDF2")
@@ -61,6 +81,19 @@ except ImportError:
     print("python-docx is required. Install with: pip install python-docx")
     sys.exit(1)
 
+try:
+    import pikepdf  # optional: QPDF-backed text probe and merger
+except ImportError:
+    pikepdf = None
+
+try:
+    import pymupdf as fitz  # PyMuPDF – optional fast path for pdf_has_text
+except ImportError:
+    try:
+        import fitz  # PyMuPDF < 1.24
+    except ImportError:
+        fitz = None
+
 if platform.system() in ["Windows", "Darwin"]:
     try:
         from docx2pdf import convert
@@ -72,26 +105,133 @@ if platform.system() in ["Windows", "Darwin"]:
 # -----------------------------------------------------------------------------#
 # Utility functions                                                            #
 # -----------------------------------------------------------------------------#
-SUPPORTED_EXTENSIONS = {".pdf", ".doc", ".docx"}
+# Suffix -> document kind, resolved once per file while scanning
+DOCUMENT_KINDS = {".pdf": "pdf", ".doc": "doc", ".docx": "doc"}
+SUPPORTED_EXTENSIONS = tuple(DOCUMENT_KINDS)
+
+UNO_HOST = "127.0.0.1"
+# External tools are resolved on PATH once instead of on every subprocess launch
+OCRMYPDF_BIN = shutil.which("ocrmypdf") or "ocrmypdf"
+SOFFICE_BIN = shutil.which("libreoffice") or shutil.which("soffice") or "libreoffice"
+UNOSERVER_BIN = shutil.which("unoserver")
+UNOCONVERT_BIN = shutil.which("unoconvert")
+# LibreOffice degrades after ~60 conversions in one session, so restart well before that
+LISTENER_RESTART_EVERY = 50
+# Text-showing operators (Tj, TJ, ' and ") in a page content stream
+TEXT_OPERATOR_RE = re.compile(rb"(?<![A-Za-z/])T[jJ](?![A-Za-z])|[)>]\s*['\"]")
+# Probe results persisted between runs so --check followed by a merge parses each PDF once
+CACHE_FILE = Path.home() / ".cache" / "pdf_combiner" / "text_probe.json"
+# Newest entries kept per cache section; entries for changed or deleted files are dropped first
+CACHE_MAX_ENTRIES = 10000
+# Cache keys are "path|mtime_ns|size", optionally followed by "|sample_pages"
+CACHE_KEY_RE = re.compile(r"^(.*?)\|(\d+)\|(\d+)(?:\|\d+)?$")
+# Larger LibreOffice batches stop paying off beyond roughly ten documents
+CONVERT_BATCH_SIZE = 10
+# Marks the JSON list of source files stored in a combined PDF's /Keywords
+METADATA_PREFIX = "pdf_combiner:"
+# Sources held open while merging with pikepdf; well below the usual 1024 descriptor limit
+MERGE_OPEN_SOURCES = 64
 
 
-def iter_documents(directory: Path) -> Iterator[Path]:
-    """Yield PDF, DOC, and DOCX files in *directory* sorted alphabetically (non-recursive)."""
+def iter_documents(directory: Path) -> Iterator[Tuple[Path, str]]:
+    """
+    Yield ``(path, kind)`` for PDF, DOC, and DOCX files in *directory* sorted
+    alphabetically (non-recursive); *kind* is ``"pdf"`` or ``"doc"``.
+    """
     if not directory.is_dir():
         raise NotADirectoryError(f"{directory} is not a directory")
     
-    for p in sorted(directory.iterdir()):
-        if p.suffix.lower() in SUPPORTED_EXTENSIONS:
-            yield p
+    # Filter on the raw entry name so no Path is built for unrelated files
+    with os.scandir(directory) as it:
+        entries = [e for e in it if e.name.lower().endswith(SUPPORTED_EXTENSIONS) and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    for e in entries:
+        yield Path(e.path), "pdf" if e.name.lower().endswith(".pdf") else "doc"
 
 
-def count_expected_files(directory: Path) -> int:
-    """Count total number of supported files in directory."""
-    return sum(1 for _ in iter_documents(directory))
+@contextlib.contextmanager
+def libreoffice_listener() -> Iterator[Optional[int]]:
+    """
+    Keep one headless LibreOffice (via unoserver) running for the duration of the block.
 
+    Yields the port to hand to ``unoconvert``, or None when unoserver is not
+    installed or fails to start – callers then fall back to one
+    ``libreoffice --headless`` run per file.
+    """
+    if platform.system() != "Linux" or not (UNOSERVER_BIN and UNOCONVERT_BIN):
+        yield None
+        return
 
-def convert_doc_to_pdf(doc_path: Path, output_dir: Path) -> Path:
-    """Convert DOC/DOCX file to PDF. Returns path to converted PDF."""
+    # Let the OS pick a free port so concurrent runs don't collide
+    with socket.socket() as sock:
+        sock.bind((UNO_HOST, 0))
+        port = sock.getsockname()[1]
+    try:
+        proc = subprocess.Popen(
+            [UNOSERVER_BIN, "--interface", UNO_HOST, "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        logging.warning("Could not start unoserver (%s) – converting with one LibreOffice run per file.", e)
+        yield None
+        return
+    try:
+        deadline = time.monotonic() + 30
+        started = False
+        while proc.poll() is None and time.monotonic() < deadline:
+            try:
+                socket.create_connection((UNO_HOST, port), timeout=1).close()
+                started = True
+                break
+            except OSError:
+                time.sleep(0.2)
+        if not started:
+            logging.warning("unoserver did not start – converting with one LibreOffice run per file.")
+        yield port if started else None
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _run_libreoffice(doc_paths: List[Path], output_dir: Path) -> None:
+    """Convert every file in *doc_paths* into *output_dir* with one headless LibreOffice run."""
+    # A per-process profile lets several LibreOffice instances run side by side
+    profile = (output_dir / f"lo_profile_{os.getpid()}").resolve()
+    cmd = [
+        SOFFICE_BIN,
+        f"-env:UserInstallation={profile.as_uri()}",
+        "--headless",
+        "--convert-to",
+        "pdf",
+        "--outdir",
+        str(output_dir),
+        *(str(p) for p in doc_paths),
+    ]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        logging.error("LibreOffice conversion failed for %s: %s",
+                      ", ".join(str(p) for p in doc_paths), e.stderr)
+        raise RuntimeError(
+            "LibreOffice is required for DOC/DOCX conversion on Linux. "
+            "Install with: sudo apt-get install libreoffice"
+        ) from e
+    except FileNotFoundError:
+        raise RuntimeError(
+            "LibreOffice is required for DOC/DOCX conversion on Linux. "
+            "Install with: sudo apt-get install libreoffice"
+        )
+
+
+def convert_doc_to_pdf(doc_path: Path, output_dir: Path, uno_port: Optional[int] = None) -> Path:
+    """
+    Convert DOC/DOCX file to PDF. Returns path to converted PDF.
+    On Linux, *uno_port* routes the conversion through a running unoserver listener.
+    """
     pdf_path = output_dir / f"{doc_path.stem}.pdf"
     
     logging.info("Converting %s to PDF...", doc_path.name)
@@ -99,30 +239,26 @@ def convert_doc_to_pdf(doc_path: Path, output_dir: Path) -> Path:
     if platform.system() in ["Windows", "Darwin"]:
         # Use docx2pdf on Windows/macOS
         convert(str(doc_path), str(pdf_path))
-    else:
-        # Use LibreOffice on Linux
+    elif uno_port is not None:
+        # Reuse the persistent LibreOffice instance
         cmd = [
-            "libreoffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(output_dir),
-            str(doc_path)
+            UNOCONVERT_BIN,
+            "--host", UNO_HOST,
+            "--port", str(uno_port),
+            "--convert-to", "pdf",
+            str(doc_path),
+            str(pdf_path),
         ]
         try:
             subprocess.run(cmd, check=True, capture_output=True, text=True)
-        except subprocess.CalledProcessError as e:
-            logging.error("LibreOffice conversion failed for %s: %s", doc_path, e.stderr)
-            raise RuntimeError(
-                "LibreOffice is required for DOC/DOCX conversion on Linux. "
-                "Install with: sudo apt-get install libreoffice"
-            ) from e
-        except FileNotFoundError:
-            raise RuntimeError(
-                "LibreOffice is required for DOC/DOCX conversion on Linux. "
-                "Install with: sudo apt-get install libreoffice"
-            )
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            logging.error("unoconvert failed for %s: %s", doc_path, getattr(e, "stderr", e))
+            raise RuntimeError(f"Failed to convert {doc_path} to PDF") from e
+        # unoconvert exits non-zero on failure, so the output needs no separate check
+        return pdf_path
+    else:
+        # Use LibreOffice on Linux
+        _run_libreoffice([doc_path], output_dir)
     
     if not pdf_path.exists():
         raise RuntimeError(f"Failed to convert {doc_path} to PDF")
@@ -130,15 +266,192 @@ def convert_doc_to_pdf(doc_path: Path, output_dir: Path) -> Path:
     return pdf_path
 
 
+def convert_docs_batch(doc_paths: List[Path], output_dir: Path,
+                       uno_port: Optional[int] = None) -> dict[Path, Path]:
+    """
+    Convert several DOC/DOCX files to PDF, returning ``{source: pdf}`` for each success.
+
+    On Linux without a listener all files go through a single LibreOffice run, so
+    its startup cost is paid once per batch; stems must be unique within a batch.
+    Elsewhere the files are converted one by one.
+    """
+    if platform.system() == "Linux" and uno_port is None:
+        logging.info("Converting %d documents to PDF...", len(doc_paths))
+        _run_libreoffice(doc_paths, output_dir)
+        # LibreOffice exits 0 even when a file fails, so list the output once
+        with os.scandir(output_dir) as it:
+            produced = {entry.name for entry in it}
+        converted = {}
+        for doc in doc_paths:
+            if f"{doc.stem}.pdf" in produced:
+                converted[doc] = output_dir / f"{doc.stem}.pdf"
+            else:
+                logging.error("Failed to convert %s to PDF", doc.name)
+        return converted
+
+    converted = {}
+    for doc in doc_paths:
+        try:
+            converted[doc] = convert_doc_to_pdf(doc, output_dir, uno_port)
+        except Exception as e:
+            logging.error("Failed to convert %s: %s", doc.name, e)
+    return converted
+
+
+def _doc_batches(indices: List[int], files: List[Path]) -> Iterator[List[int]]:
+    """Group *indices* into conversion batches of unique stems, at most CONVERT_BATCH_SIZE each."""
+    batch: List[int] = []
+    stems: set[str] = set()
+    for i in indices:
+        if len(batch) == CONVERT_BATCH_SIZE or files[i].stem in stems:
+            yield batch
+            batch, stems = [], set()
+        batch.append(i)
+        stems.add(files[i].stem)
+    if batch:
+        yield batch
+
+
+def file_sha1(path: Path) -> str:
+    """
+    Return the hex SHA-1 of *path*'s contents.
+    The file is memory-mapped so the kernel pages it in and memory use stays flat.
+    """
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return hashlib.sha1().hexdigest()  # empty files cannot be mapped
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha1(mm).hexdigest()
+
+
+_cache: Optional[dict[str, dict]] = None
+_cache_dirty = False
+_cache_lock = threading.Lock()
+# Entries stored since the last _cache_take_new(); pool workers hand these back
+# to the parent, since a worker process never runs the atexit save
+_cache_new: dict[str, dict] = {}
+
+
+def _cache_section(name: str) -> dict:
+    """Return section *name* of the on-disk probe cache, loading it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = json.loads(CACHE_FILE.read_text())
+            except (OSError, ValueError):
+                _cache = {}
+            atexit.register(_save_cache)
+        return _cache.setdefault(name, {})
+
+
+def _cache_store(name: str, key: str, value) -> None:
+    global _cache_dirty
+    _cache_section(name)[key] = value
+    with _cache_lock:
+        _cache_new.setdefault(name, {})[key] = value
+        _cache_dirty = True
+
+
+def _cache_take_new() -> dict[str, dict]:
+    """Return and forget the entries stored since the previous call."""
+    with _cache_lock:
+        new = {name: dict(entries) for name, entries in _cache_new.items()}
+        _cache_new.clear()
+    return new
+
+
+def _cache_merge(entries: dict[str, dict]) -> None:
+    """Add entries computed in a worker process to this process's cache."""
+    global _cache_dirty
+    for name, section in entries.items():
+        _cache_section(name).update(section)
+        _cache_dirty = True
+
+
+def _cache_entry_current(key: str) -> bool:
+    """Return True if the file a cache key describes still exists with the same mtime and size."""
+    match = CACHE_KEY_RE.match(key)
+    if match is None:
+        return False
+    try:
+        st = os.stat(match.group(1))
+    except OSError:
+        return False
+    return st.st_mtime_ns == int(match.group(2)) and st.st_size == int(match.group(3))
+
+
+def _save_cache() -> None:
+    """Prune the probe cache and write it back atomically if anything changed."""
+    if not _cache_dirty:
+        return
+    # Every edit to a file leaves a stale entry behind, so drop those before saving
+    for name, section in list(_cache.items()):
+        if isinstance(section, dict):
+            current = [(key, value) for key, value in section.items() if _cache_entry_current(key)]
+            _cache[name] = dict(current[-CACHE_MAX_ENTRIES:])
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(_cache))
+        os.replace(tmp, CACHE_FILE)
+    except OSError as e:
+        logging.debug("Could not write cache %s: %s", CACHE_FILE, e)
+
+
 def pdf_has_text(path: Path, sample_pages: int = 3) -> bool:
     """
     Return True if *path* contains any extractable text on the first
     *sample_pages*.  Assumes PDFs that have *any* text are already searchable.
+    Results are cached on disk by (path, mtime, size).
     """
+    st = path.stat()
+    key = f"{path.resolve()}|{st.st_mtime_ns}|{st.st_size}|{sample_pages}"
+    cached = _cache_section("text").get(key)
+    if cached is not None:
+        return cached
+    result = _pdf_has_text(path, sample_pages)
+    _cache_store("text", key, result)
+    return result
+
+
+def _pdf_has_text(path: Path, sample_pages: int) -> bool:
+    """Uncached text probe: PyMuPDF, then pikepdf, then PyPDF2, whichever is installed."""
+    if fitz is not None:
+        try:
+            with fitz.open(str(path)) as doc:
+                for i in range(min(sample_pages, doc.page_count)):
+                    if doc[i].get_text("text").strip():
+                        return True
+        except fitz.FileDataError as err:
+            logging.error("Corrupted PDF detected: %s – %s", path.name, err)
+            return False
+        return False  # no text found
+
+    if pikepdf is not None:
+        # Any text-showing operator is enough; no text layout needs to be rebuilt
+        try:
+            with pikepdf.open(path) as pdf:
+                for page in pdf.pages[:sample_pages]:
+                    contents = page.obj.get("/Contents")
+                    if contents is not None:
+                        if isinstance(contents, pikepdf.Array):
+                            data = b"\n".join(c.read_bytes() for c in contents)
+                        else:
+                            data = contents.read_bytes()
+                        if TEXT_OPERATOR_RE.search(data):
+                            return True
+                    if _forms_have_text_op(page.obj, set()):
+                        return True
+        except pikepdf.PdfError as err:
+            logging.error("Corrupted PDF detected: %s – %s", path.name, err)
+            return False
+        return False  # no text found
+
     try:
         reader = PdfReader(str(path))
-        for i, page in enumerate(reader.pages[:sample_pages]):
-            if (text := page.extract_text()) and text.strip():
+        for page in reader.pages[:sample_pages]:
+            if _page_has_text_op(page):
                 return True
     except PdfReadError as err:
         logging.error("Corrupted PDF detected: %s – %s", path.name, err)
@@ -146,25 +459,65 @@ def pdf_has_text(path: Path, sample_pages: int = 3) -> bool:
     return False  # no text found
 
 
-def ocr_pdf(source: Path, dest_dir: Path) -> Path:
+def _forms_have_text_op(obj, seen: set) -> bool:
+    """
+    Return True if a Form XObject reachable from *obj*'s /Resources shows text.
+    Text drawn through ``/Fm0 Do`` never appears in the page's own /Contents.
+    """
+    resources = obj.get("/Resources")
+    xobjects = resources.get("/XObject") if resources is not None else None
+    if xobjects is None:
+        return False
+    for xobj in xobjects.values():
+        if xobj.get("/Subtype") != "/Form" or xobj.objgen in seen:
+            continue
+        seen.add(xobj.objgen)
+        if TEXT_OPERATOR_RE.search(xobj.read_bytes()) or _forms_have_text_op(xobj, seen):
+            return True
+    return False
+
+
+def _page_has_text_op(page) -> bool:
+    """
+    Return True if the PyPDF2 *page* shows text.
+    A text-showing operator in the content stream settles it cheaply; pages
+    without one fall back to extract_text(), which also follows Form XObjects.
+    """
+    contents = page.get_contents()
+    if contents is not None and TEXT_OPERATOR_RE.search(contents.get_data()):
+        return True
+    return bool(page.extract_text().strip())
+
+
+def ocr_pdf(source: Path, dest_dir: Path, jobs: int | None = None, pdfa: bool = False) -> Path:
     """
     Run OCRmyPDF on *source* only when it is image-based.
     Returns the path to an OCR-processed copy (may be the original if no OCR).
+    *jobs* is forwarded to ``ocrmypdf --jobs`` when given.  Output is plain PDF
+    without optimization or linearization unless *pdfa* asks for PDF/A.
     """
     if pdf_has_text(source):
         logging.debug("Text already present in %s; skipping OCR.", source.name)
         return source
 
-    dest = dest_dir / source.name
+    # Several inputs can share a name (a.pdf next to a converted a.docx) and are OCR'd
+    # concurrently, so key the output on the full source path
+    tag = hashlib.sha1(str(source.resolve()).encode()).hexdigest()[:12]
+    dest = dest_dir / f"ocr_{tag}_{source.name}"
     logging.info("Running OCR on image-only PDF: %s", source.name)
 
     cmd = [
-        "ocrmypdf",
+        OCRMYPDF_BIN,
         "--skip-text",          # OCRmyPDF will skip pages that already have text
         "--quiet",
-        str(source),
-        str(dest),
+        "--optimize", "0",
+        "--fast-web-view", "999999",  # threshold in MB; effectively never linearize
     ]
+    if not pdfa:
+        cmd += ["--output-type", "pdf"]
+    if jobs is not None:
+        cmd += ["--jobs", str(jobs)]
+    cmd += [str(source), str(dest)]
     try:
         subprocess.run(cmd, check=True)
     except (subprocess.CalledProcessError, FileNotFoundError) as err:
@@ -176,26 +529,185 @@ def ocr_pdf(source: Path, dest_dir: Path) -> Path:
 
 
 def get_pdf_metadata(pdf_path: Path) -> List[str]:
-    """Extract list of original filenames from PDF metadata if available."""
+    """
+    Extract list of original filenames from PDF metadata if available.
+
+    Current output stores them as a JSON array in /Keywords after METADATA_PREFIX;
+    the comma-separated "Combined from:" form of older files is still understood.
+
+    The reader is handed an open file rather than a path so PyPDF2 seeks to the
+    trailer/xref and resolves only the /Info dictionary instead of loading the
+    whole file into memory first.  Results are cached on disk by
+    (path, mtime, size), like the text probe.
+    """
     try:
-        reader = PdfReader(str(pdf_path))
-        metadata = reader.metadata
-        if metadata and hasattr(metadata, 'get'):
-            # Check common metadata fields where we might store source files
-            for field in ['/Subject', '/Keywords', '/Producer']:
-                if field in metadata:
-                    value = str(metadata[field])
-                    if 'Combined from:' in value:
-                        files_str = value.replace('Combined from:', '').strip()
-                        return [f.strip() for f in files_str.split(',')]
+        with open(pdf_path, "rb") as fh:
+            st = os.fstat(fh.fileno())
+            key = f"{Path(pdf_path).resolve()}|{st.st_mtime_ns}|{st.st_size}"
+            cached = _cache_section("metadata").get(key)
+            if cached is not None:
+                return cached
+
+            files: List[str] = []
+            metadata = PdfReader(fh, strict=False).metadata
+            if metadata and hasattr(metadata, 'get'):
+                keywords = str(metadata.get('/Keywords', ''))
+                if keywords.startswith(METADATA_PREFIX):
+                    files = json.loads(keywords[len(METADATA_PREFIX):])
+                # Older output stored a comma-joined list in one of these fields
+                for field in ['/Subject', '/Keywords', '/Producer']:
+                    if not files and field in metadata:
+                        value = str(metadata[field])
+                        if 'Combined from:' in value:
+                            files_str = value.replace('Combined from:', '').strip()
+                            files = [f.strip() for f in files_str.split(',')]
+                            break
+            _cache_store("metadata", key, files)
+            return files
     except Exception as e:
         logging.debug("Could not read metadata from %s: %s", pdf_path, e)
     return []
 
 
+def _prepare_one(doc: Path, pdf_path: Path, tmp: Path,
+                 ocr_jobs: int, pdfa: bool = False) -> Tuple[str, Path, dict[str, dict]]:
+    """
+    OCR the (possibly converted) *pdf_path* for *doc* if it is image-only.
+    Runs in a worker process; returns ``(original_name, ready_pdf_path, cache_entries)``
+    where *cache_entries* are the probe results to merge into the parent's cache.
+    """
+    ready = ocr_pdf(pdf_path, tmp, jobs=ocr_jobs, pdfa=pdfa)
+    return doc.name, ready, _cache_take_new()
+
+
+def _prepare_all(documents: List[Tuple[Path, str]], tmp: Path, parallel_files: int | None = None,
+                 ocr_jobs: int | None = None, pdfa: bool = False) -> Tuple[dict[int, Path], List[str]]:
+    """
+    Convert and OCR *documents* (``(path, kind)`` pairs) in a process pool, with
+    conversion and OCR running as two pipelined stages.
+
+    *parallel_files* workers run side by side, each giving ocrmypdf *ocr_jobs*
+    threads; by default the outer pool fills the CPUs and the inner count is the
+    remaining share.  Returns ``({index: ready_pdf}, failed_names)``; indices refer
+    to *documents* so the caller can merge in the original order.
+    """
+    ready: dict[int, Path] = {}
+    failed: List[str] = []
+    files = [path for path, _ in documents]
+    if not files:
+        return ready, failed
+
+    # Identical inputs are converted/OCR'd once and share the resulting PDF
+    first_seen: dict[str, int] = {}
+    duplicate_of: dict[int, int] = {}
+    for i, doc in enumerate(files):
+        first = first_seen.setdefault(file_sha1(doc), i)
+        if first != i:
+            duplicate_of[i] = first
+            logging.debug("%s is identical to %s; reusing its result", doc.name, files[first].name)
+    todo = [i for i in range(len(files)) if i not in duplicate_of]
+    docs = [i for i in todo if documents[i][1] == "doc"]
+    pdfs = [i for i in todo if documents[i][1] == "pdf"]
+
+    cpus = os.cpu_count() or 1
+    max_workers = min(len(todo), parallel_files or cpus)
+    if ocr_jobs is None:
+        ocr_jobs = max(1, cpus // max_workers)
+
+    # Conversion feeds OCR through a bounded queue, so LibreOffice keeps working on
+    # the next documents while earlier ones are OCR'd and the temp dir stays small
+    ocr_q: queue.Queue = queue.Queue(maxsize=2 * max_workers)
+    lock = threading.Lock()
+
+    def fail(i: int) -> None:
+        with lock:
+            failed.append(files[i].name)
+
+    def feed_pdfs() -> None:
+        for i in pdfs:
+            ocr_q.put((i, files[i]))
+
+    def convert_docs() -> None:
+        # Stage 1: DOC/DOCX -> PDF, restarting the listener every LISTENER_RESTART_EVERY documents
+        handled: set[int] = set()
+        try:
+            for start in range(0, len(docs), LISTENER_RESTART_EVERY):
+                window = docs[start:start + LISTENER_RESTART_EVERY]
+                with libreoffice_listener() as uno_port:
+                    futures = {}
+                    for n, group in enumerate(_doc_batches(window, files)):
+                        out_dir = tmp / f"convert_{start}_{n}"
+                        out_dir.mkdir()
+                        sources = [files[i] for i in group]
+                        futures[executor.submit(convert_docs_batch, sources, out_dir, uno_port)] = group
+                    for future in concurrent.futures.as_completed(futures):
+                        group = futures[future]
+                        try:
+                            converted = future.result()
+                        except Exception as e:
+                            logging.error("Failed to convert %s: %s",
+                                          ", ".join(files[i].name for i in group), e)
+                            converted = {}
+                        for i in group:
+                            if files[i] in converted:
+                                ocr_q.put((i, converted[files[i]]))
+                            else:
+                                fail(i)
+                            handled.add(i)
+        except Exception as e:
+            # An exception would otherwise end this thread silently and the
+            # remaining documents would be left out of the merge unreported
+            logging.error("Document conversion stopped: %s", e)
+            for i in docs:
+                if i not in handled:
+                    fail(i)
+
+    def ocr_worker() -> None:
+        # Stage 2: OCR image-only PDFs as they arrive
+        while (item := ocr_q.get()) is not None:
+            i, pdf_path = item
+            try:
+                future = executor.submit(_prepare_one, files[i], pdf_path, tmp, ocr_jobs, pdfa)
+                _, ready_pdf, entries = future.result()
+                _cache_merge(entries)
+            except Exception as e:
+                logging.error("Failed to process %s: %s", files[i].name, e)
+                fail(i)
+                continue
+            with lock:
+                ready[i] = ready_pdf
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        consumers = [threading.Thread(target=ocr_worker) for _ in range(max_workers)]
+        producers = [threading.Thread(target=feed_pdfs), threading.Thread(target=convert_docs)]
+        for thread in consumers + producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        for _ in consumers:
+            ocr_q.put(None)
+        for thread in consumers:
+            thread.join()
+
+    for i, first in duplicate_of.items():
+        if first in ready:
+            ready[i] = ready[first]
+        else:
+            failed.append(files[i].name)
+    return ready, failed
+
+
 # -----------------------------------------------------------------------------#
 # Core workflow                                                                #
 # -----------------------------------------------------------------------------#
+def _probe(path: Path) -> Tuple[str, str]:
+    """Classify a PDF as ``"searchable"``, ``"image"`` or ``"bad"``; returns ``(name, status)``."""
+    try:
+        return path.name, "searchable" if pdf_has_text(path) else "image"
+    except PdfReadError:
+        return path.name, "bad"
+
+
 def check_only(directory: Path) -> None:
     """
     Verify that every document in *directory* is readable and report whether PDFs
@@ -204,23 +716,26 @@ def check_only(directory: Path) -> None:
     logging.info("Running integrity check on directory: %s", directory)
     ok: List[str] = []
     bad: List[str] = []
-    doc_count = 0
-    pdf_count = 0
 
-    for doc in iter_documents(directory):
-        if doc.suffix.lower() in ['.doc', '.docx']:
-            doc_count += 1
+    documents = list(iter_documents(directory))
+    pdfs = [path for path, kind in documents if kind == "pdf"]
+    doc_count = len(documents) - len(pdfs)
+    pdf_count = len(pdfs)
+
+    # Probing is mostly file I/O, so threads overlap it well; map() keeps input order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        probes = dict(executor.map(_probe, pdfs))
+
+    statuses = {"searchable": "searchable text", "image": "image-only / needs OCR"}
+    for doc, _ in documents:
+        if doc.name not in probes:
             logging.info("%-45s  →  %s", doc.name, "DOC/DOCX (will convert to PDF)")
             ok.append(doc.name)
-        else:  # PDF
-            pdf_count += 1
-            try:
-                searchable = pdf_has_text(doc)
-                status = "searchable text" if searchable else "image-only / needs OCR"
-                logging.info("%-45s  →  %s", doc.name, status)
-                ok.append(doc.name)
-            except PdfReadError:
-                bad.append(doc.name)
+        elif probes[doc.name] == "bad":
+            bad.append(doc.name)
+        else:
+            logging.info("%-45s  →  %s", doc.name, statuses[probes[doc.name]])
+            ok.append(doc.name)
 
     total = len(ok) + len(bad)
     logging.info("Found %d files total: %d PDFs, %d DOC/DOCX files", total, pdf_count, doc_count)
@@ -230,47 +745,140 @@ def check_only(directory: Path) -> None:
     logging.info("Checked %d documents – readable: %d, unreadable: %d", total, len(ok), len(bad))
 
 
-def merge_documents(directory: Path, output_file: Path) -> None:
-    """Combine every document in *directory* (after conversion/OCR if required) into *output_file*."""
+def _combined_metadata(processed_files: List[str]) -> dict[str, str]:
+    """Document info recording the source files of a combined PDF."""
+    return {
+        '/Keywords': METADATA_PREFIX + json.dumps(processed_files, ensure_ascii=False),
+        '/Producer': 'PDF Combiner Script'
+    }
+
+
+def _merge_pikepdf(parts: List[Tuple[str, Path]], output_file: Path,
+                   work_dir: Path) -> Tuple[List[str], List[str], int]:
+    """
+    Concatenate *parts* (``(name, pdf)`` pairs) into *output_file* with QPDF's native page copier.
+    Intermediate spill files go to *work_dir*.
+    Returns ``(processed_names, failed_names, total_pages)``.
+    """
+    processed: List[str] = []
+    failed: List[str] = []
+    out = pikepdf.Pdf.new()
+    # Copied pages read their stream data from the sources at save time, so they stay open
+    # until the next spill; at most MERGE_OPEN_SOURCES descriptors are held at once
+    sources: List[pikepdf.Pdf] = []
+    try:
+        for name, pdf_path in parts:
+            if len(sources) >= MERGE_OPEN_SOURCES:
+                out = _spill_pikepdf(out, sources, work_dir)
+            try:
+                src = pikepdf.open(pdf_path)
+            except Exception as e:
+                logging.error("Failed to process %s: %s", name, e)
+                failed.append(name)
+                continue
+            sources.append(src)
+            try:
+                out.pages.extend(src.pages)
+                processed.append(name)
+                logging.debug("Appended %s", name)
+            except Exception as e:
+                logging.error("Failed to process %s: %s", name, e)
+                failed.append(name)
+        
+        # Add metadata about source files
+        for key, value in _combined_metadata(processed).items():
+            out.docinfo[key] = value
+        out.save(output_file, linearize=False)
+        return processed, failed, len(out.pages)
+    finally:
+        for src in sources:
+            src.close()
+        _close_spill(out, work_dir)
+
+
+def _close_spill(pdf: pikepdf.Pdf, work_dir: Path) -> None:
+    """Close *pdf* and delete it if it is a spill file in *work_dir*."""
+    spill = Path(pdf.filename)
+    pdf.close()
+    if spill.parent == work_dir:
+        spill.unlink()
+
+
+def _spill_pikepdf(out: pikepdf.Pdf, sources: List[pikepdf.Pdf], work_dir: Path) -> pikepdf.Pdf:
+    """
+    Save the pages merged so far to a file in *work_dir*, close *sources* and return the
+    reopened merge so it no longer references them.
+    """
+    fd, name = tempfile.mkstemp(suffix=".pdf", dir=work_dir)
+    os.close(fd)
+    out.save(name, linearize=False)
+    # The previous spill is fully copied into the new one
+    _close_spill(out, work_dir)
+    for src in sources:
+        src.close()
+    sources.clear()
+    return pikepdf.open(name)
+
+
+def _merge_pypdf2(parts: List[Tuple[str, Path]], output_file: Path) -> Tuple[List[str], List[str], int]:
+    """
+    Concatenate *parts* (``(name, pdf)`` pairs) into *output_file* with PyPDF2.
+    Returns ``(processed_names, failed_names, total_pages)``.
+    """
+    processed: List[str] = []
+    failed: List[str] = []
+    writer = PdfWriter()
+    for name, pdf_path in parts:
+        try:
+            # Copy pages one reader at a time so each source can be released
+            reader = PdfReader(str(pdf_path), strict=False)
+            for page in reader.pages:
+                writer.add_page(page)
+            del reader
+            processed.append(name)
+            logging.debug("Appended %s", name)
+        except Exception as e:
+            logging.error("Failed to process %s: %s", name, e)
+            failed.append(name)
+    
+    # Add metadata about source files
+    writer.add_metadata(_combined_metadata(processed))
+    
+    # Stream through a large buffer, then drop the writer (and the source object
+    # trees it references) before the temp PDFs are removed
+    total_pages = len(writer.pages)
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        writer.write(f)
+    del writer
+    gc.collect()
+    return processed, failed, total_pages
+
+
+def merge_documents(directory: Path, output_file: Path, parallel_files: int | None = None,
+                    ocr_jobs: int | None = None, pdfa: bool = False) -> None:
+    """
+    Combine every document in *directory* (after conversion/OCR if required) into *output_file*.
+    *parallel_files*, *ocr_jobs* and *pdfa* are passed through to the OCR stage.
+    """
     logging.info("Processing documents from %s ...", directory)
     
-    # Count expected files
-    expected_count = count_expected_files(directory)
+    documents = list(iter_documents(directory))
+    expected_count = len(documents)
     logging.info("Found %d supported files to process", expected_count)
     
-    merger = PdfMerger()
-    processed_files = []
-    failed_files = []
-    
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp = Path(tmpdir)
         
-        for doc in iter_documents(directory):
-            try:
-                if doc.suffix.lower() in ['.doc', '.docx']:
-                    # Convert DOC/DOCX to PDF first
-                    pdf_path = convert_doc_to_pdf(doc, tmp)
-                else:
-                    pdf_path = doc
-                
-                # Run OCR if necessary; returns either original or OCR'd copy
-                ready_pdf = ocr_pdf(pdf_path, tmp)
-                merger.append(str(ready_pdf))
-                processed_files.append(doc.name)
-                logging.debug("Appended %s", doc.name)
-                
-            except Exception as e:
-                logging.error("Failed to process %s: %s", doc.name, e)
-                failed_files.append(doc.name)
-        
-        # Add metadata about source files
-        merger.add_metadata({
-            '/Subject': f'Combined from: {", ".join(processed_files)}',
-            '/Producer': 'PDF Combiner Script'
-        })
+        # Conversion and OCR are subprocess-bound, so run them in parallel
+        ready, failed_files = _prepare_all(documents, tmp, parallel_files, ocr_jobs, pdfa)
         
-        merger.write(str(output_file))
-        merger.close()
+        # Merge serially in the original alphabetical order
+        parts = [(doc.name, ready[i]) for i, (doc, _) in enumerate(documents) if i in ready]
+        if pikepdf is not None:
+            processed_files, merge_failed, total_pages = _merge_pikepdf(parts, output_file, tmp)
+        else:
+            processed_files, merge_failed, total_pages = _merge_pypdf2(parts, output_file)
+        failed_files += merge_failed
     
     # Final report
     processed_count = len(processed_files)
@@ -280,13 +888,8 @@ def merge_documents(directory: Path, output_file: Path) -> None:
         if failed_files:
             logging.warning("Failed to process: %s", ", ".join(failed_files))
     
-    try:
-        total_pages = len(PdfReader(str(output_file)).pages)
-        logging.info("✓ Combined PDF written to %s (%d pages from %d documents)",
-                     output_file, total_pages, processed_count)
-    except:
-        logging.info("✓ Combined PDF written to %s (from %d documents)",
-                     output_file, processed_count)
+    logging.info("✓ Combined PDF written to %s (%d pages from %d documents)",
+                 output_file, total_pages, processed_count)
 
 
 def verify_combined_pdf(pdf_path: Path, source_dir: Path) -> None:
@@ -294,7 +897,7 @@ def verify_combined_pdf(pdf_path: Path, source_dir: Path) -> None:
     logging.info("Verifying %s against directory %s", pdf_path, source_dir)
     
     # Get expected files from directory
-    expected_files = set(doc.name for doc in iter_documents(source_dir))
+    expected_files = set(doc.name for doc, _ in iter_documents(source_dir))
     expected_count = len(expected_files)
     
     # Try to get source files from PDF metadata
@@ -322,8 +925,8 @@ def verify_combined_pdf(pdf_path: Path, source_dir: Path) -> None:
         
     # Also report PDF info
     try:
-        reader = PdfReader(str(pdf_path))
-        logging.info("PDF has %d pages", len(reader.pages))
+        with open(pdf_path, "rb") as fh:
+            logging.info("PDF has %d pages", len(PdfReader(fh, strict=False).pages))
     except Exception as e:
         logging.error("Could not read PDF: %s", e)
 
@@ -380,6 +983,23 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
             action="store_true",
             help="Only verify documents exist, are readable, and report requirements.",
         )
+        parser.add_argument(
+            "--parallel-files",
+            type=int,
+            default=None,
+            help="Number of documents to convert/OCR at once (default: CPU count).",
+        )
+        parser.add_argument(
+            "--ocr-jobs",
+            type=int,
+            default=None,
+            help="Threads per ocrmypdf run (default: CPU count / parallel files).",
+        )
+        parser.add_argument(
+            "--pdfa",
+            action="store_true",
+            help="Have ocrmypdf produce PDF/A output instead of plain PDF.",
+        )
         parser.add_argument(
             "--verbose",
             action="store_true",
@@ -403,10 +1023,10 @@ def main(argv: list[str] | None = None) -> None:
     )
 
     # Check for required tools
-    if not shutil.which("ocrmypdf"):
+    if not shutil.which(OCRMYPDF_BIN):
         logging.warning("ocrmypdf was not found on PATH – OCR will fail if needed.")
     
-    if platform.system() == "Linux" and not shutil.which("libreoffice"):
+    if platform.system() == "Linux" and not shutil.which(SOFFICE_BIN):
         logging.warning("libreoffice was not found on PATH – DOC/DOCX conversion will fail.")
 
     # Handle verify mode
@@ -421,7 +1041,8 @@ def main(argv: list[str] | None = None) -> None:
 
     # Default merge mode
     try:
-        merge_documents(args.source_dir, args.output)
+        merge_documents(args.source_dir, args.output,
+                        args.parallel_files, args.ocr_jobs, args.pdfa)
     except Exception:
         logging.exception("Failed to create combined PDF.")
         sys.exit(1)
@@ -19,12 +19,21 @@ Features:
 
 from __future__ import annotations
 
+import atexit
 import concurrent.futures
+import copy
 import fnmatch
+import functools
+import itertools
+import json
 import logging
+import multiprocessing
 import os
 import platform
+import queue
+import re
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
@@ -32,13 +41,13 @@ import time
 import yaml
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union
 
 import click
 from tqdm import tqdm
 
 try:
-    from PyPDF2 import PdfReader, PdfWriter, PdfMerger
+    from PyPDF2 import PdfReader, PdfWriter
     from PyPDF2.errors import PdfReadError
     from PyPDF2.generic import Bookmark
 except ImportError:
@@ -51,6 +60,16 @@ except ImportError:
     click.echo("python-docx is required. Install with: pip install python-docx", err=True)
     sys.exit(1)
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None  # Merge with PyPDF2 instead
+
+try:
+    import ocrmypdf
+except ImportError:
+    ocrmypdf = None  # Fall back to the ocrmypdf command line tool
+
 if platform.system() in ["Windows", "Darwin"]:
     try:
         from docx2pdf import convert as docx2pdf_convert
@@ -63,6 +82,24 @@ if platform.system() in ["Windows", "Darwin"]:
 # Configuration and Data Classes                                              #
 # -----------------------------------------------------------------------------#
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config file; *mtime_ns* is part of the cache key so edits are picked up."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def _compile_globs(patterns: List[str]) -> re.Pattern:
+    """Compile case-insensitive glob *patterns* into one regex ("a^" never matches)."""
+    if not patterns:
+        return re.compile("a^")
+    return re.compile("|".join(fnmatch.translate(p.lower()) for p in patterns))
+
+
 @dataclass
 class ProcessingConfig:
     """Configuration for PDF processing."""
@@ -78,20 +115,31 @@ class ProcessingConfig:
     preserve_metadata: bool = True
     log_file: Optional[str] = None
     
+    def __post_init__(self):
+        self.compile_patterns()
+    
+    def compile_patterns(self) -> None:
+        """Build the include/exclude matchers; call again after changing either pattern list."""
+        self._include_re = _compile_globs(self.include_patterns)
+        self._exclude_re = _compile_globs(self.exclude_patterns)
+        # The default patterns reduce to an extension check
+        self._use_default_fast_path = (
+            self.include_patterns == ["*.pdf", "*.doc", "*.docx"] and not self.exclude_patterns
+        )
+    
     @classmethod
     def from_file(cls, config_path: Path) -> 'ProcessingConfig':
         """Load configuration from YAML file."""
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f) or {}
-            return cls(**data)
+            data = _load_yaml_cached(str(config_path), os.stat(config_path).st_mtime_ns)
+            return cls(**copy.deepcopy(data))
         except Exception as e:
             logging.warning(f"Could not load config from {config_path}: {e}")
             return cls()
     
     def to_file(self, config_path: Path) -> None:
         """Save configuration to YAML file."""
-        data = {k: v for k, v in self.__dict__.items() if v is not None}
+        data = {k: v for k, v in self.__dict__.items() if v is not None and not k.startswith('_')}
         with open(config_path, 'w') as f:
             yaml.dump(data, f, default_flow_style=False, indent=2)
 
@@ -114,6 +162,37 @@ class ProcessingResult:
 
 SUPPORTED_EXTENSIONS = {".pdf", ".doc", ".docx"}
 
+# Source list written to /Subject by merge_documents
+_COMBINED_RE = re.compile(r'Combined from:\s*(.*)', re.DOTALL)
+# Marker _subject_summary appends when the list doesn't fit in /Subject
+_TRUNCATED_RE = re.compile(r'\s\(\+\d+ more\)$')
+
+# Where the persistent LibreOffice started by EnhancedPDFProcessor accepts UNO connections;
+# the port is picked free per run
+UNO_HOST = "127.0.0.1"
+
+# Sources held open while merging with pikepdf before the merge is spilled to disk
+MERGE_OPEN_SOURCES = 64
+
+# Tj/TJ operators, or a string followed by the ' or " operators
+TEXT_OPERATOR_RE = re.compile(rb"(?<![A-Za-z/])T[jJ](?![A-Za-z])|[)>]\s*['\"]")
+
+
+
+def _spill_merge(pdf: pikepdf.Pdf, sources: List[pikepdf.Pdf], temp_dir: Path) -> pikepdf.Pdf:
+    """Save a partial merge to *temp_dir*, close its *sources* and return it reopened."""
+    fd, spill = tempfile.mkstemp(suffix=".pdf", dir=temp_dir)
+    os.close(fd)
+    pdf.save(spill)
+    previous = Path(pdf.filename)
+    pdf.close()
+    for src in sources:
+        src.close()
+    sources.clear()
+    # An earlier spill is fully copied into the new one
+    if previous.parent == temp_dir:
+        previous.unlink()
+    return pikepdf.open(spill)
 
 def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None:
     """Setup enhanced logging configuration."""
@@ -132,48 +211,49 @@ def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None
     )
 
 
-def matches_patterns(file_path: Path, include_patterns: List[str], exclude_patterns: List[str]) -> bool:
+def matches_patterns(file_path: Path, config: ProcessingConfig) -> bool:
     """Check if file matches include patterns and doesn't match exclude patterns."""
+    if config._use_default_fast_path:
+        return file_path.suffix.lower() in SUPPORTED_EXTENSIONS
     filename = file_path.name.lower()
-    
-    # Check exclude patterns first
-    for pattern in exclude_patterns:
-        if fnmatch.fnmatch(filename, pattern.lower()):
-            return False
-    
-    # Check include patterns
-    for pattern in include_patterns:
-        if fnmatch.fnmatch(filename, pattern.lower()):
-            return True
-    
-    return False
+    return not config._exclude_re.match(filename) and bool(config._include_re.match(filename))
 
 
-def get_file_sort_key(file_path: Path, sort_order: str):
-    """Get sort key for file based on sort order."""
+def get_file_sort_key(file_path: Path, sort_order: str, st: Optional[os.stat_result] = None):
+    """Get sort key for file based on sort order; *st* avoids re-statting the file."""
     if sort_order == "name":
         return file_path.name.lower()
     elif sort_order == "date":
-        return file_path.stat().st_mtime
+        return (st or file_path.stat()).st_mtime
     elif sort_order == "size":
-        return file_path.stat().st_size
+        return (st or file_path.stat()).st_size
     else:
         return file_path.name.lower()
 
 
-def iter_documents(directory: Path, config: ProcessingConfig) -> Iterator[Path]:
-    """Yield filtered and sorted document files from directory."""
+def iter_documents(directory: Path, config: ProcessingConfig) -> List[Path]:
+    """Return filtered and sorted document files from directory."""
     if not directory.is_dir():
         raise NotADirectoryError(f"{directory} is not a directory")
     
-    # Get all matching files
-    files = []
-    for file_path in directory.iterdir():
-        if file_path.is_file() and matches_patterns(file_path, config.include_patterns, config.exclude_patterns):
-            files.append(file_path)
+    # Get all matching files; DirEntry.stat() is cached, so date/size sorting stats each file once
+    keyed = []
+    use_custom = config.sort_order == "custom" and config.custom_order_file
+    sort_order = "name" if use_custom else config.sort_order
+    with os.scandir(directory) as it:
+        for entry in it:
+            file_path = Path(entry.path)
+            # Nothing outside SUPPORTED_EXTENSIONS can be converted or merged anyway
+            if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            # Symlinked documents are merged like regular files, as Path.is_file() did
+            if entry.is_file() and matches_patterns(file_path, config):
+                st = entry.stat() if sort_order in ("date", "size") else None
+                keyed.append((get_file_sort_key(file_path, sort_order, st), file_path))
     
     # Custom ordering from file
-    if config.sort_order == "custom" and config.custom_order_file:
+    if use_custom:
+        files = [file_path for _, file_path in keyed]
         try:
             with open(config.custom_order_file, 'r') as f:
                 custom_order = [line.strip() for line in f if line.strip()]
@@ -182,16 +262,21 @@ def iter_documents(directory: Path, config: ProcessingConfig) -> Iterator[Path]:
         except Exception as e:
             logging.warning(f"Could not use custom order file: {e}, falling back to name sort")
             files.sort(key=lambda f: get_file_sort_key(f, "name"))
-    else:
-        # Standard sorting
-        reverse = config.sort_order == "date"  # Newest first for date
-        files.sort(key=lambda f: get_file_sort_key(f, config.sort_order), reverse=reverse)
+        return files
     
-    yield from files
+    # Standard sorting
+    reverse = config.sort_order == "date"  # Newest first for date
+    keyed.sort(key=lambda item: item[0], reverse=reverse)
+    return [file_path for _, file_path in keyed]
 
 
-def convert_doc_to_pdf_enhanced(doc_path: Path, output_dir: Path, progress_callback=None) -> Path:
-    """Enhanced DOC/DOCX to PDF conversion with progress tracking."""
+def convert_doc_to_pdf_enhanced(doc_path: Path, output_dir: Path, progress_callback=None,
+                                uno_port: Optional[int] = None) -> Path:
+    """
+    Enhanced DOC/DOCX to PDF conversion with progress tracking.
+    
+    With *uno_port* the document is sent to an already running LibreOffice via unoconv.
+    """
     pdf_path = output_dir / f"{doc_path.stem}.pdf"
     
     try:
@@ -201,6 +286,10 @@ def convert_doc_to_pdf_enhanced(doc_path: Path, output_dir: Path, progress_callb
         if platform.system() in ["Windows", "Darwin"]:
             # Use docx2pdf on Windows/macOS
             docx2pdf_convert(str(doc_path), str(pdf_path))
+        elif uno_port:
+            # Reuse the persistent LibreOffice instead of starting a new one
+            cmd = ["unoconv", "-p", str(uno_port), "-f", "pdf", "-o", str(output_dir), str(doc_path)]
+            subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=120)
         else:
             # Use LibreOffice on Linux
             cmd = [
@@ -223,19 +312,128 @@ def convert_doc_to_pdf_enhanced(doc_path: Path, output_dir: Path, progress_callb
         raise RuntimeError(f"Conversion failed for {doc_path.name}: {e}")
 
 
+def _batch_convert_docs(docs: List[Path], temp_dir: Path, uno_port: Optional[int] = None) -> Dict[Path, Path]:
+    """
+    Convert DOC/DOCX files to PDF with a single LibreOffice invocation, or a single
+    unoconv call against the LibreOffice listening on *uno_port*.
+
+    Returns a mapping of source document to converted PDF for every file that
+    produced output.  Documents missing from the result (including files whose
+    stem clashes with another input) should be retried individually.
+    """
+    stems: Dict[str, List[Path]] = {}
+    for doc in docs:
+        stems.setdefault(doc.stem, []).append(doc)
+    batch = [group[0] for group in stems.values() if len(group) == 1]
+    if not batch or platform.system() in ["Windows", "Darwin"]:
+        return {}
+
+    if uno_port:
+        cmd = ["unoconv", "-p", str(uno_port), "-f", "pdf", "-o", str(temp_dir), *map(str, batch)]
+    else:
+        cmd = [
+            "libreoffice",
+            "--headless",
+            "--convert-to", "pdf",
+            "--outdir", str(temp_dir),
+            *map(str, batch)
+        ]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=120 + 30 * len(batch))
+    except Exception as e:
+        logging.warning(f"Batch conversion of {len(batch)} documents failed: {e}")
+
+    converted = {}
+    for doc in batch:
+        pdf_path = temp_dir / f"{doc.stem}.pdf"
+        if pdf_path.exists():
+            converted[doc] = pdf_path
+    return converted
+
+
+# Per-user cache directory, shared with combine_pdfs.py
+_text_cache_path = Path.home() / ".cache" / "pdf_combiner" / "text_cache.json"
+
+
+def _load_text_cache() -> Dict[str, bool]:
+    """Load persisted text-detection results; a missing or corrupt cache starts empty."""
+    try:
+        with open(_text_cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+_text_cache = _load_text_cache()
+_text_cache_size = len(_text_cache)
+
+
+@atexit.register
+def _save_text_cache() -> None:
+    """Persist new text-detection results so the next run (e.g. --check then combine) reuses them."""
+    if len(_text_cache) == _text_cache_size:
+        return
+    try:
+        _text_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _text_cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(_text_cache, f)
+        os.replace(tmp_path, _text_cache_path)
+    except OSError as e:
+        logging.debug(f"Could not save text cache: {e}")
+
+
+def _text_cache_key(path: Path, sample_pages: int = 3) -> Optional[str]:
+    """Cache key for *path*'s text-detection result, or None if it cannot be statted."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}:{sample_pages}"
+
+
+def _store_text_result(path: Path, has_text: bool) -> None:
+    """Record a result computed in a pool worker, whose own cache is never saved."""
+    key = _text_cache_key(path)
+    if key is not None:
+        _text_cache[key] = has_text
+
+
 def pdf_has_text_enhanced(path: Path, sample_pages: int = 3) -> bool:
-    """Enhanced text detection with better error handling."""
+    """
+    Enhanced text detection with better error handling.
+    
+    Results are cached on disk keyed by the file's path, mtime and size.
+    """
+    key = _text_cache_key(path, sample_pages)
+    if key is None:
+        return _pdf_has_text(path, sample_pages)
+    
+    if key not in _text_cache:
+        _text_cache[key] = _pdf_has_text(path, sample_pages)
+    return _text_cache[key]
+
+
+def _pdf_has_text(path: Path, sample_pages: int) -> bool:
+    """Uncached text detection for pdf_has_text_enhanced."""
     try:
         reader = PdfReader(str(path))
         page_count = min(len(reader.pages), sample_pages)
         
         for i in range(page_count):
             try:
+                # A text-showing operator in the raw content stream is enough; this
+                # skips PyPDF2's layout reconstruction in extract_text().  Pages without
+                # one may still draw text through a Form XObject, so fall through.
+                contents = reader.pages[i].get_contents()
+                if contents is not None and TEXT_OPERATOR_RE.search(contents.get_data()):
+                    return True
                 text = reader.pages[i].extract_text()
                 if text and text.strip():
                     return True
             except Exception as e:
-                logging.debug(f"Error reading page {i} of {path.name}: {e}")
+                logging.debug("Error reading page %d of %s: %s", i, path.name, e)
                 continue
                 
     except Exception as e:
@@ -245,9 +443,13 @@ def pdf_has_text_enhanced(path: Path, sample_pages: int = 3) -> bool:
     return False
 
 
-def ocr_pdf_enhanced(source: Path, dest_dir: Path, progress_callback=None) -> Path:
-    """Enhanced OCR processing with progress tracking."""
-    if pdf_has_text_enhanced(source):
+def ocr_pdf_enhanced(source: Path, dest_dir: Path, progress_callback=None, check_text: bool = True) -> Path:
+    """
+    Enhanced OCR processing with progress tracking.
+    
+    Pass ``check_text=False`` when *source* is already known to lack a text layer.
+    """
+    if check_text and pdf_has_text_enhanced(source):
         logging.debug(f"Text already present in {source.name}; skipping OCR.")
         return source
 
@@ -256,6 +458,18 @@ def ocr_pdf_enhanced(source: Path, dest_dir: Path, progress_callback=None) -> Pa
     if progress_callback:
         progress_callback(f"OCR processing {source.name}")
 
+    if ocrmypdf is not None:
+        # In-process API: each worker imports ocrmypdf once and reuses it for every file
+        try:
+            ocrmypdf.ocr(str(source), str(dest), skip_text=True, optimize=1,
+                         progress_bar=False, jobs=1)
+            return dest
+        except ocrmypdf.exceptions.PriorOcrFoundError:
+            return source
+        except Exception as e:
+            logging.error(f"OCR failed for {source.name}: {e}")
+            return source  # Return original if OCR fails
+
     cmd = [
         "ocrmypdf",
         "--skip-text",
@@ -280,91 +494,244 @@ def ocr_pdf_enhanced(source: Path, dest_dir: Path, progress_callback=None) -> Pa
 # Enhanced Core Processing                                                     #
 # -----------------------------------------------------------------------------#
 
+def _subject_summary(names: List[str], limit: int = 1024) -> str:
+    """Build the /Subject "Combined from:" list, truncated to about *limit* characters."""
+    subject = "Combined from: "
+    for i, name in enumerate(names):
+        entry = name if i == 0 else f", {name}"
+        if len(subject) + len(entry) > limit:
+            return subject + f" (+{len(names) - i} more)"
+        subject += entry
+    return subject
+
+
+def manifest_path(pdf_path: Path) -> Path:
+    """Sidecar file listing the source documents of a combined PDF."""
+    return pdf_path.with_suffix('.manifest')
+
+
+def write_manifest(pdf_path: Path, names: List[str]) -> None:
+    """Write one source filename per line next to *pdf_path*."""
+    try:
+        manifest_path(pdf_path).write_text("".join(f"{name}\n" for name in names), encoding='utf-8')
+    except OSError as e:
+        logging.warning(f"Could not write manifest for {pdf_path}: {e}")
+
+
+# Progress messages from pool workers; set in each worker by _init_worker
+_progress_queue = None
+
+
+def _init_worker(progress_queue) -> None:
+    """Pool initializer: route worker progress messages to the parent's queue."""
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _push_progress(msg: str) -> None:
+    """Shared progress callback for conversion/OCR; a no-op outside pool workers."""
+    if _progress_queue is not None:
+        _progress_queue.put(msg)
+
+
+def _drain_progress(progress_queue) -> None:
+    """Print queued worker messages without disturbing the progress bar."""
+    while True:
+        try:
+            msg = progress_queue.get_nowait()
+        except queue.Empty:
+            return
+        tqdm.write(f"  {msg}")
+
+
+def process_single_document(doc_path: Path, temp_dir: Path, config: ProcessingConfig,
+                            converted: Optional[Path] = None,
+                            uno_port: Optional[int] = None,
+                            needs_ocr: Optional[bool] = None) -> Optional[Path]:
+    """
+    Process a single document (convert if needed, OCR if needed).
+    
+    Runs in a worker process, so failures are reported by returning None.
+    *converted* is the PDF already produced for a DOC/DOCX by a batch conversion;
+    *uno_port* points other conversions at the processor's LibreOffice server.
+    *needs_ocr* is the result of a text pre-scan; None means scan here.
+    """
+    try:
+        # Convert if needed
+        if converted is not None:
+            pdf_path = converted
+        elif doc_path.suffix.lower() in ['.doc', '.docx']:
+            pdf_path = convert_doc_to_pdf_enhanced(doc_path, temp_dir, _push_progress, uno_port=uno_port)
+        else:
+            pdf_path = doc_path
+        
+        # OCR if needed and enabled
+        if config.ocr_enabled and needs_ocr is not False:
+            pdf_path = ocr_pdf_enhanced(pdf_path, temp_dir, _push_progress, check_text=needs_ocr is None)
+        
+        return pdf_path
+        
+    except Exception as e:
+        logging.error(f"Failed to process {doc_path.name}: {e}")
+        return None
+
+
 class EnhancedPDFProcessor:
     """Enhanced PDF processor with parallel processing and advanced features."""
     
     def __init__(self, config: ProcessingConfig):
         self.config = config
         self.result = ProcessingResult()
+        self._uno_server: Optional[subprocess.Popen] = None
+        self._uno_port: Optional[int] = None
+        self._uno_profile: Optional[tempfile.TemporaryDirectory] = None
+        self._uno_ready = False
         
-    def process_single_document(self, doc_path: Path, temp_dir: Path) -> Optional[Path]:
-        """Process a single document (convert if needed, OCR if needed)."""
+    def __enter__(self) -> 'EnhancedPDFProcessor':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def uno_port(self) -> Optional[int]:
+        """
+        Start (once) a headless LibreOffice accepting UNO connections and return its port.
+        
+        The server lives until close(), so every conversion after the first skips
+        LibreOffice's start-up.  Returns None when soffice/unoconv are unavailable
+        or the server does not come up, and callers fall back to one-shot runs.
+        """
+        if self._uno_server is not None:
+            return self._uno_port if self._uno_ready and self._uno_server.poll() is None else None
+        if platform.system() != "Linux" or not (shutil.which("soffice") and shutil.which("unoconv")):
+            return None
+        
+        # Let the OS pick a free port so the readiness probe can't reach another
+        # LibreOffice and concurrent runs don't collide
+        with socket.socket() as sock:
+            sock.bind((UNO_HOST, 0))
+            self._uno_port = sock.getsockname()[1]
+        # A private profile keeps the server from locking the user's default one
+        self._uno_profile = tempfile.TemporaryDirectory(prefix="pdf_combiner_uno_")
         try:
-            # Convert if needed
-            if doc_path.suffix.lower() in ['.doc', '.docx']:
-                pdf_path = convert_doc_to_pdf_enhanced(
-                    doc_path, temp_dir, 
-                    lambda msg: tqdm.write(f"  {msg}")
-                )
-            else:
-                pdf_path = doc_path
-            
-            # OCR if needed and enabled
-            if self.config.ocr_enabled:
-                pdf_path = ocr_pdf_enhanced(
-                    pdf_path, temp_dir,
-                    lambda msg: tqdm.write(f"  {msg}")
-                )
-            
-            return pdf_path
-            
-        except Exception as e:
-            logging.error(f"Failed to process {doc_path.name}: {e}")
-            self.result.failed_files.append(doc_path.name)
-            self.result.failed_documents += 1
+            self._uno_server = subprocess.Popen(
+                [
+                    "soffice", "--headless", "--nologo", "--nofirststartwizard", "--norestore",
+                    f"-env:UserInstallation={Path(self._uno_profile.name).as_uri()}",
+                    f"--accept=socket,host={UNO_HOST},port={self._uno_port};urp;StarOffice.ServiceManager",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logging.warning(f"Could not start LibreOffice UNO server ({e}) - converting with one-shot LibreOffice runs")
             return None
-    
-    def create_bookmarks(self, merger: PdfMerger, processed_files: List[tuple]) -> None:
-        """Add bookmarks to the merged PDF."""
-        if not self.config.add_bookmarks:
-            return
-            
-        current_page = 0
-        for original_name, pdf_path in processed_files:
+        deadline = time.monotonic() + 30
+        while self._uno_server.poll() is None and time.monotonic() < deadline:
             try:
-                reader = PdfReader(str(pdf_path))
-                page_count = len(reader.pages)
-                
-                # Add bookmark for this document
-                bookmark_title = Path(original_name).stem
-                merger.add_outline_item(bookmark_title, current_page)
-                
-                current_page += page_count
-                
-            except Exception as e:
-                logging.warning(f"Could not add bookmark for {original_name}: {e}")
+                socket.create_connection((UNO_HOST, self._uno_port), timeout=1).close()
+                self._uno_ready = True
+                break
+            except OSError:
+                time.sleep(0.2)
+        
+        if not self._uno_ready:
+            logging.warning("LibreOffice UNO server did not start - converting with one-shot LibreOffice runs")
+            return None
+        logging.debug(f"LibreOffice UNO server listening on {UNO_HOST}:{self._uno_port}")
+        return self._uno_port
     
-    def apply_security(self, output_path: Path) -> None:
-        """Apply password protection to the output PDF."""
+    def close(self) -> None:
+        """Shut down the LibreOffice UNO server, if one was started."""
+        server = getattr(self, "_uno_server", None)
+        if server is not None and server.poll() is None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        profile = getattr(self, "_uno_profile", None)
+        if profile is not None:
+            profile.cleanup()
+            self._uno_profile = None
+        
+    def apply_security(self, writer: PdfWriter) -> None:
+        """Encrypt the merged PDF with the configured password before it is written."""
         if not self.config.password:
             return
             
         try:
-            # Read the PDF
-            reader = PdfReader(str(output_path))
-            writer = PdfWriter()
-            
-            # Copy all pages
-            for page in reader.pages:
-                writer.add_page(page)
-            
-            # Copy metadata
-            if reader.metadata and self.config.preserve_metadata:
-                writer.add_metadata(reader.metadata)
-            
-            # Encrypt with password
             writer.encrypt(self.config.password)
-            
-            # Write back to file
-            with open(output_path, 'wb') as f:
-                writer.write(f)
-                
             logging.info("Password protection applied to output PDF")
             
         except Exception as e:
             logging.error(f"Failed to apply password protection: {e}")
             self.result.warnings.append(f"Password protection failed: {e}")
     
+    def merged_metadata(self, processed_files: List[tuple]) -> Dict[str, str]:
+        """Document info for the combined PDF."""
+        return {
+            '/Title': f'Combined Document - {len(processed_files)} files',
+            '/Subject': _subject_summary([pf[0] for pf in processed_files]),
+            '/Producer': 'Enhanced PDF Combiner',
+            '/Creator': 'Enhanced PDF Combiner'
+        }
+    
+    def _merge_pypdf2(self, processed_files: List[tuple], output_file: Path) -> int:
+        """Merge with PyPDF2's PdfWriter; returns the page count."""
+        writer = PdfWriter()
+        
+        # Append each PDF, bookmarking its first page
+        for original_name, pdf_path in processed_files:
+            bookmark_title = Path(original_name).stem if self.config.add_bookmarks else None
+            writer.append(str(pdf_path), outline_item=bookmark_title)
+        
+        writer.add_metadata(self.merged_metadata(processed_files))
+        
+        # Apply security if configured, then write the merged PDF once
+        self.apply_security(writer)
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            writer.write(f)
+        return len(writer.pages)
+    
+    def _merge_pikepdf(self, processed_files: List[tuple], output_file: Path, temp_dir: Path) -> int:
+        """Merge with pikepdf (QPDF); returns the page count."""
+        pdf = pikepdf.Pdf.new()
+        bookmarks = []
+        # Copied pages read their data from the sources at save time, so they stay open
+        # until the merge is spilled to temp_dir every MERGE_OPEN_SOURCES files
+        sources: List[pikepdf.Pdf] = []
+        try:
+            for original_name, pdf_path in processed_files:
+                if len(sources) >= MERGE_OPEN_SOURCES:
+                    pdf = _spill_merge(pdf, sources, temp_dir)
+                src = pikepdf.open(pdf_path)
+                sources.append(src)
+                bookmarks.append((Path(original_name).stem, len(pdf.pages)))
+                pdf.pages.extend(src.pages)
+            
+            if self.config.add_bookmarks:
+                with pdf.open_outline() as outline:
+                    for title, page_index in bookmarks:
+                        outline.root.append(pikepdf.OutlineItem(title, page_index))
+            
+            for key, value in self.merged_metadata(processed_files).items():
+                pdf.docinfo[key] = value
+            
+            encryption = False
+            if self.config.password:
+                encryption = pikepdf.Encryption(owner=self.config.password, user=self.config.password)
+                logging.info("Password protection applied to output PDF")
+            pdf.save(output_file, encryption=encryption)
+            return len(pdf.pages)
+        finally:
+            for src in sources:
+                src.close()
+            pdf.close()
+    
     def merge_documents(self, directory: Path, output_file: Path) -> ProcessingResult:
         """Enhanced document merging with all advanced features."""
         start_time = time.time()
@@ -385,68 +752,69 @@ class EnhancedPDFProcessor:
             with tempfile.TemporaryDirectory() as tmpdir:
                 temp_dir = Path(tmpdir)
                 
-                # Process documents in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                    # Submit all tasks
-                    future_to_doc = {
-                        executor.submit(self.process_single_document, doc, temp_dir): doc
-                        for doc in documents
-                    }
+                # Text detection is Python-bound, so use processes
+                progress_queue = multiprocessing.Queue()
+                with concurrent.futures.ProcessPoolExecutor(max_workers=self.config.max_workers,
+                                                            initializer=_init_worker,
+                                                            initargs=(progress_queue,)) as executor:
+                    # Scan PDFs for text in the workers while the parent converts DOC/DOCX files
+                    pdfs = [doc for doc in documents if doc.suffix.lower() == '.pdf']
+                    text_scan = executor.map(pdf_has_text_enhanced, pdfs) if self.config.ocr_enabled else []
+                    
+                    # Convert all DOC/DOCX files in one LibreOffice run; failures are retried per file
+                    office_docs = [doc for doc in documents if doc.suffix.lower() in ['.doc', '.docx']]
+                    converted = {}
+                    uno_port = self.uno_port() if office_docs else None
+                    if office_docs:
+                        pbar.set_description("Converting documents")
+                        converted = _batch_convert_docs(office_docs, temp_dir, uno_port)
+                        pbar.set_description("Processing documents")
+                    
+                    needs_ocr = set()
+                    for doc, has_text in zip(pdfs, text_scan):
+                        _store_text_result(doc, has_text)
+                        if not has_text:
+                            needs_ocr.add(doc)
                     
-                    # Collect results as they complete
-                    for future in concurrent.futures.as_completed(future_to_doc):
-                        doc = future_to_doc[future]
-                        try:
-                            result_path = future.result()
-                            if result_path:
-                                processed_files.append((doc.name, result_path))
-                                self.result.processed_documents += 1
-                            
-                        except Exception as e:
-                            logging.error(f"Processing failed for {doc.name}: {e}")
+                    # Converted DOC/DOCX output was not pre-scanned (it may be a scanned
+                    # image), so None leaves the text check to ocr_pdf_enhanced
+                    ocr_flags = [doc in needs_ocr if doc.suffix.lower() == '.pdf' else None
+                                 for doc in documents]
+                    
+                    # map() yields results in input order, so no re-sorting is needed
+                    results = executor.map(
+                        process_single_document,
+                        documents,
+                        itertools.repeat(temp_dir),
+                        itertools.repeat(self.config),
+                        [converted.get(doc) for doc in documents],
+                        itertools.repeat(uno_port),
+                        ocr_flags,
+                    )
+                    for doc, result_path in zip(documents, results):
+                        _drain_progress(progress_queue)
+                        if result_path:
+                            processed_files.append((doc.name, result_path))
+                            self.result.processed_documents += 1
+                        else:
                             self.result.failed_files.append(doc.name)
                             self.result.failed_documents += 1
                         
                         pbar.update(1)
+                _drain_progress(progress_queue)
                 
                 # Merge all processed PDFs
                 if processed_files:
                     pbar.set_description("Merging PDFs")
-                    merger = PdfMerger()
-                    
                     try:
-                        # Sort processed files to maintain order
-                        processed_files.sort(key=lambda x: [doc.name for doc in documents].index(x[0]))
-                        
-                        # Add each PDF to merger
-                        for original_name, pdf_path in processed_files:
-                            merger.append(str(pdf_path))
-                        
-                        # Add bookmarks
-                        self.create_bookmarks(merger, processed_files)
-                        
-                        # Add metadata
-                        merger.add_metadata({
-                            '/Title': f'Combined Document - {len(processed_files)} files',
-                            '/Subject': f'Combined from: {", ".join([pf[0] for pf in processed_files])}',
-                            '/Producer': 'Enhanced PDF Combiner',
-                            '/Creator': 'Enhanced PDF Combiner'
-                        })
-                        
-                        # Write the merged PDF
-                        merger.write(str(output_file))
-                        merger.close()
-                        
-                        # Apply security if configured
-                        self.apply_security(output_file)
+                        # pikepdf copies pages by reference in C++; PyPDF2 is the fallback
+                        if pikepdf is not None:
+                            self.result.total_pages = self._merge_pikepdf(processed_files, output_file, temp_dir)
+                        else:
+                            self.result.total_pages = self._merge_pypdf2(processed_files, output_file)
+                        write_manifest(output_file, [pf[0] for pf in processed_files])
                         
                         # Calculate final statistics
-                        try:
-                            final_reader = PdfReader(str(output_file))
-                            self.result.total_pages = len(final_reader.pages)
-                        except:
-                            self.result.total_pages = 0
-                        
                         self.result.output_size = output_file.stat().st_size
                         
                     except Exception as e:
@@ -483,7 +851,12 @@ def check_documents_enhanced(directory: Path, config: ProcessingConfig) -> None:
     stats = {"pdf": 0, "doc": 0, "docx": 0, "readable": 0, "unreadable": 0, "text_pdfs": 0, "image_pdfs": 0}
     unreadable_files = []
     
-    with tqdm(documents, desc="Checking documents", unit="file") as pbar:
+    # Text detection is Python-bound, so probe the PDFs in a process pool; one
+    # future per PDF keeps a failing probe from taking the later results with it
+    pdfs = [doc for doc in documents if doc.suffix.lower() == ".pdf"]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=config.max_workers) as executor, \
+            tqdm(documents, desc="Checking documents", unit="file") as pbar:
+        text_results = {doc: executor.submit(pdf_has_text_enhanced, doc) for doc in pdfs}
         for doc in pbar:
             pbar.set_postfix_str(doc.name[:30] + "..." if len(doc.name) > 30 else doc.name)
             
@@ -491,7 +864,8 @@ def check_documents_enhanced(directory: Path, config: ProcessingConfig) -> None:
             if ext == ".pdf":
                 stats["pdf"] += 1
                 try:
-                    has_text = pdf_has_text_enhanced(doc)
+                    has_text = text_results[doc].result()
+                    _store_text_result(doc, has_text)
                     if has_text:
                         stats["text_pdfs"] += 1
                         status = "searchable text"
@@ -499,11 +873,11 @@ def check_documents_enhanced(directory: Path, config: ProcessingConfig) -> None:
                         stats["image_pdfs"] += 1
                         status = "image-only / needs OCR"
                     
-                    logging.info(f"%-50s → %s", doc.name, status)
+                    logging.info("%-50s → %s", doc.name, status)
                     stats["readable"] += 1
                     
                 except Exception as e:
-                    logging.error(f"%-50s → ERROR: %s", doc.name, e)
+                    logging.error("%-50s → ERROR: %s", doc.name, e)
                     unreadable_files.append(doc.name)
                     stats["unreadable"] += 1
                     
@@ -513,7 +887,7 @@ def check_documents_enhanced(directory: Path, config: ProcessingConfig) -> None:
                 else:
                     stats["docx"] += 1
                     
-                logging.info(f"%-50s → %s", doc.name, "DOC/DOCX (will convert to PDF)")
+                logging.info("%-50s → %s", doc.name, "DOC/DOCX (will convert to PDF)")
                 stats["readable"] += 1
     
     # Summary report
@@ -556,15 +930,22 @@ def verify_combined_pdf_enhanced(pdf_path: Path, source_dir: Path, config: Proce
         reader = PdfReader(str(pdf_path))
         metadata = reader.metadata
         metadata_files = set()
+        truncated = False
         
-        if metadata:
+        # Prefer the manifest; the /Subject list is truncated and ambiguous for names with commas
+        manifest = manifest_path(pdf_path)
+        if manifest.exists():
+            metadata_files = set(manifest.read_text(encoding='utf-8').splitlines()) - {""}
+            logging.info(f"Using source file list from {manifest}")
+        elif metadata:
             for field in ['/Subject', '/Keywords', '/Producer']:
-                if field in metadata:
-                    value = str(metadata[field])
-                    if 'Combined from:' in value:
-                        files_str = value.replace('Combined from:', '').strip()
-                        metadata_files = set(f.strip() for f in files_str.split(',') if f.strip())
-                        break
+                match = _COMBINED_RE.match(str(metadata[field])) if field in metadata else None
+                if match:
+                    # A truncated list can't be compared, only the manifest has every name
+                    truncated = bool(_TRUNCATED_RE.search(match.group(1)))
+                    if not truncated:
+                        metadata_files = set(f.strip() for f in match.group(1).split(',') if f.strip())
+                    break
         
         # Analysis
         if metadata_files:
@@ -583,6 +964,9 @@ def verify_combined_pdf_enhanced(pdf_path: Path, source_dir: Path, config: Proce
                     logging.warning(f"⚠️  EXTRA FILES ({len(extra)}): These files are in the PDF but not in the directory:")
                     for f in sorted(extra):
                         logging.warning(f"  - {f}")
+        elif truncated:
+            logging.warning(f"Source file list in PDF metadata is truncated - cannot verify without "
+                            f"the manifest {manifest}")
         else:
             logging.warning("No source file metadata found in PDF")
         
@@ -666,6 +1050,7 @@ def combine(source_dir, output, config, workers, compression, include, exclude,
         proc_config.ocr_enabled = False
     if log_file:
         proc_config.log_file = str(log_file)
+    proc_config.compile_patterns()
     
     # Save configuration if requested
     if save_config:
@@ -676,7 +1061,7 @@ def combine(source_dir, output, config, workers, compression, include, exclude,
     setup_logging(verbose, proc_config.log_file)
     
     # Check system dependencies
-    if not shutil.which("ocrmypdf") and proc_config.ocr_enabled:
+    if ocrmypdf is None and not shutil.which("ocrmypdf") and proc_config.ocr_enabled:
         logging.warning("ocrmypdf not found - OCR will be disabled")
         proc_config.ocr_enabled = False
     
@@ -687,8 +1072,8 @@ def combine(source_dir, output, config, workers, compression, include, exclude,
         if check:
             check_documents_enhanced(source_dir, proc_config)
         else:
-            processor = EnhancedPDFProcessor(proc_config)
-            result = processor.merge_documents(source_dir, output)
+            with EnhancedPDFProcessor(proc_config) as processor:
+                result = processor.merge_documents(source_dir, output)
             
             if result.failed_documents > 0:
                 sys.exit(1)
@@ -720,6 +1105,7 @@ def verify(pdf_file, source_dir, config, include, exclude, verbose):
         proc_config.include_patterns = list(include)
     if exclude:
         proc_config.exclude_patterns = list(exclude)
+    proc_config.compile_patterns()
     
     setup_logging(verbose)
     
@@ -750,6 +1136,7 @@ def check_deps():
         "Python": sys.version,
         "ocrmypdf": shutil.which("ocrmypdf"),
         "libreoffice": shutil.which("libreoffice"),
+        "unoconv": shutil.which("unoconv"),
     }
     
     for name, status in deps.items():
@@ -9,24 +9,35 @@ This script demonstrates advanced features including:
 - Configuration management
 """
 
+import contextlib
+import dataclasses
 import logging
+import os
+import stat
 import sys
+import tarfile
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+from PyPDF2 import PdfWriter
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.table import Table
 
 from pdf_combiner import PDFMerger, PDFCombinerError
-from pdf_combiner.config import Config
-from pdf_combiner.models import DocumentInfo, ProcessingStatus
+from pdf_combiner.config import Config, ConfigSnapshot
+from pdf_combiner.models import DocumentInfo, ProcessingResult, ProcessingStatus
 from pdf_combiner.utils import format_file_size, check_system_dependencies
 
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Larger summaries are printed as plain lines instead of a table
+SUMMARY_TABLE_MAX_ROWS = 200
+
 
 def setup_logging(verbose: bool = False):
     """Configure logging."""
@@ -55,14 +66,62 @@ def check_dependencies():
     return True
 
 
-def process_directory_batch(directories: List[Path], output_dir: Path, config: Config):
-    """Process multiple directories in batch."""
-    merger = PDFMerger(config)
+def _is_existing_dir(path: Path) -> bool:
+    """Check that a path is an existing directory with a single stat()."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _merge_one(directory: Path, output_file: Path, snap: ConfigSnapshot) -> Optional[ProcessingResult]:
+    """Merge a single directory in a worker process.
     
-    # Create output directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+    The merger is rebuilt from a frozen snapshot so nothing unpicklable
+    crosses the process boundary. Returns None if the directory has no
+    documents.
+    """
+    merger = PDFMerger(snap.to_config())
+    
+    # Check directory first
+    if not merger.check_directory(directory):
+        return None
+    
+    return merger.merge_directory(directory, output_file)
+
+
+def combine_outputs(results: List[dict], single_output: Path) -> None:
+    """Concatenate the successful per-directory PDFs into one file.
     
+    Each directory gets a top-level bookmark. Pages are appended straight
+    from the already-merged outputs, so no source document is converted
+    or OCR'd a second time.
+    """
+    writer = PdfWriter()
+    for item in results:
+        if item["status"] == "success":
+            writer.append(str(item["result"].output_path), outline_item=item["directory"].name)
+    
+    with open(single_output, "wb", buffering=1 << 20) as f:
+        writer.write(f)
+
+
+def _merge_all(
+    directories: List[Path],
+    output_dir: Path,
+    snap: ConfigSnapshot,
+    archive: Optional[tarfile.TarFile] = None
+) -> List[dict]:
+    """Merge each directory in a worker process, reporting progress.
+    
+    Finished outputs are streamed into archive, if given, as soon as
+    their worker completes. Their sizes are recorded under "size", since
+    the scratch files are gone by the time the summary is shown.
+    """
     results = []
+    lines = []
+    # Refresh the progress description ~100 times at most
+    step = max(1, len(directories) // 100)
     
     with Progress(
         SpinnerColumn(),
@@ -77,47 +136,109 @@ def process_directory_batch(directories: List[Path], output_dir: Path, config: C
             total=len(directories)
         )
         
-        for i, directory in enumerate(directories):
-            progress.update(
-                main_task,
-                description=f"Processing {directory.name}..."
-            )
+        # Each merger gets its share of max_workers for its own check, OCR and
+        # hashing pools, so the directories together don't oversubscribe the CPUs
+        workers = max(1, min(snap.max_workers, len(directories)))
+        worker_snap = dataclasses.replace(snap, max_workers=max(1, snap.max_workers // workers))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _merge_one,
+                    directory,
+                    output_dir / f"{directory.name}_combined.pdf",
+                    worker_snap,
+                ): directory
+                for directory in directories
+            }
             
-            try:
-                # Generate output filename
-                output_file = output_dir / f"{directory.name}_combined.pdf"
-                
-                # Check directory first
-                documents = merger.check_directory(directory)
+            for i, future in enumerate(as_completed(futures), 1):
+                directory = futures[future]
                 
-                if not documents:
-                    console.print(f"[yellow]No documents found in {directory}[/yellow]")
-                    continue
+                try:
+                    result = future.result()
+                    
+                    if result is None:
+                        lines.append(f"[yellow]No documents found in {directory}[/yellow]")
+                    else:
+                        item = {
+                            "directory": directory,
+                            "result": result,
+                            "status": "success"
+                        }
+                        results.append(item)
+                        
+                        if archive is not None:
+                            member = archive.gettarinfo(
+                                str(result.output_path), arcname=result.output_path.name
+                            )
+                            with open(result.output_path, "rb") as f:
+                                archive.addfile(member, f)
+                            item["size"] = member.size
+                        
+                        lines.append(
+                            f"[green]✓[/green] {directory.name}: "
+                            f"{result.processed_documents} files → {result.output_path.name}"
+                        )
+                    
+                except PDFCombinerError as e:
+                    results.append({
+                        "directory": directory,
+                        "error": e,
+                        "status": "failed"
+                    })
+                    lines.append(f"[red]✗[/red] {directory.name}: {e.message}")
                 
-                # Process documents
-                result = merger.merge_directory(directory, output_file)
-                results.append({
-                    "directory": directory,
-                    "result": result,
-                    "status": "success"
-                })
-                
-                console.print(
-                    f"[green]✓[/green] {directory.name}: "
-                    f"{result.processed_documents} files → {output_file.name}"
-                )
-                
-            except PDFCombinerError as e:
-                results.append({
-                    "directory": directory,
-                    "error": e,
-                    "status": "failed"
-                })
-                console.print(
-                    f"[red]✗[/red] {directory.name}: {e.message}"
-                )
+                if i % step == 0:
+                    progress.update(
+                        main_task,
+                        advance=step,
+                        description=f"Finished {directory.name}..."
+                    )
             
-            progress.update(main_task, advance=1)
+            progress.update(main_task, completed=len(directories))
+    
+    if lines:
+        console.print("\n".join(lines))
+    
+    return results
+
+
+def process_directory_batch(
+    directories: List[Path],
+    output_dir: Path,
+    config: Config,
+    single_output: Optional[Path] = None,
+    archive_output: Optional[Path] = None
+):
+    """Process multiple directories in batch, one worker process per directory.
+    
+    If single_output is given, the per-directory PDFs are also combined
+    into that file, in the order the directories were passed. If
+    archive_output is given, the per-directory PDFs are streamed into that
+    tar file instead of being left in output_dir.
+    """
+    # Create output directory
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    with contextlib.ExitStack() as stack:
+        archive = None
+        target_dir = output_dir
+        if archive_output:
+            # Outputs only live in a scratch directory until they are archived
+            target_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(dir=output_dir)))
+            archive = stack.enter_context(tarfile.open(archive_output, mode="w|", bufsize=1 << 20))
+        
+        results = _merge_all(directories, target_dir, config.snapshot(), archive)
+        
+        if single_output:
+            order = {directory: i for i, directory in enumerate(directories)}
+            results.sort(key=lambda item: order[item["directory"]])
+            combine_outputs(results, single_output)
+            console.print(f"[green]✓[/green] Combined all outputs → {single_output}")
+    
+    if archive_output:
+        console.print(f"[green]✓[/green] Archived outputs → {archive_output}")
     
     return results
 
@@ -126,18 +247,28 @@ def display_summary(results: List[dict]):
     """Display processing summary."""
     console.print("\n[bold blue]Processing Summary[/bold blue]\n")
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Directory", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Files", justify="right")
-    table.add_column("Pages", justify="right")
-    table.add_column("Size", justify="right")
-    table.add_column("Time", justify="right")
-    
+    rows = []
     total_files = 0
     total_pages = 0
     total_size = 0
     
+    # One scandir per output directory instead of a stat() per result;
+    # archived outputs already carry their size
+    size_map = {}
+    output_dirs = {
+        item["result"].output_path.parent
+        for item in results
+        if item["status"] == "success" and "size" not in item
+    }
+    for output_dir in output_dirs:
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        size_map[entry.path] = entry.stat().st_size
+        except OSError:
+            continue
+    
     for item in results:
         if item["status"] == "success":
             result = item["result"]
@@ -145,41 +276,49 @@ def display_summary(results: List[dict]):
             total_pages += result.total_pages
             
             # Calculate output file size
-            if result.output_path.exists():
-                size = result.output_path.stat().st_size
+            size = item.get("size", size_map.get(str(result.output_path)))
+            if size is not None:
                 total_size += size
                 size_str = format_file_size(size)
             else:
                 size_str = "-"
             
-            table.add_row(
+            rows.append((
                 item["directory"].name,
-                "[green]Success",
+                "[green]Success[/green]",
                 str(result.processed_documents),
                 str(result.total_pages),
                 size_str,
                 f"{result.processing_time_seconds:.1f}s"
-            )
+            ))
         else:
-            table.add_row(
-                item["directory"].name,
-                "[red]Failed",
-                "-",
-                "-",
-                "-",
-                "-"
-            )
+            rows.append((item["directory"].name, "[red]Failed[/red]", "-", "-", "-", "-"))
     
-    console.print(table)
+    if len(rows) <= SUMMARY_TABLE_MAX_ROWS:
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Directory", style="cyan")
+        table.add_column("Status", style="bold")
+        table.add_column("Files", justify="right")
+        table.add_column("Pages", justify="right")
+        table.add_column("Size", justify="right")
+        table.add_column("Time", justify="right")
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+    else:
+        console.print("\n".join("  ".join(row) for row in rows))
     
     # Overall summary
-    console.print(f"\n[bold]Total:[/bold]")
-    console.print(f"  Directories processed: {len(results)}")
-    console.print(f"  Successful: {sum(1 for r in results if r['status'] == 'success')}")
-    console.print(f"  Failed: {sum(1 for r in results if r['status'] == 'failed')}")
-    console.print(f"  Total files merged: {total_files}")
-    console.print(f"  Total pages: {total_pages}")
-    console.print(f"  Total output size: {format_file_size(total_size)}")
+    succeeded = sum(1 for r in results if r['status'] == 'success')
+    console.print("\n".join([
+        "\n[bold]Total:[/bold]",
+        f"  Directories processed: {len(results)}",
+        f"  Successful: {succeeded}",
+        f"  Failed: {len(results) - succeeded}",
+        f"  Total files merged: {total_files}",
+        f"  Total pages: {total_pages}",
+        f"  Total output size: {format_file_size(total_size)}",
+    ]))
 
 
 def main():
@@ -220,7 +359,7 @@ def main():
     output_dir = Path("/path/to/output")
     
     # Filter existing directories
-    existing_dirs = [d for d in directories if d.exists() and d.is_dir()]
+    existing_dirs = [d for d in directories if _is_existing_dir(d)]
     
     if not existing_dirs:
         console.print("[red]No valid directories found![/red]")
@@ -5,6 +5,8 @@ This package provides functionality to combine PDFs, DOCs, and DOCX files
 with automatic OCR support for image-based PDFs.
 """
 
+from typing import Any
+
 from pdf_combiner.__version__ import (
     __author__,
     __email__,
@@ -18,8 +20,24 @@ from pdf_combiner.exceptions import (
     OCRError,
     ValidationError,
 )
-from pdf_combiner.merger import PDFMerger
-from pdf_combiner.models import ProcessingResult, DocumentInfo
+
+# PDFMerger and the models pull in PyPDF2 and pydantic, so they are only
+# imported on first attribute access.
+_LAZY_IMPORTS = {
+    "PDFMerger": "pdf_combiner.merger",
+    "ProcessingResult": "pdf_combiner.models",
+    "DocumentInfo": "pdf_combiner.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__title__",
@@ -0,0 +1,376 @@
+"""Command implementations shared by the click and argparse front ends.
+
+Each run_* function takes already-parsed arguments, so neither front end
+has to import the other's parsing library.
+"""
+
+import functools
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from pdf_combiner.exceptions import PDFCombinerError
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich, pydantic and PyPDF2 are imported inside the commands that use
+# them so `--help`, `--version` and shell completion start quickly.
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Return the shared rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def setup_logging(verbose: bool = False, log_file: Optional[Path] = None) -> None:
+    """Configure logging with rich handler, or plain lines when not on a terminal."""
+    from pdf_combiner.config import CachedTimeFormatter, configure_log_records
+    
+    level = logging.DEBUG if verbose else logging.INFO
+    
+    console = get_console()
+    handler: logging.Handler
+    if console.is_terminal:
+        from rich.logging import RichHandler
+        
+        handler = RichHandler(
+            console=console,
+            show_time=True,
+            show_path=verbose,
+            markup=True,
+            rich_tracebacks=True,
+        )
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(CachedTimeFormatter(
+            "%(asctime)s [%(levelname)s] %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+    
+    handlers: List[logging.Handler] = [handler]
+    
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    
+    configure_log_records("%(message)s", verbose)
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        handlers=handlers,
+        force=True
+    )
+
+
+def run_combine(
+    directory: Path,
+    output: Path,
+    check: bool,
+    recursive: bool,
+    config: Optional[Path],
+    skip_ocr: bool,
+    ocr_language: str,
+    overwrite: bool,
+    workers: Optional[int],
+    verbose: bool
+) -> None:
+    """Combine documents from a directory into a single PDF."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
+    from rich.table import Table
+    
+    from pdf_combiner.config import Config, load_config
+    from pdf_combiner.merger import PDFMerger
+    from pdf_combiner.models import ProcessingStatus
+    from pdf_combiner.utils import format_file_size
+    from pdf_combiner.validators import validate_config_file, validate_ocr_language
+    
+    console = get_console()
+    setup_logging(verbose)
+    
+    # Live progress output only makes sense on a terminal, not in pipes or CI logs
+    interactive = console.is_terminal
+    spinner = [SpinnerColumn()] if interactive else []
+    
+    try:
+        # Load configuration
+        if config:
+            validate_config_file(config)
+            cfg = Config.from_yaml(config)
+        else:
+            cfg = load_config()
+        
+        # Override config with CLI options
+        if skip_ocr:
+            cfg.ocr.enabled = False
+        if ocr_language != "eng":
+            validate_ocr_language(ocr_language)
+            cfg.ocr.language = ocr_language
+        if overwrite:
+            cfg.output.overwrite = True
+        if workers is None:
+            workers = min(os.cpu_count() or 1, cfg.processing.max_workers)
+        cfg.processing.max_workers = workers
+        
+        if check:
+            # The check table only needs page counts, not a full parse
+            cfg.processing.metadata_only = True
+        
+        # Initialize merger
+        merger = PDFMerger(cfg)
+        
+        if check:
+            # Check mode
+            console.print(f"\n[bold blue]Checking documents in {directory}[/bold blue]\n")
+            
+            with Progress(
+                *spinner,
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+                disable=not interactive
+            ) as progress:
+                task = progress.add_task("Scanning documents...", total=None)
+                documents = merger.check_directory(directory, recursive)
+                progress.update(task, completed=True)
+            
+            # Display results
+            table = Table(title=f"Document Check Results ({len(documents)} files)")
+            table.add_column("File", style="cyan")
+            table.add_column("Type", style="magenta")
+            table.add_column("Size", style="green")
+            table.add_column("Pages", style="yellow")
+            table.add_column("Has Text", style="blue")
+            table.add_column("Status", style="red")
+            
+            for doc in documents:
+                status = "✓ OK" if not doc.error_message else f"✗ {doc.error_message}"
+                has_text = "Yes" if doc.has_text else "No" if doc.has_text is not None else "-"
+                pages = str(doc.page_count) if doc.page_count else "-"
+                
+                table.add_row(
+                    doc.name,
+                    doc.type.value.upper(),
+                    format_file_size(doc.size_bytes),
+                    pages,
+                    has_text,
+                    status
+                )
+            
+            console.print(table)
+            
+            # Summary
+            console.print("\n[bold]Summary:[/bold]")
+            console.print(f"  Total files: {len(documents)}")
+            console.print(f"  Valid files: {sum(1 for d in documents if not d.error_message)}")
+            if not cfg.processing.metadata_only:
+                console.print(f"  Need OCR: {sum(1 for d in documents if d.has_text is False)}")
+            
+        else:
+            # Merge mode
+            console.print(f"\n[bold blue]Combining documents from {directory}[/bold blue]\n")
+            
+            with Progress(
+                *spinner,
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeRemainingColumn(),
+                console=console,
+                disable=not interactive
+            ) as progress:
+                # Create a task
+                task = progress.add_task("Processing documents...", total=100)
+                
+                # Merge documents
+                result = merger.merge_directory(directory, output, recursive)
+                
+                # Update progress
+                progress.update(task, completed=100)
+            
+            # Display results
+            if result.has_errors:
+                console.print("\n[bold yellow]⚠️  Completed with errors[/bold yellow]")
+            else:
+                console.print("\n[bold green]✓ Successfully combined documents[/bold green]")
+            
+            console.print(f"\nOutput: [cyan]{result.output_path}[/cyan]")
+            console.print(f"Total pages: [yellow]{result.total_pages}[/yellow]")
+            console.print(f"Processing time: [blue]{result.processing_time_seconds:.2f}s[/blue]")
+            
+            # Summary table
+            table = Table(title="Processing Summary")
+            table.add_column("Status", style="bold")
+            table.add_column("Count", style="bold")
+            
+            table.add_row("[green]Processed", str(result.processed_documents))
+            if result.skipped_documents > 0:
+                table.add_row("[yellow]Skipped", str(result.skipped_documents))
+            if result.failed_documents > 0:
+                table.add_row("[red]Failed", str(result.failed_documents))
+            table.add_row("Total", str(result.total_documents))
+            
+            console.print(table)
+            
+            # Show errors if any
+            if result.failed_documents > 0:
+                console.print("\n[bold red]Failed files:[/bold red]")
+                for doc in result.documents:
+                    if doc.status == ProcessingStatus.FAILED:
+                        console.print(f"  - {doc.name}: {doc.error_message}")
+            
+            # Show warnings if any
+            if result.warnings:
+                console.print("\n[bold yellow]Warnings:[/bold yellow]")
+                for warning in result.warnings:
+                    console.print(f"  - {warning}")
+    
+    except PDFCombinerError as e:
+        console.print(f"\n[bold red]Error:[/bold red] {e.message}")
+        if e.details:
+            for key, value in e.details.items():
+                console.print(f"  {key}: {value}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        sys.exit(130)
+    except Exception as e:
+        console.print(f"\n[bold red]Unexpected error:[/bold red] {e}")
+        logger.exception("Unexpected error occurred")
+        sys.exit(1)
+
+
+def _preview(names: List[str], limit: int = 5) -> str:
+    """Join the first few file names for a table cell."""
+    return ", ".join(names[:limit]) + ("..." if len(names) > limit else "")
+
+
+def run_verify(pdf_file: Path, source_dir: Path, verbose: bool) -> None:
+    """Verify that a combined PDF contains all files from source directory."""
+    from rich.table import Table
+    
+    from pdf_combiner.merger import PDFMerger
+    
+    console = get_console()
+    setup_logging(verbose)
+    
+    try:
+        console.print(f"\n[bold blue]Verifying {pdf_file}[/bold blue]\n")
+        
+        # Initialize merger with default config
+        merger = PDFMerger()
+        
+        # Verify PDF
+        with console.status("Analyzing PDF..."):
+            result = merger.verify_merged_pdf(pdf_file, source_dir)
+        
+        # Display results
+        console.print(f"PDF: [cyan]{result.pdf_path}[/cyan]")
+        console.print(f"Source directory: [cyan]{result.source_dir}[/cyan]")
+        console.print(f"Pages: [yellow]{result.page_count}[/yellow]")
+        console.print(f"Match percentage: [blue]{result.match_percentage:.1f}%[/blue]\n")
+        
+        # Create comparison table
+        table = Table(title="File Comparison")
+        table.add_column("Category", style="bold")
+        table.add_column("Count", style="bold")
+        table.add_column("Files")
+        
+        table.add_row(
+            "[green]Expected",
+            str(len(result.expected_files)),
+            _preview(result.expected_files)
+        )
+        
+        if result.found_files:
+            table.add_row(
+                "[blue]Found",
+                str(len(result.found_files)),
+                _preview(result.found_files)
+            )
+        
+        if result.missing_files:
+            table.add_row(
+                "[red]Missing",
+                str(len(result.missing_files)),
+                _preview(result.missing_files)
+            )
+        
+        if result.extra_files:
+            table.add_row(
+                "[yellow]Extra",
+                str(len(result.extra_files)),
+                _preview(result.extra_files)
+            )
+        
+        console.print(table)
+        
+        # Final verdict
+        if result.is_valid:
+            console.print(
+                "\n[bold green]✓ VERIFIED:[/bold green] All expected files are in the PDF"
+            )
+        else:
+            console.print(
+                "\n[bold red]✗ MISMATCH:[/bold red] PDF does not contain all expected files"
+            )
+            
+            if result.missing_files:
+                console.print(
+                    f"\n[red]Missing {len(result.missing_files)} files from directory[/red]"
+                )
+            if result.extra_files:
+                console.print(
+                    f"\n[yellow]Found {len(result.extra_files)} unexpected files in PDF[/yellow]"
+                )
+    
+    except PDFCombinerError as e:
+        console.print(f"\n[bold red]Error:[/bold red] {e.message}")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"\n[bold red]Unexpected error:[/bold red] {e}")
+        logger.exception("Unexpected error occurred")
+        sys.exit(1)
+
+
+def run_check_deps() -> None:
+    """Check system dependencies."""
+    from rich.table import Table
+    
+    from pdf_combiner.utils import check_system_dependencies, get_dependency_install_command
+    
+    console = get_console()
+    console.print("\n[bold blue]Checking system dependencies...[/bold blue]\n")
+    
+    available, missing = check_system_dependencies()
+    
+    # Display results
+    table = Table(title="System Dependencies")
+    table.add_column("Dependency", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Notes")
+    
+    all_deps = set(available + missing)
+    
+    for dep in sorted(all_deps):
+        if dep in available:
+            status = "[green]✓ Installed"
+            notes = ""
+        else:
+            status = "[red]✗ Missing"
+            notes = get_dependency_install_command(dep)
+        
+        table.add_row(dep, status, notes)
+    
+    console.print(table)
+    
+    if missing:
+        console.print(f"\n[bold red]Missing {len(missing)} dependencies[/bold red]")
+        console.print("Install the missing dependencies to enable all features.")
+        sys.exit(1)
+    else:
+        console.print("\n[bold green]All dependencies are installed![/bold green]")
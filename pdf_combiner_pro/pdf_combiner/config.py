@@ -1,81 +1,327 @@
 """Configuration management for PDF Combiner."""
 
+import atexit
+import copy
+import functools
+import json
 import logging
+import os
+import queue
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 
-import yaml
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pdf_combiner.exceptions import ConfigurationError
 
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
 
-class LoggingConfig(BaseSettings):
+
+# yaml is imported on first use: most runs never read or write a config file
+@functools.lru_cache(maxsize=None)
+def _yaml_loader_dumper() -> Tuple[Any, Any]:
+    """Return PyYAML's safe (Loader, Dumper), preferring the libyaml C versions."""
+    import yaml
+    try:
+        return yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:  # pragma: no cover - depends on the PyYAML build
+        return yaml.SafeLoader, yaml.SafeDumper
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized on its path, mtime and size."""
+    import yaml
+    loader, _ = _yaml_loader_dumper()
+    # libyaml decodes the raw bytes itself, so skip the text-mode wrapper
+    return yaml.load(path.read_bytes(), Loader=loader) or {}
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once.
+    
+    With an explicit datefmt, asctime has one-second resolution, so
+    records logged within the same second reuse the formatted string.
+    """
+    
+    _cached: Tuple[int, str] = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached = self._cached
+        if cached[0] != second:
+            cached = (second, super().formatTime(record, datefmt))
+            self._cached = cached
+        return cached[1]
+
+
+def configure_log_records(fmt: str, debug: bool) -> None:
+    """Skip LogRecord fields the format doesn't use.
+    
+    Thread and process details are looked up for every record unless
+    disabled. Handler errors are only reported when debugging.
+    
+    Args:
+        fmt: Log format string used by the handlers
+        debug: Whether debug logging is enabled
+    """
+    logging.logThreads = "%(thread" in fmt
+    logging.logProcesses = "%(process)" in fmt
+    logging.logMultiprocessing = "%(processName)" in fmt
+    logging.raiseExceptions = debug
+
+
+# Environment variables override settings as PDF_COMBINER_<SECTION>__<FIELD>
+ENV_PREFIX = "PDF_COMBINER_"
+ENV_NESTED_DELIMITER = "__"
+
+_TRUE_STRINGS = {"1", "true", "yes", "on"}
+_FALSE_STRINGS = {"0", "false", "no", "off"}
+
+
+def _coerce(name: str, value: Any, type_: Any) -> Any:
+    """Convert a YAML or environment value to a settings field type.
+    
+    Raises:
+        ValueError: If the value can't be converted
+    """
+    if type_ == Optional[Path]:
+        return None if value is None else Path(value)
+    if type_ is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE_STRINGS | _FALSE_STRINGS:
+            return text in _TRUE_STRINGS
+    elif type_ is int:
+        if not isinstance(value, bool):
+            try:
+                if isinstance(value, str) or int(value) == value:
+                    return int(value)
+            except (TypeError, ValueError):
+                pass
+    elif type_ is str:
+        if isinstance(value, str):
+            return value
+    elif type_ == List[str]:
+        if isinstance(value, str):
+            value = json.loads(value)
+        if isinstance(value, (list, tuple)):
+            return [str(item) for item in value]
+    raise ValueError(f"Invalid value for {name}: {value!r}")
+
+
+def _check_range(name: str, value: int, ge: Optional[int] = None, le: Optional[int] = None) -> None:
+    """Raise ValueError if value is outside [ge, le]."""
+    if (ge is not None and value < ge) or (le is not None and value > le):
+        raise ValueError(f"{name} must be between {ge} and {le}, got {value}")
+
+
+class _Section:
+    """Base for config sections: coerce field types, then validate."""
+    
+    def __post_init__(self) -> None:
+        for f in fields(self):  # type: ignore[arg-type]  # subclasses are dataclasses
+            name = f"{type(self).__name__}.{f.name}"
+            setattr(self, f.name, _coerce(name, getattr(self, f.name), f.type))
+        self._validate()
+    
+    def _validate(self) -> None:
+        """Check field constraints after coercion."""
+
+
+@dataclass
+class LoggingConfig(_Section):
     """Logging configuration."""
     
-    level: str = Field(default="INFO", description="Logging level")
-    format: str = Field(
-        default="%(asctime)s [%(levelname)s] %(message)s",
-        description="Log message format"
-    )
-    date_format: str = Field(
-        default="%Y-%m-%d %H:%M:%S",
-        description="Date format for logs"
-    )
-    file: Optional[Path] = Field(default=None, description="Log file path")
+    level: str = "INFO"  # Logging level
+    format: str = "%(asctime)s [%(levelname)s] %(message)s"  # Log message format
+    date_format: str = "%Y-%m-%d %H:%M:%S"  # Date format for logs
+    file: Optional[Path] = None  # Log file path
     
-    @field_validator('level')
-    @classmethod
-    def validate_level(cls, v: str) -> str:
+    def _validate(self) -> None:
         """Validate logging level."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        v = v.upper()
-        if v not in valid_levels:
-            raise ValueError(f"Invalid logging level: {v}. Must be one of {valid_levels}")
-        return v
+        self.level = self.level.upper()
+        if self.level not in valid_levels:
+            raise ValueError(f"Invalid logging level: {self.level}. Must be one of {valid_levels}")
 
 
-class OutputConfig(BaseSettings):
+@dataclass
+class OutputConfig(_Section):
     """Output configuration."""
     
-    default_name: str = Field(default="combined.pdf", description="Default output filename")
-    add_metadata: bool = Field(default=True, description="Add metadata to merged PDF")
-    compression: bool = Field(default=True, description="Enable PDF compression")
-    overwrite: bool = Field(default=False, description="Overwrite existing output file")
+    default_name: str = "combined.pdf"  # Default output filename
+    add_metadata: bool = True  # Add metadata to merged PDF
+    compression: bool = True  # Enable PDF compression
+    overwrite: bool = False  # Overwrite existing output file
 
 
-class OCRConfig(BaseSettings):
+@dataclass
+class OCRConfig(_Section):
     """OCR configuration."""
     
-    enabled: bool = Field(default=True, description="Enable OCR processing")
-    language: str = Field(default="eng", description="OCR language")
-    dpi: int = Field(default=300, ge=72, le=600, description="OCR resolution in DPI")
-    skip_text_pages: bool = Field(default=True, description="Skip pages that already have text")
-    timeout: int = Field(default=300, ge=60, description="OCR timeout in seconds")
-    extra_args: list[str] = Field(default_factory=list, description="Extra arguments for ocrmypdf")
+    enabled: bool = True  # Enable OCR processing
+    language: str = "eng"  # OCR language
+    dpi: int = 300  # OCR resolution in DPI
+    skip_text_pages: bool = True  # Skip pages that already have text
+    timeout: int = 300  # OCR timeout in seconds
+    extra_args: List[str] = field(default_factory=list)  # Extra arguments for ocrmypdf
+    
+    def _validate(self) -> None:
+        _check_range("OCRConfig.dpi", self.dpi, ge=72, le=600)
+        _check_range("OCRConfig.timeout", self.timeout, ge=60)
 
 
-class ProcessingConfig(BaseSettings):
+@dataclass
+class ProcessingConfig(_Section):
     """Processing configuration."""
     
-    temp_dir: Optional[Path] = Field(default=None, description="Temporary directory for processing")
-    max_workers: int = Field(default=4, ge=1, le=16, description="Maximum parallel workers")
-    batch_size: int = Field(default=10, ge=1, description="Batch size for processing")
-    fail_fast: bool = Field(default=False, description="Stop on first error")
+    temp_dir: Optional[Path] = None  # Temporary directory for processing
+    max_workers: int = 4  # Maximum parallel workers
+    batch_size: int = 10  # Batch size for processing
+    fail_fast: bool = False  # Stop on first error
+    metadata_only: bool = False  # Only read page counts when checking documents
+    
+    def _validate(self) -> None:
+        _check_range("ProcessingConfig.max_workers", self.max_workers, ge=1, le=16)
+        _check_range("ProcessingConfig.batch_size", self.batch_size, ge=1)
+
 
+def _env_overrides() -> Dict[str, Dict[str, str]]:
+    """Collect PDF_COMBINER_<SECTION>__<FIELD> variables by section."""
+    overrides: Dict[str, Dict[str, str]] = {}
+    for key, value in os.environ.items():
+        key = key.upper()
+        if not key.startswith(ENV_PREFIX):
+            continue
+        section, sep, name = key[len(ENV_PREFIX):].partition(ENV_NESTED_DELIMITER)
+        if sep:
+            overrides.setdefault(section.lower(), {})[name.lower()] = value
+    return overrides
 
-class Config(BaseSettings):
-    """Main configuration class."""
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable, plain-value copy of every setting.
+    
+    Cheap to pickle for worker processes and free of pydantic attribute
+    access overhead. Use Config.snapshot() to create one.
+    """
     
-    model_config = SettingsConfigDict(
-        env_prefix="PDF_COMBINER_",
-        env_nested_delimiter="__",
-        case_sensitive=False,
+    # Declared by hand rather than dataclass(slots=True) to stay 3.8-compatible
+    __slots__ = (
+        "max_workers", "batch_size", "fail_fast", "metadata_only", "temp_dir",
+        "ocr_enabled", "ocr_language", "dpi", "skip_text_pages", "ocr_timeout",
+        "ocr_extra_args", "default_name", "compression", "add_metadata", "overwrite",
+        "log_level", "log_format", "log_date_format", "log_file",
     )
     
-    output: OutputConfig = Field(default_factory=OutputConfig)
-    ocr: OCRConfig = Field(default_factory=OCRConfig)
-    processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    max_workers: int
+    batch_size: int
+    fail_fast: bool
+    metadata_only: bool
+    temp_dir: Optional[str]
+    ocr_enabled: bool
+    ocr_language: str
+    dpi: int
+    skip_text_pages: bool
+    ocr_timeout: int
+    ocr_extra_args: Tuple[str, ...]
+    default_name: str
+    compression: bool
+    add_metadata: bool
+    overwrite: bool
+    log_level: str
+    log_format: str
+    log_date_format: str
+    log_file: Optional[str]
+    
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        # Frozen slotted instances can't be restored via setattr
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+    
+    def to_config(self) -> "Config":
+        """Rebuild a full Config from this snapshot.
+        
+        Returns:
+            Config instance with the snapshot values applied
+        """
+        return Config(
+            output=OutputConfig(
+                default_name=self.default_name,
+                add_metadata=self.add_metadata,
+                compression=self.compression,
+                overwrite=self.overwrite,
+            ),
+            ocr=OCRConfig(
+                enabled=self.ocr_enabled,
+                language=self.ocr_language,
+                dpi=self.dpi,
+                skip_text_pages=self.skip_text_pages,
+                timeout=self.ocr_timeout,
+                extra_args=list(self.ocr_extra_args),
+            ),
+            processing=ProcessingConfig(
+                temp_dir=Path(self.temp_dir) if self.temp_dir else None,
+                max_workers=self.max_workers,
+                batch_size=self.batch_size,
+                fail_fast=self.fail_fast,
+                metadata_only=self.metadata_only,
+            ),
+            logging=LoggingConfig(
+                level=self.log_level,
+                format=self.log_format,
+                date_format=self.log_date_format,
+                file=Path(self.log_file) if self.log_file else None,
+            ),
+        )
+
+
+@dataclass
+class Config:
+    """Main configuration class.
+    
+    Sections may be given as instances or as plain dicts (as loaded from
+    YAML). Environment variables fill in any setting not given
+    explicitly, e.g. PDF_COMBINER_OCR__LANGUAGE=deu.
+    """
+    
+    output: OutputConfig = None  # type: ignore[assignment]
+    ocr: OCRConfig = None  # type: ignore[assignment]
+    processing: ProcessingConfig = None  # type: ignore[assignment]
+    logging: LoggingConfig = None  # type: ignore[assignment]
+    
+    def __post_init__(self) -> None:
+        env = _env_overrides()
+        for f in fields(self):
+            section_cls = _SECTIONS[f.name]
+            value = getattr(self, f.name)
+            if isinstance(value, section_cls):
+                continue
+            if value is not None and not isinstance(value, dict):
+                raise ValueError(f"Invalid value for Config.{f.name}: {value!r}")
+            
+            known = {sf.name for sf in fields(section_cls)}
+            unknown = [key for key in value or {} if key not in known]
+            if unknown:
+                key = f"{f.name}.{unknown[0]}"
+                raise ConfigurationError(f"Unknown configuration setting: {key}", key=key)
+            settings = {k: v for k, v in env.get(f.name, {}).items() if k in known}
+            settings.update(value or {})
+            setattr(self, f.name, section_cls(**settings))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return all settings as nested plain dicts.
+        
+        Returns:
+            Dictionary with one entry per section
+        """
+        return asdict(self)
     
     @classmethod
     def from_yaml(cls, path: Path) -> "Config":
@@ -90,12 +336,22 @@ class Config(BaseSettings):
         Raises:
             FileNotFoundError: If configuration file doesn't exist
             yaml.YAMLError: If YAML parsing fails
+            ConfigurationError: If the file has unknown sections or settings
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}") from None
         
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        # Copy so callers can't mutate the cached tree
+        data = copy.deepcopy(_parse_yaml(path.absolute(), st.st_mtime_ns, st.st_size))
+        if not isinstance(data, dict):
+            raise ConfigurationError(f"Configuration file must contain a mapping: {path}")
+        unknown = [key for key in data if key not in _SECTIONS]
+        if unknown:
+            raise ConfigurationError(
+                f"Unknown configuration section: {unknown[0]}", key=str(unknown[0])
+            )
         
         return cls(**data)
     
@@ -105,26 +361,96 @@ class Config(BaseSettings):
         Args:
             path: Path to save YAML configuration
         """
+        import yaml
+        _, dumper = _yaml_loader_dumper()
+        
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w') as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False, sort_keys=False)
+        data = {
+            name: {
+                key: str(value) if isinstance(value, Path) else value
+                for key, value in section.items()
+            }
+            for name, section in self.to_dict().items()
+        }
+        # Render in memory and write the file in one call
+        path.write_text(yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False))
+    
+    def snapshot(self) -> ConfigSnapshot:
+        """Capture the merge-relevant settings as a frozen snapshot.
+        
+        Returns:
+            ConfigSnapshot with primitive copies of the current values
+        """
+        return ConfigSnapshot(
+            max_workers=self.processing.max_workers,
+            batch_size=self.processing.batch_size,
+            fail_fast=self.processing.fail_fast,
+            metadata_only=self.processing.metadata_only,
+            temp_dir=str(self.processing.temp_dir) if self.processing.temp_dir else None,
+            ocr_enabled=self.ocr.enabled,
+            ocr_language=self.ocr.language,
+            dpi=self.ocr.dpi,
+            skip_text_pages=self.ocr.skip_text_pages,
+            ocr_timeout=self.ocr.timeout,
+            ocr_extra_args=tuple(self.ocr.extra_args),
+            default_name=self.output.default_name,
+            compression=self.output.compression,
+            add_metadata=self.output.add_metadata,
+            overwrite=self.output.overwrite,
+            log_level=self.logging.level,
+            log_format=self.logging.format,
+            log_date_format=self.logging.date_format,
+            log_file=str(self.logging.file) if self.logging.file else None,
+        )
     
     def setup_logging(self) -> None:
-        """Configure logging based on settings."""
-        handlers = [logging.StreamHandler()]
+        """Configure logging based on settings.
+        
+        Records are queued and written by a background listener thread,
+        so logging calls don't block on console or file writes. Calling
+        this again with unchanged settings keeps the installed handlers,
+        so the log file isn't closed and reopened.
+        """
+        global _installed_logging, _log_listener
+        from logging.handlers import QueueHandler, QueueListener
+        
+        root = logging.getLogger()
+        level = getattr(logging, self.logging.level)
+        configure_log_records(self.logging.format, level <= logging.DEBUG)
+        key = (self.logging.format, self.logging.date_format, self.logging.file)
+        
+        if (
+            _installed_logging and _installed_logging[0] == key
+            and root.handlers == [_installed_logging[1]]
+        ):
+            root.setLevel(level)
+            return
+        
+        formatter = CachedTimeFormatter(self.logging.format, self.logging.date_format)
+        handlers: List[logging.Handler] = [logging.StreamHandler()]
         
         if self.logging.file:
             self.logging.file.parent.mkdir(parents=True, exist_ok=True)
             handlers.append(logging.FileHandler(self.logging.file))
         
-        logging.basicConfig(
-            level=getattr(logging, self.logging.level),
-            format=self.logging.format,
-            datefmt=self.logging.date_format,
-            handlers=handlers,
-            force=True
-        )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Same replacement as logging.basicConfig(force=True)
+        _stop_log_listener()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        
+        _log_listener = QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        _installed_logging = (key, queue_handler)
     
     def get_temp_dir(self) -> Path:
         """Get temporary directory, creating if necessary.
@@ -137,10 +463,17 @@ class Config(BaseSettings):
             return self.processing.temp_dir
         
         # Use system temp directory
-        import tempfile
         return Path(tempfile.gettempdir()) / "pdf_combiner"
 
 
+_SECTIONS = {
+    "output": OutputConfig,
+    "ocr": OCRConfig,
+    "processing": ProcessingConfig,
+    "logging": LoggingConfig,
+}
+
+
 def get_default_config() -> Config:
     """Get default configuration instance.
     
@@ -150,6 +483,70 @@ def get_default_config() -> Config:
     return Config()
 
 
+# Settings and handlers from the last Config.setup_logging call
+_installed_logging: Optional[Tuple[Tuple[str, str, Optional[Path]], logging.Handler]] = None
+_log_listener: Optional["QueueListener"] = None
+
+
+@atexit.register
+def _stop_log_listener() -> None:
+    """Flush queued log records and close the listener's handlers."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+# How long a default config file lookup is reused, in seconds
+_CONFIG_PATH_TTL = 1.0
+_config_path_cache: Dict[Path, Tuple[float, Optional[Path]]] = {}
+
+
+def _find_default_config() -> Optional[Path]:
+    """Return the first existing default config file, if any.
+    
+    The result is reused for _CONFIG_PATH_TTL seconds per working
+    directory, so repeated loads don't re-probe every location.
+    """
+    cwd = Path.cwd()
+    now = time.monotonic()
+    cached = _config_path_cache.get(cwd)
+    if cached and now - cached[0] < _CONFIG_PATH_TTL:
+        return cached[1]
+    
+    # Candidate file names per directory, in lookup order
+    candidates = [
+        (cwd, ["pdf_combiner.yaml", "config.yaml"]),
+        (Path.home() / ".config" / "pdf_combiner", ["config.yaml"]),
+    ]
+    found = None
+    for directory, names in candidates:
+        if len(names) == 1:
+            path = directory / names[0]
+            if path.is_file():
+                found = path
+                break
+            continue
+        
+        # One directory listing answers all of this directory's candidates
+        try:
+            with os.scandir(directory) as entries:
+                present = {
+                    entry.name for entry in entries if entry.name in names and entry.is_file()
+                }
+        except OSError:
+            continue
+        name = next((name for name in names if name in present), None)
+        if name:
+            found = directory / name
+            break
+    
+    _config_path_cache[cwd] = (now, found)
+    return found
+
+
 def load_config(config_path: Optional[Path] = None) -> Config:
     """Load configuration from file or environment.
     
@@ -159,20 +556,17 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     Returns:
         Config instance
     """
-    if config_path and config_path.exists():
-        return Config.from_yaml(config_path)
+    if config_path:
+        try:
+            return Config.from_yaml(config_path)
+        except FileNotFoundError:
+            pass
     
     # Try to load from default locations
-    default_paths = [
-        Path.cwd() / "pdf_combiner.yaml",
-        Path.cwd() / "config.yaml",
-        Path.home() / ".config" / "pdf_combiner" / "config.yaml",
-    ]
-    
-    for path in default_paths:
-        if path.exists():
-            logging.info(f"Loading configuration from {path}")
-            return Config.from_yaml(path)
+    path = _find_default_config()
+    if path:
+        logging.info(f"Loading configuration from {path}")
+        return Config.from_yaml(path)
     
     # Return default configuration
     return Config()
\ No newline at end of file
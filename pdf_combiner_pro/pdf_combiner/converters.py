@@ -1,10 +1,16 @@
 """Document conversion functionality."""
 
+import functools
 import logging
+import os
 import platform
+import shutil
+import socket
+import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 from pdf_combiner.exceptions import ConversionError, DependencyError
 from pdf_combiner.models import DocumentInfo, DocumentType
@@ -13,6 +19,137 @@ from pdf_combiner.utils import run_command, ensure_dependencies
 
 logger = logging.getLogger(__name__)
 
+# How long a LibreOffice availability check is reused, in seconds
+_LIBREOFFICE_CHECK_TTL = 60.0
+_libreoffice_check: Optional[Tuple[float, bool]] = None
+
+
+def _libreoffice_available() -> bool:
+    """Return whether LibreOffice is installed.
+    
+    The result is reused for _LIBREOFFICE_CHECK_TTL seconds, so building
+    several converters doesn't probe $PATH each time.
+    """
+    global _libreoffice_check
+    now = time.monotonic()
+    if _libreoffice_check and now - _libreoffice_check[0] < _LIBREOFFICE_CHECK_TTL:
+        return _libreoffice_check[1]
+    
+    try:
+        ensure_dependencies(["libreoffice"])
+        available = True
+    except DependencyError:
+        available = False
+    
+    _libreoffice_check = (now, available)
+    return available
+
+
+class LibreOfficeServer:
+    """A headless LibreOffice kept running to convert documents via unoconv.
+    
+    Each one-shot ``libreoffice --convert-to`` run pays LibreOffice's
+    start-up of a second or two. The server pays it once; conversions
+    are then sent to it with ``unoconv``.
+    """
+    
+    HOST = "127.0.0.1"
+    
+    def __init__(self, startup_timeout: float = 30.0):
+        """Initialize the server (it isn't started until start()).
+        
+        Args:
+            startup_timeout: Seconds to wait for LibreOffice to accept connections
+        """
+        self.startup_timeout = startup_timeout
+        self.port: Optional[int] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._profile: Optional[tempfile.TemporaryDirectory] = None
+    
+    @staticmethod
+    def available() -> bool:
+        """Return whether soffice and unoconv are installed (Linux only)."""
+        return platform.system() == "Linux" and bool(shutil.which("soffice") and shutil.which("unoconv"))
+    
+    @property
+    def running(self) -> bool:
+        """Whether the server has started and is still alive."""
+        return self.port is not None and self._process is not None and self._process.poll() is None
+    
+    def start(self) -> bool:
+        """Start LibreOffice and wait until it accepts connections.
+        
+        Returns:
+            True if the server is running, False if it couldn't be started
+        """
+        if self.running:
+            return True
+        if not self.available():
+            return False
+        
+        # Let the OS pick a free port
+        with socket.socket() as sock:
+            sock.bind((self.HOST, 0))
+            port = sock.getsockname()[1]
+        
+        # A private profile keeps the server from locking the user's default one
+        self._profile = tempfile.TemporaryDirectory(prefix="pdf_combiner_uno_")
+        self._process = subprocess.Popen(
+            [
+                "soffice", "--headless", "--nologo", "--nofirststartwizard", "--norestore",
+                f"-env:UserInstallation={Path(self._profile.name).as_uri()}",
+                f"--accept=socket,host={self.HOST},port={port};urp;StarOffice.ServiceManager",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        
+        deadline = time.monotonic() + self.startup_timeout
+        while self._process.poll() is None and time.monotonic() < deadline:
+            try:
+                socket.create_connection((self.HOST, port), timeout=1).close()
+                self.port = port
+                logger.debug(f"LibreOffice server listening on {self.HOST}:{port}")
+                return True
+            except OSError:
+                time.sleep(0.2)
+        
+        logger.warning("LibreOffice server did not start. Using one-shot LibreOffice runs.")
+        self.close()
+        return False
+    
+    def command(self, input_paths: List[Path], output_dir: Path) -> List[str]:
+        """Build the unoconv command converting input_paths into output_dir."""
+        return [
+            "unoconv",
+            "-s", self.HOST,
+            "-p", str(self.port),
+            "-f", "pdf",
+            "-o", str(output_dir),
+            *(str(path) for path in input_paths)
+        ]
+    
+    def close(self) -> None:
+        """Stop LibreOffice and remove its profile."""
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        self.port = None
+        if self._profile is not None:
+            self._profile.cleanup()
+            self._profile = None
+    
+    def __enter__(self) -> "LibreOfficeServer":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
 
 class DocumentConverter:
     """Handles conversion of various document formats to PDF."""
@@ -24,15 +161,14 @@ class DocumentConverter:
             temp_dir: Optional temporary directory for conversions
         """
         self.temp_dir = temp_dir
+        # Set by BatchConverter while a persistent LibreOffice is running
+        self.server: Optional[LibreOfficeServer] = None
         self._check_dependencies()
     
     def _check_dependencies(self) -> None:
         """Check for required conversion dependencies."""
-        if platform.system() == "Linux":
-            try:
-                ensure_dependencies(["libreoffice"])
-            except DependencyError:
-                logger.warning("LibreOffice not found. DOC/DOCX conversion will fail.")
+        if platform.system() == "Linux" and not _libreoffice_available():
+            logger.warning("LibreOffice not found. DOC/DOCX conversion will fail.")
     
     def convert_to_pdf(self, document: DocumentInfo, output_dir: Optional[Path] = None) -> Path:
         """Convert a document to PDF format.
@@ -86,6 +222,44 @@ class DocumentConverter:
         else:
             return self._convert_with_libreoffice(document.path, output_dir)
     
+    def convert_office_batch(self, documents: list[DocumentInfo], output_dir: Optional[Path] = None) -> dict[str, Path]:
+        """Convert several DOC/DOCX files with as few LibreOffice runs as possible.
+        
+        Each LibreOffice start takes a second or two, so the files are passed
+        to a single headless run. Files that share a name stem would overwrite
+        each other in the output directory, so they go to later runs.
+        
+        Args:
+            documents: DOC/DOCX documents to convert
+            output_dir: Optional output directory
+            
+        Returns:
+            Dictionary mapping original paths to converted PDF paths
+            
+        Raises:
+            ConversionError: If conversion fails
+        """
+        if output_dir is None:
+            output_dir = self.temp_dir or Path(tempfile.gettempdir())
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Split into runs with unique stems
+        runs: list[list[Path]] = []
+        for doc in documents:
+            for run in runs:
+                if all(path.stem != doc.path.stem for path in run):
+                    run.append(doc.path)
+                    break
+            else:
+                runs.append([doc.path])
+        
+        results = {}
+        for run in runs:
+            logger.info(f"Converting {len(run)} document(s) to PDF...")
+            results.update(self._convert_batch_with_libreoffice(run, output_dir))
+        return results
+    
     def _convert_with_docx2pdf(self, input_path: Path, output_path: Path) -> Path:
         """Convert using docx2pdf (Windows/macOS).
         
@@ -127,6 +301,22 @@ class DocumentConverter:
                 target_format="pdf"
             )
     
+    def _libreoffice_command(self, input_paths: List[Path], output_dir: Path) -> List[str]:
+        """Build the command converting input_paths to PDFs in output_dir.
+        
+        Uses the persistent server when one is running, otherwise a
+        one-shot headless LibreOffice.
+        """
+        if self.server is not None and self.server.running:
+            return self.server.command(input_paths, output_dir)
+        return [
+            "libreoffice",
+            "--headless",
+            "--convert-to", "pdf",
+            "--outdir", str(output_dir),
+            *(str(path) for path in input_paths)
+        ]
+    
     def _convert_with_libreoffice(self, input_path: Path, output_dir: Path) -> Path:
         """Convert using LibreOffice (Linux).
         
@@ -140,13 +330,7 @@ class DocumentConverter:
         Raises:
             ConversionError: If conversion fails
         """
-        cmd = [
-            "libreoffice",
-            "--headless",
-            "--convert-to", "pdf",
-            "--outdir", str(output_dir),
-            str(input_path)
-        ]
+        cmd = self._libreoffice_command([input_path], output_dir)
         
         try:
             result = run_command(cmd, timeout=120)
@@ -156,9 +340,14 @@ class DocumentConverter:
             
             if not output_path.exists():
                 # Check if LibreOffice put it somewhere else
-                possible_paths = list(output_dir.glob(f"{input_path.stem}*.pdf"))
-                if possible_paths:
-                    output_path = possible_paths[0]
+                with os.scandir(output_dir) as entries:
+                    found = next(
+                        (Path(entry.path) for entry in entries
+                         if entry.name.startswith(input_path.stem) and entry.name.endswith(".pdf")),
+                        None
+                    )
+                if found:
+                    output_path = found
                 else:
                     raise ConversionError(
                         f"Conversion produced no output file",
@@ -180,20 +369,94 @@ class DocumentConverter:
                 source_file=str(input_path),
                 target_format="pdf"
             )
+    
+    def _convert_batch_with_libreoffice(
+        self, input_paths: list[Path], output_dir: Path
+    ) -> dict[str, Path]:
+        """Convert several files in one LibreOffice run (Linux).
+        
+        Args:
+            input_paths: Input document paths, with unique name stems
+            output_dir: Output directory
+            
+        Returns:
+            Dictionary mapping input paths to converted PDF paths
+            
+        Raises:
+            ConversionError: If conversion fails or a file produced no output
+        """
+        cmd = self._libreoffice_command(input_paths, output_dir)
+        
+        try:
+            run_command(cmd, timeout=120 * len(input_paths))
+        except FileNotFoundError:
+            raise DependencyError(
+                "libreoffice",
+                "sudo apt-get install libreoffice"
+            )
+        except Exception as e:
+            raise ConversionError(
+                f"LibreOffice conversion failed: {e}",
+                source_file=str(input_paths[0]),
+                target_format="pdf"
+            )
+        
+        results = {}
+        for input_path in input_paths:
+            output_path = output_dir / f"{input_path.stem}.pdf"
+            if not output_path.exists():
+                raise ConversionError(
+                    "Conversion produced no output file",
+                    source_file=str(input_path),
+                    target_format="pdf"
+                )
+            logger.debug(f"Successfully converted {input_path.name} to PDF")
+            results[str(input_path)] = output_path
+        return results
 
 
 class BatchConverter:
-    """Handles batch conversion of multiple documents."""
+    """Handles batch conversion of multiple documents.
+    
+    Used as a context manager, it keeps one LibreOffice running (when
+    soffice and unoconv are installed) for every convert_documents call
+    inside the block::
+    
+        with BatchConverter() as batch:
+            for documents in groups:
+                batch.convert_documents(documents, output_dir)
+    """
     
-    def __init__(self, converter: Optional[DocumentConverter] = None, max_workers: int = 4):
+    def __init__(self, converter: Optional[DocumentConverter] = None, max_workers: int = 4,
+                 temp_dir: Optional[Path] = None):
         """Initialize batch converter.
         
         Args:
-            converter: Document converter instance (creates one if not provided)
+            converter: Document converter instance (created on first use if not provided)
             max_workers: Maximum parallel conversion workers
+            temp_dir: Temporary directory for a converter created on first use
         """
-        self.converter = converter or DocumentConverter()
+        if converter is not None:
+            self.converter = converter
         self.max_workers = max_workers
+        self.temp_dir = temp_dir
+        self._server: Optional[LibreOfficeServer] = None
+    
+    @functools.cached_property
+    def converter(self) -> DocumentConverter:
+        """Document converter, created only when a document needs converting."""
+        return DocumentConverter(temp_dir=self.temp_dir)
+    
+    def __enter__(self) -> "BatchConverter":
+        self._server = LibreOfficeServer()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            if "converter" in self.__dict__:
+                self.converter.server = None
     
     def convert_documents(self, documents: list[DocumentInfo], output_dir: Optional[Path] = None) -> dict[str, Path]:
         """Convert multiple documents to PDF.
@@ -216,7 +479,20 @@ class BatchConverter:
             results[str(doc.path)] = doc.path
         
         # Convert other formats
-        if len(to_convert) <= 3 or self.max_workers == 1:
+        if to_convert and platform.system() not in ["Windows", "Darwin"]:
+            # LibreOffice converts many files per run, so start it once;
+            # inside a with block the server is started on first use and reused
+            if self._server is not None and self.converter.server is None:
+                if self._server.start():
+                    self.converter.server = self._server
+                else:
+                    self._server = None
+            try:
+                results.update(self.converter.convert_office_batch(to_convert, output_dir))
+            except ConversionError as e:
+                logger.error(f"Failed to convert documents: {e}")
+                raise
+        elif len(to_convert) <= 3 or self.max_workers == 1:
             # Serial conversion for small batches
             for doc in to_convert:
                 try:
@@ -242,6 +518,9 @@ class BatchConverter:
                         results[str(doc.path)] = converted_path
                     except Exception as e:
                         logger.error(f"Failed to convert {doc.name}: {e}")
+                        # Don't start conversions whose results will be discarded
+                        for pending in future_to_doc:
+                            pending.cancel()
                         raise ConversionError(
                             f"Batch conversion failed for {doc.name}: {e}",
                             source_file=str(doc.path),
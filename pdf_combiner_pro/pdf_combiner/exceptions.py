@@ -1,10 +1,23 @@
 """Custom exceptions for the PDF Combiner package."""
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple, Type
+
+
+def _new_error(cls: Type["PDFCombinerError"], args: tuple) -> "PDFCombinerError":
+    """Recreate an exception without calling __init__ (used by pickle)."""
+    error = cls.__new__(cls)
+    error.args = args
+    return error
 
 
 class PDFCombinerError(Exception):
-    """Base exception for all PDF Combiner errors."""
+    """Base exception for all PDF Combiner errors.
+
+    Subclasses store their fields in slots and only build the details
+    dictionary when it is read.
+    """
+
+    __slots__ = ("message", "_details")
 
     def __init__(self, message: str, details: Optional[dict] = None) -> None:
         """Initialize the exception with a message and optional details.
@@ -15,12 +28,38 @@ class PDFCombinerError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self._details = details
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Additional error details."""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        self._details = value
+
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the details dictionary from the subclass fields."""
+        return {}
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Type["PDFCombinerError"], tuple], Dict[str, Any]]:
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return _new_error, (type(self), self.args), state
 
 
 class ValidationError(PDFCombinerError):
     """Raised when input validation fails."""
 
+    __slots__ = ("field", "value")
+
     def __init__(self, message: str, field: Optional[str] = None, value: Optional[str] = None) -> None:
         """Initialize validation error.
         
@@ -29,17 +68,46 @@ class ValidationError(PDFCombinerError):
             field: The field that failed validation
             value: The invalid value
         """
+        super().__init__(message)
+        self.field = field
+        self.value = value
+
+    def _build_details(self) -> Dict[str, Any]:
+        details = {}
+        if self.field:
+            details["field"] = self.field
+        if self.value:
+            details["value"] = self.value
+        return details
+
+
+class ConfigurationError(PDFCombinerError, ValueError):
+    """Raised when a configuration file or value is invalid."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, message: str, key: Optional[str] = None) -> None:
+        """Initialize configuration error.
+        
+        Args:
+            message: The error message
+            key: The offending setting, as section.field
+        """
+        super().__init__(message)
+        self.key = key
+
+    def _build_details(self) -> Dict[str, Any]:
         details = {}
-        if field:
-            details["field"] = field
-        if value:
-            details["value"] = value
-        super().__init__(message, details)
+        if self.key:
+            details["key"] = self.key
+        return details
 
 
 class ConversionError(PDFCombinerError):
     """Raised when document conversion fails."""
 
+    __slots__ = ("source_file", "target_format")
+
     def __init__(self, message: str, source_file: Optional[str] = None, 
                  target_format: Optional[str] = None) -> None:
         """Initialize conversion error.
@@ -49,17 +117,24 @@ class ConversionError(PDFCombinerError):
             source_file: The file that failed to convert
             target_format: The target format for conversion
         """
+        super().__init__(message)
+        self.source_file = source_file
+        self.target_format = target_format
+
+    def _build_details(self) -> Dict[str, Any]:
         details = {}
-        if source_file:
-            details["source_file"] = source_file
-        if target_format:
-            details["target_format"] = target_format
-        super().__init__(message, details)
+        if self.source_file:
+            details["source_file"] = self.source_file
+        if self.target_format:
+            details["target_format"] = self.target_format
+        return details
 
 
 class OCRError(PDFCombinerError):
     """Raised when OCR processing fails."""
 
+    __slots__ = ("pdf_file", "ocr_engine")
+
     def __init__(self, message: str, pdf_file: Optional[str] = None, 
                  ocr_engine: str = "ocrmypdf") -> None:
         """Initialize OCR error.
@@ -69,15 +144,22 @@ class OCRError(PDFCombinerError):
             pdf_file: The PDF file that failed OCR
             ocr_engine: The OCR engine being used
         """
-        details = {"ocr_engine": ocr_engine}
-        if pdf_file:
-            details["pdf_file"] = pdf_file
-        super().__init__(message, details)
+        super().__init__(message)
+        self.pdf_file = pdf_file
+        self.ocr_engine = ocr_engine
+
+    def _build_details(self) -> Dict[str, Any]:
+        details = {"ocr_engine": self.ocr_engine}
+        if self.pdf_file:
+            details["pdf_file"] = self.pdf_file
+        return details
 
 
 class FileReadError(PDFCombinerError):
     """Raised when a file cannot be read."""
 
+    __slots__ = ("file_path",)
+
     def __init__(self, message: str, file_path: str) -> None:
         """Initialize file read error.
         
@@ -85,12 +167,18 @@ class FileReadError(PDFCombinerError):
             message: The error message
             file_path: The file that couldn't be read
         """
-        super().__init__(message, {"file_path": file_path})
+        super().__init__(message)
+        self.file_path = file_path
+
+    def _build_details(self) -> Dict[str, Any]:
+        return {"file_path": self.file_path}
 
 
 class MergeError(PDFCombinerError):
     """Raised when PDF merging fails."""
 
+    __slots__ = ("failed_files",)
+
     def __init__(self, message: str, failed_files: Optional[List[str]] = None) -> None:
         """Initialize merge error.
         
@@ -98,15 +186,21 @@ class MergeError(PDFCombinerError):
             message: The error message
             failed_files: List of files that failed to merge
         """
+        super().__init__(message)
+        self.failed_files = failed_files
+
+    def _build_details(self) -> Dict[str, Any]:
         details = {}
-        if failed_files:
-            details["failed_files"] = failed_files
-        super().__init__(message, details)
+        if self.failed_files:
+            details["failed_files"] = self.failed_files
+        return details
 
 
 class DependencyError(PDFCombinerError):
     """Raised when a required system dependency is missing."""
 
+    __slots__ = ("dependency", "install_command")
+
     def __init__(self, dependency: str, install_command: Optional[str] = None) -> None:
         """Initialize dependency error.
         
@@ -115,8 +209,14 @@ class DependencyError(PDFCombinerError):
             install_command: Command to install the dependency
         """
         message = f"Required dependency '{dependency}' is not installed"
-        details = {"dependency": dependency}
         if install_command:
             message += f". Install with: {install_command}"
-            details["install_command"] = install_command
-        super().__init__(message, details)
\ No newline at end of file
+        super().__init__(message)
+        self.dependency = dependency
+        self.install_command = install_command
+
+    def _build_details(self) -> Dict[str, Any]:
+        details = {"dependency": self.dependency}
+        if self.install_command:
+            details["install_command"] = self.install_command
+        return details
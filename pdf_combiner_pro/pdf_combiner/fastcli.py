@@ -0,0 +1,112 @@
+"""Lightweight argparse front end for scripted use.
+
+Mirrors the ``combine``, ``verify`` and ``check-deps`` commands of the
+click CLI, but without importing click, so repeated invocations from
+scripts and hooks start faster. Run with ``python -m pdf_combiner.fastcli``.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from pdf_combiner.__version__ import __version__
+from pdf_combiner.commands import run_check_deps, run_combine, run_verify
+
+
+def _existing_dir(value: str) -> Path:
+    """argparse type for an existing directory."""
+    path = Path(value)
+    if not path.is_dir():
+        raise argparse.ArgumentTypeError(f"Directory '{value}' does not exist.")
+    return path
+
+
+def _existing_file(value: str) -> Path:
+    """argparse type for an existing file."""
+    path = Path(value)
+    if not path.is_file():
+        raise argparse.ArgumentTypeError(f"File '{value}' does not exist.")
+    return path
+
+
+def _worker_count(value: str) -> int:
+    """argparse type for the --workers range accepted by the click CLI."""
+    count = int(value)
+    if not 1 <= count <= 16:
+        raise argparse.ArgumentTypeError(f"{count} is not in the range 1<=x<=16.")
+    return count
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="pdf-combiner",
+        description="PDF Combiner Pro - Merge PDFs, DOCs, and DOCX files with OCR support.",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"pdf-combiner, version {__version__}"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    combine = subparsers.add_parser(
+        "combine", help="Combine documents from a directory into a single PDF"
+    )
+    combine.add_argument("directory", type=_existing_dir)
+    combine.add_argument("-o", "--output", type=Path, default=Path.cwd() / "combined.pdf",
+                         help="Output PDF file path")
+    combine.add_argument("--check", action="store_true",
+                         help="Only check files without combining")
+    combine.add_argument("-r", "--recursive", action="store_true",
+                         help="Scan subdirectories recursively")
+    combine.add_argument("--config", type=_existing_file, help="Configuration file path")
+    combine.add_argument("--skip-ocr", action="store_true", help="Skip OCR processing")
+    combine.add_argument("--ocr-language", default="eng", help="OCR language (e.g., eng, deu, fra)")
+    combine.add_argument("--overwrite", action="store_true",
+                         help="Overwrite existing output file")
+    combine.add_argument(
+        "-w", "--workers", type=_worker_count, default=None,
+        help="Parallel workers (default: configured value, capped at the CPU count)",
+    )
+    combine.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
+
+    verify = subparsers.add_parser(
+        "verify", help="Verify that a combined PDF contains all files from source directory"
+    )
+    verify.add_argument("pdf_file", type=_existing_file)
+    verify.add_argument("source_dir", type=_existing_dir)
+    verify.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
+
+    subparsers.add_parser("check-deps", help="Check system dependencies")
+
+    return parser
+
+
+_PARSER = _build_parser()
+
+_COMMANDS = {
+    "combine": lambda args: run_combine(
+        directory=args.directory,
+        output=args.output,
+        check=args.check,
+        recursive=args.recursive,
+        config=args.config,
+        skip_ocr=args.skip_ocr,
+        ocr_language=args.ocr_language,
+        overwrite=args.overwrite,
+        workers=args.workers,
+        verbose=args.verbose,
+    ),
+    "verify": lambda args: run_verify(args.pdf_file, args.source_dir, args.verbose),
+    "check-deps": lambda args: run_check_deps(),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point."""
+    args = _PARSER.parse_args(argv)
+    _COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,20 +1,30 @@
 """Core PDF merging functionality."""
 
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
 import tempfile
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, cast
 
-from PyPDF2 import PdfReader, PdfMerger as PyPDF2Merger
+import pikepdf
+from PyPDF2 import PdfReader
 from PyPDF2.errors import PdfReadError
+from PyPDF2.generic import DictionaryObject, NumberObject
 
 from pdf_combiner.config import Config, ProcessingConfig
 from pdf_combiner.converters import BatchConverter, DocumentConverter
 from pdf_combiner.exceptions import MergeError, ValidationError
 from pdf_combiner.models import (
     DocumentInfo,
+    DocumentType,
+    OCRStatus,
     ProcessingOptions,
     ProcessingResult,
     ProcessingStatus,
@@ -27,6 +37,251 @@ from pdf_combiner.validators import validate_directory, validate_output_path, va
 
 logger = logging.getLogger(__name__)
 
+# check_directory inspects PDFs in worker processes from this many files on
+PROCESS_POOL_MIN_FILES = 4
+
+# Separator between file names in the merged PDF's /Subject
+_SUBJECT_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
+# Sources held open by _merge_pdfs before the merge is spilled to disk
+MERGE_OPEN_SOURCES = 64
+
+# /Info keys holding JSON source page signatures and whole-file digests
+PAGE_HASHES_KEY = "/PDFCombinerPageHashes"
+FILE_HASHES_KEY = "/PDFCombinerFileHashes"
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash a whole file with SHA-256.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return str(hashlib.file_digest(f, "sha256").hexdigest())
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _page_hashes(reader: PdfReader) -> List[str]:
+    """Compute a short SHA-256 signature of each page's content stream.
+    
+    Args:
+        reader: Open PDF reader
+        
+    Returns:
+        One 16-character hex digest per page
+    """
+    hashes = []
+    for page in reader.pages:
+        contents = page.get_contents()
+        data = contents.get_data() if contents is not None else b""
+        hashes.append(hashlib.sha256(data).hexdigest()[:16])
+    return hashes
+
+
+def _group_by_content(
+    paths: List[Path],
+    digests: Optional[Dict[Path, str]] = None
+) -> Dict[Path, Path]:
+    """Map each file to the first file with byte-identical contents.
+    
+    Files that can't be read map to themselves.
+    
+    Args:
+        paths: Files to compare
+        digests: Optional SHA-256 cache, read and filled in place
+        
+    Returns:
+        Dictionary mapping every path to its representative path
+    """
+    if digests is None:
+        digests = {}
+    first_by_digest: Dict[str, Path] = {}
+    representatives = {}
+    for path in paths:
+        digest = digests.get(path)
+        if digest is None:
+            try:
+                digest = digests[path] = _file_sha256(path)
+            except OSError:
+                representatives[path] = path
+                continue
+        representatives[path] = first_by_digest.setdefault(digest, path)
+    return representatives
+
+
+def _source_signatures(path: Path, file_hash: Optional[str] = None) -> Tuple[List[str], str]:
+    """Compute the page signatures and file digest stored for a source PDF.
+    
+    Args:
+        path: Original PDF file
+        file_hash: SHA-256 of the file if it was already computed
+        
+    Returns:
+        Tuple of (page hashes, file SHA-256)
+    """
+    with open(path, "rb") as f:
+        page_hashes = _page_hashes(PdfReader(f))
+    return page_hashes, file_hash or _file_sha256(path)
+
+
+def _spill_merged(merged: pikepdf.Pdf, sources: List[pikepdf.Pdf], temp_dir: Path) -> pikepdf.Pdf:
+    """Save a partial merge and reopen it so its sources can be closed.
+    
+    Args:
+        merged: Merge in progress; closed by this call
+        sources: Open source PDFs copied into *merged*; closed and cleared
+        temp_dir: Directory for the spill file
+    
+    Returns:
+        The partial merge reopened from the spill file
+    """
+    fd, spill = tempfile.mkstemp(suffix=".pdf", dir=temp_dir)
+    os.close(fd)
+    merged.save(spill, linearize=False)
+    previous = Path(merged.filename)
+    merged.close()
+    for source in sources:
+        source.close()
+    sources.clear()
+    # An earlier spill is fully copied into the new one
+    if previous.parent == temp_dir:
+        previous.unlink()
+    return pikepdf.open(spill)
+
+
+def _trailer_page_count(reader: PdfReader) -> int:
+    """Read the page count recorded in an open PDF's page tree root.
+    
+    Args:
+        reader: Open PDF reader
+        
+    Returns:
+        /Count of the /Root /Pages node
+    """
+    root = cast(DictionaryObject, reader.trailer["/Root"])
+    pages = cast(DictionaryObject, root["/Pages"])
+    return int(cast(NumberObject, pages["/Count"]))
+
+
+def _read_page_count(path: Path) -> int:
+    """Read a PDF's page count from its trailer without loading the file.
+    
+    PdfReader keeps an open file handle seekable instead of slurping the
+    whole document into memory, so only the xref table, trailer and the
+    /Root/Pages node are actually read from disk.
+    
+    Args:
+        path: Path to PDF file
+        
+    Returns:
+        Page count recorded in the page tree root
+    """
+    with open(path, "rb") as f:
+        return _trailer_page_count(PdfReader(f))
+
+
+def _has_text(reader: PdfReader) -> bool:
+    """Probe the first and last page for a text layer.
+    
+    Scanned PDFs have no text anywhere, so two pages are enough to tell
+    them apart from born-digital ones.
+    
+    Args:
+        reader: Open PDF reader
+        
+    Returns:
+        True if either page has extractable text
+    """
+    pages = reader.pages
+    if not len(pages):
+        return False
+    if pages[0].extract_text().strip():
+        return True
+    return len(pages) > 1 and bool(pages[-1].extract_text().strip())
+
+
+@functools.lru_cache(maxsize=None)
+def _fitz() -> Any:
+    """Return the PyMuPDF module, or None if it isn't installed."""
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz  # PyMuPDF < 1.24
+        except ImportError:
+            return None
+        return fitz
+    return pymupdf
+
+
+def _inspect_pdf(path: Path) -> Tuple[Optional[int], Optional[bool], Optional[str]]:
+    """Read a PDF's page count and whether it has a text layer.
+    
+    Uses PyMuPDF's C text extractor when installed, and PyPDF2 otherwise
+    or for files PyMuPDF can't open. Top-level so check_directory can
+    run it in worker processes.
+    
+    Args:
+        path: Path to PDF file
+        
+    Returns:
+        Tuple of (page_count, has_text, error_message); the first two are
+        None and error_message is set if the PDF can't be parsed
+    """
+    fitz = _fitz()
+    if fitz is not None:
+        try:
+            with fitz.open(path) as doc:
+                # First and last page, as in _has_text
+                pages = sorted({0, doc.page_count - 1}) if doc.page_count else []
+                return doc.page_count, any(doc.load_page(i).get_text().strip() for i in pages), None
+        except fitz.FileDataError:
+            pass
+    
+    try:
+        with open(path, "rb") as f:
+            reader = PdfReader(f)
+            return len(reader.pages), _has_text(reader), None
+    except PdfReadError as e:
+        return None, None, f"Corrupted PDF: {e}"
+
+
+def _prefetch_tails(paths: List[Path], tail_size: int = 8192) -> None:
+    """Queue kernel readahead for the trailer region of each PDF.
+    
+    The hints are issued for the whole batch before any file is parsed,
+    so the tail reads overlap in the IO queue instead of each thread
+    blocking on its own seek. This is a no-op where posix_fadvise is
+    unavailable.
+    
+    Args:
+        paths: PDF files about to be scanned
+        tail_size: Number of bytes at the end of each file to prefetch
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            size = os.fstat(fd).st_size
+            os.posix_fadvise(fd, max(size - tail_size, 0), tail_size, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
 
 class PDFMerger:
     """Main class for merging PDFs with conversion and OCR support."""
@@ -40,29 +295,38 @@ class PDFMerger:
         self.config = config or Config()
         self._temp_dir: Optional[Path] = None
         
-        # Initialize processors
-        self.converter = DocumentConverter(temp_dir=self.config.get_temp_dir())
+        # Initialize processors (the document converter is created on first
+        # use, so PDF-only merges skip its dependency check)
         self.batch_converter = BatchConverter(
-            self.converter,
-            max_workers=self.config.processing.max_workers
+            max_workers=self.config.processing.max_workers,
+            temp_dir=self.config.get_temp_dir()
         )
         
         if self.config.ocr.enabled:
+            # OCR is resource-intensive: at most two PDFs at a time, with
+            # ocrmypdf spreading each one's pages over the remaining workers
+            ocr_workers = min(2, self.config.processing.max_workers)
             self.ocr_processor = OCRProcessor(
                 language=self.config.ocr.language,
                 dpi=self.config.ocr.dpi,
                 skip_text_pages=self.config.ocr.skip_text_pages,
                 timeout=self.config.ocr.timeout,
-                extra_args=self.config.ocr.extra_args
+                extra_args=self.config.ocr.extra_args,
+                jobs=max(1, self.config.processing.max_workers // ocr_workers)
             )
             self.batch_ocr = BatchOCRProcessor(
                 self.ocr_processor,
-                max_workers=min(2, self.config.processing.max_workers)  # OCR is resource-intensive
+                max_workers=ocr_workers
             )
         else:
             self.ocr_processor = None
             self.batch_ocr = None
     
+    @property
+    def converter(self) -> DocumentConverter:
+        """Document converter used for DOC/DOCX files."""
+        return self.batch_converter.converter
+    
     def merge_directory(
         self,
         directory: Path,
@@ -155,23 +419,30 @@ class PDFMerger:
             documents=documents
         )
         
-        # Process in temp directory
-        with tempfile.TemporaryDirectory(dir=options.temp_dir) as temp_dir:
+        # Process in temp directory; the batch converter keeps one LibreOffice
+        # running for the whole merge once a document needs converting
+        with tempfile.TemporaryDirectory(dir=options.temp_dir) as temp_dir, self.batch_converter:
             temp_path = Path(temp_dir)
             
+            # File digests are shared by the duplicate checks and the
+            # metadata signatures so each source is hashed at most once
+            digests: Dict[Path, str] = {}
+            
             try:
                 # Step 1: Convert non-PDF documents
                 logger.info("Converting documents to PDF...")
-                pdf_paths = self._convert_documents(documents, temp_path, result)
+                pdf_paths = self._convert_documents(documents, temp_path, result, digests)
                 
                 # Step 2: OCR processing if enabled
                 if options.enable_ocr and self.batch_ocr:
                     logger.info("Processing PDFs with OCR...")
-                    pdf_paths = self._ocr_documents(documents, pdf_paths, temp_path, result)
+                    pdf_paths = self._ocr_documents(documents, pdf_paths, temp_path, result, digests)
                 
                 # Step 3: Merge PDFs
                 logger.info("Merging PDFs...")
-                self._merge_pdfs(pdf_paths, output_path, documents, options, result)
+                self._merge_pdfs(
+                    pdf_paths, output_path, temp_path, documents, options, result, digests
+                )
                 
             except Exception as e:
                 logger.error(f"Merge failed: {e}")
@@ -188,19 +459,32 @@ class PDFMerger:
         self,
         documents: List[DocumentInfo],
         temp_dir: Path,
-        result: ProcessingResult
-    ) -> Dict[str, Path]:
+        result: ProcessingResult,
+        digests: Optional[Dict[Path, str]] = None
+    ) -> Dict[Path, Path]:
         """Convert documents to PDF format.
         
         Returns:
             Dictionary mapping original paths to PDF paths
         """
         try:
-            pdf_paths = self.batch_converter.convert_documents(documents, temp_dir)
+            # Duplicate DOC/DOCX files (copies, symlinks) are converted once
+            to_convert = [doc.path for doc in documents if doc.type != DocumentType.PDF]
+            representative = _group_by_content(to_convert, digests) if len(to_convert) > 1 else {}
+            unique_documents = [doc for doc in documents if representative.get(doc.path, doc.path) == doc.path]
+            
+            # The public API is keyed by str; the merge steps key by Path
+            converted = self.batch_converter.convert_documents(unique_documents, temp_dir)
+            pdf_paths = {Path(path): pdf_path for path, pdf_path in converted.items()}
+            
+            for path, first in representative.items():
+                if path != first and first in pdf_paths:
+                    logger.debug(f"{path.name} is identical to {first.name}, reusing its conversion")
+                    pdf_paths[path] = pdf_paths[first]
             
             # Update document statuses
             for doc in documents:
-                if str(doc.path) in pdf_paths:
+                if doc.path in pdf_paths:
                     doc.status = ProcessingStatus.PROCESSING
                 else:
                     doc.status = ProcessingStatus.FAILED
@@ -219,10 +503,11 @@ class PDFMerger:
     def _ocr_documents(
         self,
         documents: List[DocumentInfo],
-        pdf_paths: Dict[str, Path],
+        pdf_paths: Dict[Path, Path],
         temp_dir: Path,
-        result: ProcessingResult
-    ) -> Dict[str, Path]:
+        result: ProcessingResult,
+        digests: Optional[Dict[Path, str]] = None
+    ) -> Dict[Path, Path]:
         """Process PDFs with OCR.
         
         Returns:
@@ -231,28 +516,53 @@ class PDFMerger:
         try:
             # Get PDF documents
             pdf_docs = []
+            now = datetime.now()
             for doc in documents:
-                if str(doc.path) in pdf_paths:
-                    # Create a temporary DocumentInfo for the converted PDF
-                    pdf_path = pdf_paths[str(doc.path)]
-                    temp_doc = DocumentInfo(
+                # Text already detected by check_directory: nothing to OCR
+                if doc.has_text and self.config.ocr.skip_text_pages:
+                    doc.ocr_status = OCRStatus.NOT_NEEDED
+                    continue
+                if doc.path in pdf_paths:
+                    # Create a temporary DocumentInfo for the converted PDF.
+                    # The path was just produced by conversion, so skip model
+                    # validation (and its exists/is_file stats); original PDFs
+                    # reuse the size already read by get_file_info.
+                    pdf_path = pdf_paths[doc.path]
+                    size_bytes = doc.size_bytes if pdf_path == doc.path else os.stat(pdf_path).st_size
+                    temp_doc = DocumentInfo.model_construct(
                         path=pdf_path,
                         name=pdf_path.name,
                         type=doc.type,
-                        size_bytes=pdf_path.stat().st_size,
-                        created_at=datetime.now(),
-                        modified_at=datetime.now()
+                        size_bytes=size_bytes,
+                        created_at=now,
+                        modified_at=now
                     )
                     pdf_docs.append(temp_doc)
             
+            # OCR each distinct PDF once: duplicates of a converted file
+            # share its path, and identical source PDFs share a digest
+            ocr_paths = list(dict.fromkeys(temp_doc.path for temp_doc in pdf_docs))
+            representative = _group_by_content(ocr_paths, digests) if len(ocr_paths) > 1 else {}
+            seen = set()
+            unique_docs = []
+            for temp_doc in pdf_docs:
+                first = representative.get(temp_doc.path, temp_doc.path)
+                if first == temp_doc.path and first not in seen:
+                    seen.add(first)
+                    unique_docs.append(temp_doc)
+            
             # Process with OCR
-            ocr_results = self.batch_ocr.process_documents(pdf_docs, temp_dir)
+            ocr_results = {
+                Path(path): pdf_path
+                for path, pdf_path in self.batch_ocr.process_documents(unique_docs, temp_dir).items()
+            }
             
             # Update paths with OCR results
             updated_paths = {}
             for orig_path, pdf_path in pdf_paths.items():
-                if str(pdf_path) in ocr_results:
-                    updated_paths[orig_path] = ocr_results[str(pdf_path)]
+                key = representative.get(pdf_path, pdf_path)
+                if key in ocr_results:
+                    updated_paths[orig_path] = ocr_results[key]
                 else:
                     updated_paths[orig_path] = pdf_path
             
@@ -265,36 +575,85 @@ class PDFMerger:
     
     def _merge_pdfs(
         self,
-        pdf_paths: Dict[str, Path],
+        pdf_paths: Dict[Path, Path],
         output_path: Path,
+        temp_dir: Path,
         documents: List[DocumentInfo],
         options: ProcessingOptions,
-        result: ProcessingResult
+        result: ProcessingResult,
+        digests: Optional[Dict[Path, str]] = None
     ) -> None:
-        """Merge PDFs into final output file."""
-        merger = PyPDF2Merger()
-        processed_files = []
+        """Merge PDFs into final output file.
+        
+        Pages are copied with pikepdf (qpdf), which reads each source once
+        and gives the page count from the same open handle. qpdf copies
+        page streams lazily, so sources stay open until the merge is
+        saved; every MERGE_OPEN_SOURCES sources it is spilled to a file
+        in *temp_dir* and reopened, which bounds the open descriptors.
+        File digests already in *digests* are reused for the metadata
+        signatures.
+        """
+        digests = digests or {}
         
+        processed_files: List[str] = []
+        page_hashes: List[str] = []
+        file_hashes: Dict[str, str] = {}
+        
+        # Hash the original PDFs in parallel; the merge below stays in order
+        signature_paths = [
+            doc.path for doc in documents
+            if options.add_metadata and doc.type.value == "pdf" and doc.path in pdf_paths
+        ]
+        signatures: Dict[Path, Future] = {}
+        executor = None
+        if len(signature_paths) > 1:
+            executor = ThreadPoolExecutor(max_workers=options.max_workers)
+            signatures = {
+                path: executor.submit(_source_signatures, path, digests.get(path))
+                for path in signature_paths
+            }
+        
+        merged = pikepdf.Pdf.new()
+        sources: List[pikepdf.Pdf] = []
         try:
             # Add PDFs to merger in order
             for doc in documents:
-                orig_path = str(doc.path)
-                if orig_path not in pdf_paths:
+                pdf_path = pdf_paths.get(doc.path)
+                if pdf_path is None:
                     logger.warning(f"Skipping {doc.name} - no PDF available")
                     doc.status = ProcessingStatus.SKIPPED
                     result.skipped_documents += 1
                     continue
                 
-                pdf_path = pdf_paths[orig_path]
+                if len(sources) >= MERGE_OPEN_SOURCES:
+                    merged = _spill_merged(merged, sources, temp_dir)
                 
                 try:
+                    source = pikepdf.open(pdf_path)
+                    sources.append(source)
+                    page_count = len(source.pages)
+                    
+                    # Signatures are taken from the original PDF so verify
+                    # can recompute them without converting or OCRing
+                    if options.add_metadata and doc.type.value == "pdf":
+                        future = signatures.get(doc.path)
+                        try:
+                            doc_hashes, file_hash = (
+                                future.result() if future
+                                else _source_signatures(doc.path, digests.get(doc.path))
+                            )
+                        except Exception as e:
+                            # Metadata only: a PDF qpdf can merge is still merged
+                            logger.warning(f"Could not compute signatures for {doc.name}: {e}")
+                        else:
+                            page_hashes.extend(doc_hashes)
+                            file_hashes[doc.name] = file_hash
+                    
                     # Add to merger
-                    merger.append(str(pdf_path))
+                    merged.pages.extend(source.pages)
                     processed_files.append(doc.name)
                     
                     # Update page count
-                    reader = PdfReader(str(pdf_path))
-                    page_count = len(reader.pages)
                     doc.page_count = page_count
                     result.total_pages += page_count
                     
@@ -303,7 +662,7 @@ class PDFMerger:
                     
                     logger.debug(f"Added {doc.name} ({page_count} pages)")
                     
-                except PdfReadError as e:
+                except (pikepdf.PdfError, PdfReadError) as e:
                     logger.error(f"Failed to add {doc.name}: {e}")
                     doc.status = ProcessingStatus.FAILED
                     doc.error_message = str(e)
@@ -320,13 +679,25 @@ class PDFMerger:
                     '/Producer': 'PDF Combiner Pro',
                     '/Creator': 'PDF Combiner Pro',
                     '/CreationDate': datetime.now().isoformat(),
+                    PAGE_HASHES_KEY: json.dumps(page_hashes),
+                    FILE_HASHES_KEY: json.dumps(file_hashes),
                 }
-                merger.add_metadata(metadata)
+                for key, value in metadata.items():
+                    merged.docinfo[pikepdf.Name(key)] = value
             
             # Write output file
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            merger.write(str(output_path))
-            merger.close()
+            # Object streams pack the many small page and /Info objects
+            # into compressed streams, shrinking the body and xref
+            merged.save(
+                output_path,
+                linearize=False,
+                compress_streams=options.compression,
+                object_stream_mode=(
+                    pikepdf.ObjectStreamMode.generate if options.compression
+                    else pikepdf.ObjectStreamMode.preserve
+                ),
+            )
             
             logger.info(
                 f"Successfully created {output_path} "
@@ -337,7 +708,13 @@ class PDFMerger:
             logger.error(f"Failed to create merged PDF: {e}")
             raise
         finally:
-            merger.close()
+            for source in sources:
+                source.close()
+            merged.close()
+            if executor is not None:
+                for future in signatures.values():
+                    future.cancel()
+                executor.shutdown()
     
     def check_directory(self, directory: Path, recursive: bool = False) -> List[DocumentInfo]:
         """Check documents in a directory without processing.
@@ -352,38 +729,61 @@ class PDFMerger:
         validate_directory(directory)
         
         document_paths = list(iter_documents(directory, recursive))
-        documents = []
+        pdf_paths = [p for p in document_paths if p.suffix.lower() == ".pdf"]
         
-        for path in document_paths:
-            try:
-                doc_info = get_file_info(path)
-                
-                # Check if it's a valid PDF
-                if doc_info.type.value == "pdf":
+        # Bounded by max_workers so callers running several mergers side by side
+        # can keep each one from filling every CPU
+        workers = min(self.config.processing.max_workers, os.cpu_count() or 1)
+        
+        if self.config.processing.metadata_only:
+            _prefetch_tails(pdf_paths)
+        elif workers > 1 and len(pdf_paths) >= PROCESS_POOL_MIN_FILES:
+            # Text extraction is CPU-bound pure Python, so spread it over processes
+            with ProcessPoolExecutor(max_workers=min(workers, len(pdf_paths))) as executor:
+                inspections = {path: executor.submit(_inspect_pdf, path) for path in pdf_paths}
+                checked = [self._check_document(path, inspections.get(path)) for path in document_paths]
+                return [doc_info for doc_info in checked if doc_info is not None]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            checked = list(executor.map(self._check_document, document_paths))
+            return [doc_info for doc_info in checked if doc_info is not None]
+    
+    def _check_document(self, path: Path, inspection: Optional[Future] = None) -> Optional[DocumentInfo]:
+        """Collect DocumentInfo for a single file in check mode.
+        
+        Args:
+            path: Document path
+            inspection: Pending _inspect_pdf result for a PDF, if already submitted
+        """
+        try:
+            doc_info = get_file_info(path)
+            
+            # Check if it's a valid PDF
+            if doc_info.type.value == "pdf":
+                if self.config.processing.metadata_only:
                     try:
-                        reader = PdfReader(str(path))
-                        doc_info.page_count = len(reader.pages)
-                        
-                        # Check for text
-                        doc_info.has_text = False
-                        for page in reader.pages[:3]:
-                            if page.extract_text().strip():
-                                doc_info.has_text = True
-                                break
-                        
-                        # Determine OCR status
-                        if self.ocr_processor:
-                            doc_info.ocr_status = "required" if not doc_info.has_text else "not_needed"
-                        
+                        doc_info.page_count = _read_page_count(path)
                     except PdfReadError as e:
                         doc_info.error_message = f"Corrupted PDF: {e}"
+                    return doc_info
                 
-                documents.append(doc_info)
+                page_count, has_text, error = inspection.result() if inspection else _inspect_pdf(path)
+                if error:
+                    doc_info.error_message = error
+                    return doc_info
                 
-            except Exception as e:
-                logger.error(f"Failed to check {path}: {e}")
-        
-        return documents
+                doc_info.page_count = page_count
+                doc_info.has_text = has_text
+                
+                # Determine OCR status
+                if self.ocr_processor:
+                    doc_info.ocr_status = "required" if not doc_info.has_text else "not_needed"
+            
+            return doc_info
+            
+        except Exception as e:
+            logger.error(f"Failed to check {path}: {e}")
+            return None
     
     def verify_merged_pdf(self, pdf_path: Path, source_dir: Path) -> VerificationResult:
         """Verify that a merged PDF contains all expected files.
@@ -395,27 +795,60 @@ class PDFMerger:
         Returns:
             VerificationResult with details
         """
-        # Get expected files
-        expected_files = [p.name for p in iter_documents(source_dir)]
+        # Get expected files (the directory is scanned once)
+        source_paths = list(iter_documents(source_dir))
+        expected_files = [p.name for p in source_paths]
         
         # Try to extract source files from metadata
         found_files = []
+        stored_hashes = None
+        file_hashes = {}
         try:
-            reader = PdfReader(str(pdf_path))
-            metadata = reader.metadata
-            
-            if metadata and '/Subject' in metadata:
-                subject = str(metadata['/Subject'])
-                if 'Combined from:' in subject:
-                    files_str = subject.replace('Combined from:', '').strip()
-                    found_files = [f.strip() for f in files_str.split(',')]
-            
-            page_count = len(reader.pages)
+            # Only the trailer, /Info and page tree root are read
+            with open(pdf_path, "rb") as f:
+                reader = PdfReader(f)
+                metadata = reader.metadata
+                
+                if metadata and '/Subject' in metadata:
+                    subject = str(metadata['/Subject'])
+                    if 'Combined from:' in subject:
+                        files_str = subject.replace('Combined from:', '').strip()
+                        found_files = _SUBJECT_SEPARATOR_RE.split(files_str)
+                
+                if metadata and PAGE_HASHES_KEY in metadata:
+                    stored_hashes = set(json.loads(str(metadata[PAGE_HASHES_KEY])))
+                
+                if metadata and FILE_HASHES_KEY in metadata:
+                    file_hashes = json.loads(str(metadata[FILE_HASHES_KEY]))
+                
+                page_count = _trailer_page_count(reader)
             
         except Exception as e:
             logger.error(f"Failed to read PDF metadata: {e}")
             page_count = 0
         
+        # Listed source PDFs whose pages no longer match were changed
+        # (or replaced) after the merge, so they don't count as found
+        if stored_hashes is not None:
+            listed = set(found_files)
+            changed = set()
+            for path in source_paths:
+                if path.name not in listed or path.suffix.lower() != ".pdf":
+                    continue
+                try:
+                    # An unchanged file is confirmed without parsing it
+                    if path.name in file_hashes and _file_sha256(path) == file_hashes[path.name]:
+                        continue
+                    matches = set(_page_hashes(PdfReader(str(path)))) <= stored_hashes
+                except Exception as e:
+                    logger.warning(f"Could not hash pages of {path.name}: {e}")
+                    continue
+                if not matches:
+                    logger.warning(f"{path.name} content differs from the merged PDF")
+                    changed.add(path.name)
+            if changed:
+                found_files = [name for name in found_files if name not in changed]
+        
         # Calculate differences
         expected_set = set(expected_files)
         found_set = set(found_files)
@@ -25,7 +25,8 @@ class OCRProcessor:
         dpi: int = 300,
         skip_text_pages: bool = True,
         timeout: int = 300,
-        extra_args: Optional[List[str]] = None
+        extra_args: Optional[List[str]] = None,
+        jobs: Optional[int] = None
     ):
         """Initialize OCR processor.
         
@@ -35,12 +36,15 @@ class OCRProcessor:
             skip_text_pages: Skip pages that already have text
             timeout: OCR timeout in seconds
             extra_args: Additional arguments for ocrmypdf
+            jobs: Pages OCR'd in parallel within one PDF (ocrmypdf --jobs);
+                uses all CPUs if not specified
         """
         self.language = language
         self.dpi = dpi
         self.skip_text_pages = skip_text_pages
         self.timeout = timeout
         self.extra_args = extra_args or []
+        self.jobs = jobs
         self._check_dependencies()
     
     def _check_dependencies(self) -> None:
@@ -122,6 +126,9 @@ class OCRProcessor:
         if self.skip_text_pages:
             cmd.append("--skip-text")
         
+        if self.jobs:
+            cmd.extend(["--jobs", str(self.jobs)])
+        
         # Add extra arguments
         cmd.extend(self.extra_args)
         
@@ -230,6 +237,9 @@ class BatchOCRProcessor:
         
         logger.info(f"Processing {len(need_ocr)} PDFs with OCR")
         
+        # Largest first, so a long scan doesn't start last and hold up the batch
+        need_ocr.sort(key=lambda doc: doc.size_bytes, reverse=True)
+        
         # Process PDFs that need OCR
         if len(need_ocr) <= 2 or self.max_workers == 1:
             # Serial processing for small batches
@@ -1,11 +1,16 @@
 """Utility functions for PDF Combiner."""
 
+import functools
+import hashlib
+import json
 import logging
+import os
 import platform
-import shutil
+import stat
 import subprocess
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Iterator, Set, Optional, Tuple
+from typing import Dict, FrozenSet, List, Iterator, Optional, Tuple, Union
 
 from pdf_combiner.exceptions import DependencyError
 from pdf_combiner.models import DocumentType, DocumentInfo
@@ -14,8 +19,15 @@ from pdf_combiner.models import DocumentType, DocumentInfo
 logger = logging.getLogger(__name__)
 
 
+# Document type by lowercase file extension
+_DOCUMENT_TYPES: Dict[str, DocumentType] = {
+    ".pdf": DocumentType.PDF,
+    ".doc": DocumentType.DOC,
+    ".docx": DocumentType.DOCX,
+}
+
 # Supported file extensions
-SUPPORTED_EXTENSIONS: Set[str] = {".pdf", ".doc", ".docx"}
+SUPPORTED_EXTENSIONS: FrozenSet[str] = frozenset(_DOCUMENT_TYPES)
 
 
 def get_document_type(path: Path) -> Optional[DocumentType]:
@@ -27,16 +39,7 @@ def get_document_type(path: Path) -> Optional[DocumentType]:
     Returns:
         DocumentType or None if not supported
     """
-    extension = path.suffix.lower().lstrip('.')
-    
-    if extension == "pdf":
-        return DocumentType.PDF
-    elif extension == "doc":
-        return DocumentType.DOC
-    elif extension == "docx":
-        return DocumentType.DOCX
-    
-    return None
+    return _DOCUMENT_TYPES.get(path.suffix.lower())
 
 
 def iter_documents(directory: Path, recursive: bool = False) -> Iterator[Path]:
@@ -52,20 +55,29 @@ def iter_documents(directory: Path, recursive: bool = False) -> Iterator[Path]:
     Raises:
         NotADirectoryError: If directory doesn't exist or isn't a directory
     """
-    if not directory.exists():
+    try:
+        st = os.stat(directory)
+    except OSError:
         raise NotADirectoryError(f"Directory does not exist: {directory}")
     
-    if not directory.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise NotADirectoryError(f"Path is not a directory: {directory}")
     
-    if recursive:
-        pattern = "**/*"
-    else:
-        pattern = "*"
+    # scandir caches the entry type, so no extra stat() per path
+    found: List[Path] = []
+    pending: List[Union[str, Path]] = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        found.append(Path(entry.path))
+        except OSError as e:
+            logger.warning(f"Cannot scan {e.filename}: {e.strerror}")
     
-    for path in sorted(directory.glob(pattern)):
-        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS:
-            yield path
+    yield from sorted(found)
 
 
 def count_documents(directory: Path, recursive: bool = False) -> int:
@@ -97,52 +109,132 @@ def get_file_info(path: Path) -> DocumentInfo:
     if not doc_type:
         raise ValueError(f"Unsupported file type: {path.suffix}")
     
-    stat = path.stat()
+    st = path.stat()
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Path is not a file: {path}")
     
-    return DocumentInfo(
+    # The stat above already checked what DocumentInfo.validate_path would,
+    # so build the model without re-validating (and re-stat'ing) the path
+    return DocumentInfo.model_construct(
         path=path,
         name=path.name,
         type=doc_type,
-        size_bytes=stat.st_size,
-        created_at=stat.st_ctime,
-        modified_at=stat.st_mtime,
+        size_bytes=st.st_size,
+        created_at=datetime.fromtimestamp(st.st_ctime, tz=timezone.utc),
+        modified_at=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
     )
 
 
+def _dependency_cache_path() -> Path:
+    """Return the on-disk dependency cache location."""
+    return Path.home() / ".cache" / "pdf_combiner" / "deps.json"
+
+
+def _path_fingerprint(path_env: str) -> str:
+    """Hash $PATH together with the mtimes of its directories.
+    
+    Installing or removing a binary updates its directory's mtime, so a
+    cached lookup is invalidated without probing every tool again.
+    """
+    digest = hashlib.sha1(path_env.encode())
+    for entry in path_env.split(os.pathsep):
+        try:
+            digest.update(str(os.stat(entry).st_mtime_ns).encode())
+        except OSError:
+            digest.update(b"-")
+    return digest.hexdigest()
+
+
 def check_system_dependencies() -> Tuple[List[str], List[str]]:
     """Check for required system dependencies.
     
+    Results are memoized per process and persisted across invocations in
+    ~/.cache/pdf_combiner/deps.json, keyed by a fingerprint of $PATH.
+    
     Returns:
         Tuple of (available_deps, missing_deps)
     """
-    available = []
-    missing = []
+    available, missing = _cached_dependencies(_path_fingerprint(os.environ.get("PATH", "")))
+    return list(available), list(missing)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_dependencies(fingerprint: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Load dependency probe results from disk, probing on a cache miss."""
+    cache_path = _dependency_cache_path()
+    try:
+        cached = json.loads(cache_path.read_text()).get(fingerprint)
+        if cached:
+            return tuple(cached["available"]), tuple(cached["missing"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    
+    available, missing = _probe_dependencies()
     
-    # Check for OCRmyPDF
-    if shutil.which("ocrmypdf"):
-        available.append("ocrmypdf")
-    else:
-        missing.append("ocrmypdf")
-    
-    # Check for Tesseract
-    if shutil.which("tesseract"):
-        available.append("tesseract")
-    else:
-        missing.append("tesseract")
-    
-    # Check for Ghostscript
-    gs_commands = ["gs", "gswin32c", "gswin64c", "ghostscript"]
-    if any(shutil.which(cmd) for cmd in gs_commands):
-        available.append("ghostscript")
-    else:
-        missing.append("ghostscript")
-    
-    # Check for LibreOffice on Linux
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({fingerprint: {"available": available, "missing": missing}}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write dependency cache: {e}")
+    
+    return tuple(available), tuple(missing)
+
+
+def _path_executables(path_env: str) -> Dict[str, str]:
+    """Index the files on $PATH by name with one scandir per directory.
+    
+    Earlier directories win, as with shell lookup. On Windows, names are
+    also indexed without their PATHEXT extension.
+    """
+    windows = platform.system() == "Windows"
+    pathext = {ext.lower() for ext in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(os.pathsep)}
+    
+    index: Dict[str, str] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    name = entry.name.lower() if windows else entry.name
+                    index.setdefault(name, entry.path)
+                    if windows:
+                        stem, ext = os.path.splitext(name)
+                        if ext in pathext:
+                            index.setdefault(stem, entry.path)
+        except OSError:
+            continue
+    return index
+
+
+def _probe_dependencies() -> Tuple[List[str], List[str]]:
+    """Look up each external tool on $PATH."""
+    commands = {
+        "ocrmypdf": ["ocrmypdf"],
+        "tesseract": ["tesseract"],
+        "ghostscript": ["gs", "gswin32c", "gswin64c", "ghostscript"],
+    }
+    # LibreOffice is only required on Linux
     if platform.system() == "Linux":
-        if shutil.which("libreoffice"):
-            available.append("libreoffice")
+        commands["libreoffice"] = ["libreoffice"]
+    
+    index = _path_executables(os.environ.get("PATH", ""))
+    
+    def found(cmd: str) -> bool:
+        path = index.get(cmd)
+        return path is not None and os.access(path, os.X_OK)
+    
+    available = []
+    missing = []
+    for dep, candidates in commands.items():
+        if any(found(cmd) for cmd in candidates):
+            available.append(dep)
         else:
-            missing.append("libreoffice")
+            missing.append(dep)
     
     return available, missing
 
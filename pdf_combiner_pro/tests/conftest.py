@@ -139,7 +139,7 @@ def mock_ocrmypdf(monkeypatch):
 def mock_libreoffice(monkeypatch):
     """Mock LibreOffice command."""
     def mock_run(cmd, *args, **kwargs):
-        # Simulate LibreOffice conversion
+        # Simulate LibreOffice conversion of every input file
         if "libreoffice" in cmd[0]:
             for i, arg in enumerate(cmd):
                 if arg.endswith((".doc", ".docx")):
@@ -153,7 +153,6 @@ def mock_libreoffice(monkeypatch):
                     writer.add_blank_page(width=200, height=200)
                     with open(output_file, "wb") as f:
                         writer.write(f)
-                    break
         
         from subprocess import CompletedProcess
         return CompletedProcess(cmd, 0, "", "")
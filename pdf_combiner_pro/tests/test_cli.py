@@ -38,6 +38,7 @@ class TestCLI:
         assert "--output" in result.output
         assert "--check" in result.output
         assert "--recursive" in result.output
+        assert "--workers" in result.output
     
     def test_combine_check_mode(self, runner, temp_dir, sample_pdf):
         """Test combine command in check mode."""
@@ -135,4 +136,24 @@ ocr:
         
         result = runner.invoke(cli, ["combine", str(temp_dir)])
         assert result.exit_code == 130
-        assert "cancelled by user" in result.output.lower()
\ No newline at end of file
+        assert "cancelled by user" in result.output.lower()
+
+
+class TestFastCLI:
+    """Tests for the argparse front end."""
+    
+    def test_combine_check(self, sample_pdf, capsys):
+        """Test check mode runs through the shared command implementation."""
+        from pdf_combiner.fastcli import main
+        
+        main(["combine", str(sample_pdf.parent), "--check", "--skip-ocr"])
+        assert "Total files: 1" in capsys.readouterr().out
+    
+    def test_rejects_missing_directory(self, capsys):
+        """Test directory validation matches the click CLI."""
+        from pdf_combiner.fastcli import main
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(["combine", "/nonexistent/dir"])
+        assert exc_info.value.code == 2
+        assert "does not exist" in capsys.readouterr().err
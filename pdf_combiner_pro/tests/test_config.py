@@ -0,0 +1,167 @@
+"""Tests for configuration handling."""
+
+import pickle
+
+import pytest
+
+from pdf_combiner import config as config_module
+from pdf_combiner.config import CachedTimeFormatter, Config
+from pdf_combiner.exceptions import ConfigurationError
+
+
+class TestConfigYaml:
+    """Tests for YAML round-tripping."""
+    
+    def test_round_trip_with_paths(self, temp_dir):
+        """Test Path-valued settings survive to_yaml/from_yaml."""
+        config = Config()
+        config.processing.temp_dir = temp_dir / "work"
+        config_file = temp_dir / "config.yaml"
+        
+        config.to_yaml(config_file)
+        loaded = Config.from_yaml(config_file)
+        
+        assert loaded.processing.temp_dir == temp_dir / "work"
+        assert loaded.ocr.language == config.ocr.language
+
+    
+    def test_reload_after_edit(self, temp_dir):
+        """Test the parse cache picks up changes to the file."""
+        config_file = temp_dir / "config.yaml"
+        config_file.write_text("ocr:\n  language: eng\n")
+        assert Config.from_yaml(config_file).ocr.language == "eng"
+        
+        config_file.write_text("ocr:\n  language: deu+fra\n")
+        assert Config.from_yaml(config_file).ocr.language == "deu+fra"
+    
+    @pytest.mark.parametrize("text,key", [
+        ("ocr:\n  langauge: deu\n", "ocr.langauge"),
+        ("outputs:\n  overwrite: true\n", "outputs"),
+    ])
+    def test_unknown_key_rejected(self, temp_dir, text, key):
+        """Test misspelled settings and sections name the offending key."""
+        config_file = temp_dir / "config.yaml"
+        config_file.write_text(text)
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            Config.from_yaml(config_file)
+        
+        assert exc_info.value.key == key
+
+
+class TestConfigSnapshot:
+    """Tests for Config.snapshot."""
+    
+    def test_snapshot_round_trip(self):
+        """Test snapshot captures values and rebuilds an equivalent Config."""
+        config = Config()
+        config.ocr.language = "deu"
+        config.processing.max_workers = 2
+        config.processing.batch_size = 5
+        config.processing.metadata_only = True
+        config.output.default_name = "all.pdf"
+        config.logging.level = "DEBUG"
+        
+        snap = config.snapshot()
+        
+        assert snap.ocr_language == "deu"
+        assert snap.max_workers == 2
+        assert snap.to_config().snapshot() == snap
+        assert snap.to_config().to_dict() == config.to_dict()
+    
+    def test_snapshot_is_frozen_and_picklable(self):
+        """Test snapshot can't be mutated and survives pickling."""
+        snap = Config().snapshot()
+        
+        with pytest.raises(AttributeError):
+            snap.dpi = 72
+        
+        assert pickle.loads(pickle.dumps(snap)) == snap
+
+
+class TestConfigEnvironment:
+    """Tests for environment overrides and validation."""
+    
+    def test_env_override(self, monkeypatch):
+        """Test PDF_COMBINER_<SECTION>__<FIELD> variables are applied."""
+        monkeypatch.setenv("PDF_COMBINER_OCR__LANGUAGE", "deu")
+        monkeypatch.setenv("pdf_combiner_processing__max_workers", "2")
+        monkeypatch.setenv("PDF_COMBINER_OUTPUT__OVERWRITE", "true")
+        monkeypatch.setenv("PDF_COMBINER_OCR__EXTRA_ARGS", '["--clean"]')
+        
+        config = Config()
+        
+        assert config.ocr.language == "deu"
+        assert config.processing.max_workers == 2
+        assert config.output.overwrite is True
+        assert config.ocr.extra_args == ["--clean"]
+    
+    def test_explicit_values_beat_env(self, monkeypatch):
+        """Test values passed to Config take precedence over the environment."""
+        monkeypatch.setenv("PDF_COMBINER_OCR__LANGUAGE", "deu")
+        
+        config = Config(ocr={"language": "fra"})
+        
+        assert config.ocr.language == "fra"
+    
+    @pytest.mark.parametrize("section,values", [
+        ("ocr", {"dpi": 10}),
+        ("processing", {"max_workers": 0}),
+        ("logging", {"level": "LOUD"}),
+        ("output", {"overwrite": "maybe"}),
+    ])
+    def test_invalid_values_rejected(self, section, values):
+        """Test out-of-range and unparseable values raise ValueError."""
+        with pytest.raises(ValueError):
+            Config(**{section: values})
+
+
+class TestSetupLogging:
+    """Tests for Config.setup_logging."""
+    
+    def test_repeat_call_keeps_handlers(self, temp_dir):
+        """Test unchanged settings reuse the installed handlers."""
+        import logging
+        
+        log_file = temp_dir / "run.log"
+        config = Config(logging={"file": str(log_file)})
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        try:
+            config.setup_logging()
+            handlers = root.handlers[:]
+            file_handler = config_module._log_listener.handlers[1]
+            config.logging.level = "DEBUG"
+            config.setup_logging()
+            
+            assert root.handlers == handlers
+            assert root.level == logging.DEBUG
+            
+            config.logging.format = "%(message)s"
+            config.setup_logging()
+            
+            assert root.handlers != handlers
+            assert file_handler.stream is None
+            
+            logging.getLogger("pdf_combiner.test").info("queued")
+            config_module._stop_log_listener()
+            
+            assert log_file.read_text().endswith("queued\n")
+        finally:
+            config_module._stop_log_listener()
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+                handler.close()
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+    def test_cached_time_formatter(self):
+        """Test timestamps are rendered once per second and stay correct."""
+        import logging
+        
+        formatter = CachedTimeFormatter("%(asctime)s %(message)s", "%Y-%m-%d %H:%M:%S")
+        plain = logging.Formatter("%(asctime)s %(message)s", "%Y-%m-%d %H:%M:%S")
+        
+        for created in (1000.1, 1000.9, 1001.2):
+            record = logging.makeLogRecord({"msg": "hello", "created": created})
+            assert formatter.format(record) == plain.format(record)
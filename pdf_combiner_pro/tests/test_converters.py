@@ -0,0 +1,156 @@
+"""Tests for document conversion."""
+
+import platform
+import time
+from pathlib import Path
+
+import pytest
+
+from pdf_combiner import converters
+from pdf_combiner.converters import BatchConverter, DocumentConverter, LibreOfficeServer
+from pdf_combiner.exceptions import ConversionError
+from pdf_combiner.utils import get_file_info
+
+
+class TestDocumentConverter:
+    """Tests for DocumentConverter."""
+    
+    def test_dependency_check_is_reused(self, monkeypatch):
+        """Test LibreOffice is looked up once for several converters."""
+        monkeypatch.setattr(platform, "system", lambda: "Linux")
+        monkeypatch.setattr(converters, "_libreoffice_check", None)
+        calls = []
+        monkeypatch.setattr(converters, "ensure_dependencies", calls.append)
+        
+        DocumentConverter()
+        DocumentConverter()
+        
+        assert calls == [["libreoffice"]]
+
+
+class TestBatchConverter:
+    """Tests for BatchConverter."""
+    
+    def test_pdf_only_skips_converter(self, sample_pdf, monkeypatch):
+        """Test no DocumentConverter is built when every input is a PDF."""
+        def fail(*args, **kwargs):
+            raise AssertionError("DocumentConverter should not be created")
+        monkeypatch.setattr(converters, "DocumentConverter", fail)
+        
+        results = BatchConverter().convert_documents([get_file_info(sample_pdf)])
+        
+        assert results == {str(sample_pdf): sample_pdf}
+    
+    def test_libreoffice_runs_once_per_batch(self, temp_dir, mock_libreoffice, monkeypatch):
+        """Test DOC/DOCX files share LibreOffice runs, split only on clashing names."""
+        monkeypatch.setattr(platform, "system", lambda: "Linux")
+        commands = []
+        run_command = converters.run_command
+        monkeypatch.setattr(
+            converters, "run_command",
+            lambda cmd, **kwargs: commands.append(cmd) or run_command(cmd, **kwargs)
+        )
+        
+        paths = [temp_dir / "a.docx", temp_dir / "b.doc", temp_dir / "sub" / "a.docx"]
+        paths[2].parent.mkdir()
+        for path in paths:
+            path.touch()
+        documents = [get_file_info(path) for path in paths]
+        out_dir = temp_dir / "out"
+        
+        results = BatchConverter(max_workers=4).convert_documents(documents, out_dir)
+        
+        assert len(commands) == 2
+        assert set(results) == {str(path) for path in paths}
+        assert results[str(paths[1])] == out_dir / "b.pdf"
+    
+    def test_parallel_failure_cancels_pending(self, temp_dir, monkeypatch):
+        """Test a failed conversion stops queued conversions from starting."""
+        monkeypatch.setattr(platform, "system", lambda: "Windows")
+        started = []
+        
+        class SlowConverter:
+            def convert_to_pdf(self, document, output_dir=None):
+                started.append(document.name)
+                if document.name == "0.docx":
+                    raise ConversionError("broken", source_file=str(document.path))
+                time.sleep(0.05)
+                return document.path
+        
+        documents = []
+        for i in range(8):
+            path = temp_dir / f"{i}.docx"
+            path.touch()
+            documents.append(get_file_info(path))
+        
+        with pytest.raises(ConversionError):
+            BatchConverter(SlowConverter(), max_workers=2).convert_documents(documents)
+        
+        assert len(started) < len(documents)
+    
+    def test_server_reused_inside_with_block(self, temp_dir, monkeypatch):
+        """Test conversions inside a with block go to one persistent LibreOffice."""
+        monkeypatch.setattr(platform, "system", lambda: "Linux")
+        starts = []
+        
+        def fake_start(server):
+            starts.append(server)
+            server.port = 2002
+            return True
+        
+        monkeypatch.setattr(LibreOfficeServer, "start", fake_start)
+        monkeypatch.setattr(
+            LibreOfficeServer, "running", property(lambda server: server.port is not None)
+        )
+        commands = []
+        
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            output_dir = Path(cmd[cmd.index("-o") + 1])
+            for arg in cmd[cmd.index("-o") + 2:]:
+                (output_dir / f"{Path(arg).stem}.pdf").touch()
+        
+        monkeypatch.setattr(converters, "run_command", fake_run)
+        
+        out_dir = temp_dir / "out"
+        with BatchConverter() as batch:
+            for name in ("a.docx", "b.docx"):
+                path = temp_dir / name
+                path.touch()
+                batch.convert_documents([get_file_info(path)], out_dir)
+        
+        assert len(starts) == 1
+        assert [cmd[0] for cmd in commands] == ["unoconv", "unoconv"]
+        assert batch.converter.server is None
+    
+    def test_server_argv(self, monkeypatch):
+        """Test LibreOffice is started headless on the port picked for it."""
+        monkeypatch.setattr(LibreOfficeServer, "available", staticmethod(lambda: True))
+        launched = []
+        
+        class FakeProcess:
+            def __init__(self, argv, **kwargs):
+                launched.append(argv)
+            
+            def poll(self):
+                return None
+            
+            def terminate(self):
+                pass
+            
+            def wait(self, timeout=None):
+                return 0
+        
+        monkeypatch.setattr(converters.subprocess, "Popen", FakeProcess)
+        monkeypatch.setattr(
+            converters.socket, "create_connection",
+            lambda address, timeout=None: converters.socket.socket()
+        )
+        
+        with LibreOfficeServer() as server:
+            port = server.port
+        
+        argv = launched[0]
+        assert "--nofirststartwizard" in argv
+        assert "--nofirstwrapping" not in argv
+        assert f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ServiceManager" in argv
@@ -0,0 +1,42 @@
+"""Tests for custom exceptions."""
+
+import pickle
+
+import pytest
+
+from pdf_combiner.exceptions import (
+    ConversionError,
+    DependencyError,
+    FileReadError,
+    PDFCombinerError,
+)
+
+
+class TestExceptionDetails:
+    """Tests for exception details and pickling."""
+    
+    def test_details_built_from_fields(self):
+        """Test details reflect the constructor arguments."""
+        error = DependencyError("libreoffice", "sudo apt-get install libreoffice")
+        
+        assert error.details == {
+            "dependency": "libreoffice",
+            "install_command": "sudo apt-get install libreoffice",
+        }
+        assert ConversionError("failed").details == {}
+        assert not hasattr(error, "__dict__") or not error.__dict__
+    
+    @pytest.mark.parametrize("error", [
+        PDFCombinerError("failed", {"key": "value"}),
+        ConversionError("failed", source_file="a.docx", target_format="pdf"),
+        DependencyError("tesseract", "sudo apt-get install tesseract-ocr"),
+        FileReadError("unreadable", "a.pdf"),
+    ])
+    def test_pickle_round_trip(self, error):
+        """Test exceptions survive pickling, e.g. from worker processes."""
+        restored = pickle.loads(pickle.dumps(error))
+        
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        assert restored.message == error.message
+        assert restored.details == error.details
@@ -1,12 +1,14 @@
 """Tests for PDF merger functionality."""
 
+import shutil
 from pathlib import Path
 
 import pytest
 from PyPDF2 import PdfReader
 
 from pdf_combiner.exceptions import ValidationError, MergeError
-from pdf_combiner.merger import PDFMerger
+from pdf_combiner import merger as merger_module
+from pdf_combiner.merger import PROCESS_POOL_MIN_FILES, PDFMerger, _inspect_pdf
 from pdf_combiner.models import ProcessingOptions, ProcessingStatus
 
 
@@ -43,7 +45,8 @@ class TestPDFMerger:
         assert result.processed_documents == 1
         assert result.failed_documents == 0
     
-    def test_merge_multiple_documents(self, temp_dir, sample_pdf, sample_docx, config, mock_libreoffice):
+    def test_merge_multiple_documents(self, temp_dir, sample_pdf, sample_docx, config,
+                                      mock_libreoffice):
         """Test merging multiple documents."""
         merger = PDFMerger(config)
         output_path = temp_dir / "output.pdf"
@@ -82,6 +85,42 @@ class TestPDFMerger:
         assert "/Subject" in metadata
         assert "Combined from:" in str(metadata["/Subject"])
     
+    def test_merge_survives_signature_failure(self, temp_dir, sample_pdf, config, monkeypatch):
+        """Test a source PyPDF2 can't hash is still merged, just without signatures."""
+        def fail(path, file_hash=None):
+            raise KeyError("/Contents")
+        
+        monkeypatch.setattr(merger_module, "_source_signatures", fail)
+        config.output.add_metadata = True
+        merger = PDFMerger(config)
+        output_path = temp_dir / "output.pdf"
+        
+        result = merger.merge_directory(sample_pdf.parent, output_path)
+        
+        assert result.processed_documents == 1
+        assert "Combined from:" in str(PdfReader(str(output_path)).metadata["/Subject"])
+    
+    def test_merge_more_files_than_fd_limit(self, temp_dir, sample_pdf, config):
+        """Test merging more sources than RLIMIT_NOFILE allows open at once."""
+        resource = pytest.importorskip("resource")
+        target_dir = temp_dir / "docs"
+        target_dir.mkdir()
+        for i in range(200):
+            shutil.copy(sample_pdf, target_dir / f"doc{i:03d}.pdf")
+        config.processing.temp_dir = temp_dir
+        merger = PDFMerger(config)
+        output_path = temp_dir / "output.pdf"
+        
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (128, hard))
+        try:
+            result = merger.merge_directory(target_dir, output_path)
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+        
+        assert result.processed_documents == 200
+        assert len(PdfReader(str(output_path)).pages) == 200
+    
     def test_check_directory(self, temp_dir, sample_pdf, config):
         """Test checking directory without merging."""
         merger = PDFMerger(config)
@@ -92,6 +131,111 @@ class TestPDFMerger:
         assert documents[0].name == sample_pdf.name
         assert documents[0].page_count is not None
     
+    def test_check_directory_detects_text(self, temp_dir, sample_pdf, sample_pdf_with_text, config):
+        """Test text layer detection during a full check."""
+        merger = PDFMerger(config)
+        
+        documents = {d.name: d for d in merger.check_directory(temp_dir)}
+        
+        assert documents[sample_pdf.name].has_text is False
+        assert documents[sample_pdf_with_text.name].has_text is True
+    
+    def test_check_directory_in_worker_processes(self, temp_dir, sample_pdf, sample_pdf_with_text,
+                                                 config):
+        """Test larger directories are inspected in worker processes."""
+        for i in range(PROCESS_POOL_MIN_FILES):
+            shutil.copy(sample_pdf, temp_dir / f"copy{i}.pdf")
+        (temp_dir / "corrupted.pdf").write_bytes(b"not a pdf")
+        merger = PDFMerger(config)
+        
+        documents = {d.name: d for d in merger.check_directory(temp_dir)}
+        
+        assert documents["copy0.pdf"].page_count == 1
+        assert documents["copy0.pdf"].has_text is False
+        assert documents[sample_pdf_with_text.name].has_text is True
+        assert documents["corrupted.pdf"].error_message.startswith("Corrupted PDF")
+    
+    def test_check_directory_single_worker_stays_in_process(self, temp_dir, sample_pdf, config,
+                                                            monkeypatch):
+        """Test max_workers=1 inspects PDFs without starting a process pool."""
+        def fail(*args, **kwargs):
+            raise AssertionError("ProcessPoolExecutor should not be used")
+        
+        monkeypatch.setattr(merger_module, "ProcessPoolExecutor", fail)
+        for i in range(PROCESS_POOL_MIN_FILES):
+            shutil.copy(sample_pdf, temp_dir / f"copy{i}.pdf")
+        config.processing.max_workers = 1
+        merger = PDFMerger(config)
+        
+        documents = merger.check_directory(temp_dir)
+        
+        assert len(documents) == PROCESS_POOL_MIN_FILES + 1
+        assert all(doc.page_count == 1 for doc in documents)
+    
+    def test_identical_documents_converted_once(self, temp_dir, sample_docx, config,
+                                                mock_libreoffice, monkeypatch):
+        """Test byte-identical DOCX files share one conversion but both are merged."""
+        from pdf_combiner import converters
+        commands = []
+        run_command = converters.run_command
+        monkeypatch.setattr(
+            converters, "run_command",
+            lambda cmd, **kwargs: commands.append(cmd) or run_command(cmd, **kwargs)
+        )
+        target_dir = temp_dir / "docs"
+        target_dir.mkdir()
+        shutil.copy(sample_docx, target_dir / "a.docx")
+        shutil.copy(sample_docx, target_dir / "b.docx")
+        config.processing.temp_dir = temp_dir / "work"
+        merger = PDFMerger(config)
+        
+        result = merger.merge_directory(target_dir, temp_dir / "output.pdf")
+        
+        converted = [arg for cmd in commands for arg in cmd if arg.endswith(".docx")]
+        assert converted == [str(target_dir / "a.docx")]
+        assert result.processed_documents == 2
+        assert result.total_pages == 2
+    
+    def test_merge_starts_one_libreoffice_server(self, temp_dir, sample_docx, config,
+                                                 mock_libreoffice, monkeypatch):
+        """Test merge_directory offers its conversions one persistent LibreOffice."""
+        from pdf_combiner.converters import LibreOfficeServer
+        starts = []
+        monkeypatch.setattr(
+            LibreOfficeServer, "start", lambda server: starts.append(server) and False
+        )
+        target_dir = temp_dir / "docs"
+        target_dir.mkdir()
+        shutil.copy(sample_docx, target_dir / "a.docx")
+        shutil.copy(sample_docx, target_dir / "b.docx")
+        config.processing.temp_dir = temp_dir
+        merger = PDFMerger(config)
+        
+        result = merger.merge_directory(target_dir, temp_dir / "output.pdf")
+        
+        assert len(starts) == 1
+        assert result.processed_documents == 2
+    
+    def test_inspect_pdf_backends_agree(self, sample_pdf, sample_pdf_with_text, monkeypatch):
+        """Test the PyMuPDF fast path matches the PyPDF2 fallback."""
+        pytest.importorskip("fitz")
+        fast = [_inspect_pdf(sample_pdf), _inspect_pdf(sample_pdf_with_text)]
+        
+        monkeypatch.setattr(merger_module, "_fitz", lambda: None)
+        
+        assert [_inspect_pdf(sample_pdf), _inspect_pdf(sample_pdf_with_text)] == fast
+    
+    def test_check_directory_metadata_only(self, temp_dir, sample_pdf, config):
+        """Test metadata-only check reads page counts but skips text detection."""
+        config.processing.metadata_only = True
+        merger = PDFMerger(config)
+        
+        documents = merger.check_directory(sample_pdf.parent)
+        
+        assert len(documents) == 1
+        assert documents[0].page_count == 1
+        assert documents[0].has_text is None
+    
     def test_verify_merged_pdf(self, temp_dir, sample_pdf, config):
         """Test PDF verification."""
         merger = PDFMerger(config)
@@ -107,6 +251,26 @@ class TestPDFMerger:
         assert result.is_valid
         assert len(result.missing_files) == 0
         assert result.page_count > 0
+    
+    def test_verify_detects_changed_source(self, temp_dir, sample_pdf_with_text, config):
+        """Test verification compares page signatures, not just file names."""
+        merger = PDFMerger(config)
+        output_path = temp_dir / "out" / "output.pdf"
+        output_path.parent.mkdir()
+        
+        merger.merge_directory(sample_pdf_with_text.parent, output_path)
+        assert merger.verify_merged_pdf(output_path, temp_dir).is_valid
+        
+        # Replace the source content but keep its name
+        from reportlab.pdfgen import canvas
+        c = canvas.Canvas(str(sample_pdf_with_text))
+        c.drawString(100, 750, "Different content.")
+        c.showPage()
+        c.save()
+        
+        result = merger.verify_merged_pdf(output_path, temp_dir)
+        assert not result.is_valid
+        assert result.missing_files == [sample_pdf_with_text.name]
 
 
 class TestProcessingOptions:
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from pdf_combiner.exceptions import DependencyError
-from pdf_combiner.models import DocumentType
+from pdf_combiner.models import DocumentInfo, DocumentType
 from pdf_combiner.utils import (
     get_document_type,
     iter_documents,
@@ -13,7 +13,9 @@ from pdf_combiner.utils import (
     format_file_size,
     sanitize_filename,
     get_file_info,
+    check_system_dependencies,
 )
+from pdf_combiner import utils
 
 
 class TestGetDocumentType:
@@ -197,4 +199,63 @@ class TestGetFileInfo:
         txt_file.touch()
         
         with pytest.raises(ValueError, match="Unsupported file type"):
-            get_file_info(txt_file)
\ No newline at end of file
+            get_file_info(txt_file)
+    
+    def test_directory_rejected(self, temp_dir):
+        """Test a directory with a document extension is not accepted."""
+        (temp_dir / "folder.pdf").mkdir()
+        
+        with pytest.raises(ValueError, match="not a file"):
+            get_file_info(temp_dir / "folder.pdf")
+    
+    def test_timestamps_match_model_validation(self, sample_pdf):
+        """Test timestamps equal what DocumentInfo validation would produce."""
+        info = get_file_info(sample_pdf)
+        stat_result = sample_pdf.stat()
+        validated = DocumentInfo(
+            path=sample_pdf,
+            name=sample_pdf.name,
+            type=DocumentType.PDF,
+            size_bytes=stat_result.st_size,
+            created_at=stat_result.st_ctime,
+            modified_at=stat_result.st_mtime,
+        )
+        
+        assert info.created_at == validated.created_at
+        assert info.modified_at == validated.modified_at
+
+
+class TestCheckSystemDependencies:
+    """Tests for check_system_dependencies caching."""
+    
+    def test_results_cached(self, temp_dir, monkeypatch):
+        """Test dependency probes are memoized and persisted to disk."""
+        monkeypatch.setenv("HOME", str(temp_dir))
+        calls = []
+        monkeypatch.setattr(
+            utils, "_probe_dependencies",
+            lambda: calls.append(1) or (["tesseract"], ["ocrmypdf"])
+        )
+        utils._cached_dependencies.cache_clear()
+        
+        first = check_system_dependencies()
+        assert first == (["tesseract"], ["ocrmypdf"])
+        assert check_system_dependencies() == first
+        assert len(calls) == 1
+        assert (temp_dir / ".cache" / "pdf_combiner" / "deps.json").exists()
+        
+        # A fresh process reads the disk cache instead of probing again
+        utils._cached_dependencies.cache_clear()
+        assert check_system_dependencies() == first
+        assert len(calls) == 1
+        utils._cached_dependencies.cache_clear()
+    
+    def test_probe_matches_which(self):
+        """Test the $PATH index finds the same tools as shutil.which."""
+        import shutil
+        
+        available, missing = utils._probe_dependencies()
+        
+        assert ("ocrmypdf" in available) == bool(shutil.which("ocrmypdf"))
+        assert ("tesseract" in available) == bool(shutil.which("tesseract"))
+        assert set(available).isdisjoint(missing)
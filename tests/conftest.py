@@ -0,0 +1,38 @@
+"""Pytest configuration and fixtures for the standalone scripts."""
+
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+from PyPDF2 import PdfWriter
+
+# The scripts live at the repository root rather than in a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def many_pdfs(tmp_path: Path) -> List[Path]:
+    """Create 150 single-page PDFs."""
+    source_dir = tmp_path / "docs"
+    source_dir.mkdir()
+    paths = []
+    for i in range(150):
+        writer = PdfWriter()
+        writer.add_blank_page(width=200, height=200)
+        path = source_dir / f"doc{i:03d}.pdf"
+        with open(path, "wb") as f:
+            writer.write(f)
+        paths.append(path)
+    
+    return paths
+
+
+@pytest.fixture
+def low_fd_limit():
+    """Lower the soft descriptor limit below the number of PDFs in many_pdfs."""
+    resource = pytest.importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (100, hard))
+    yield
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
@@ -0,0 +1,55 @@
+"""Tests for combine_pdfs.py."""
+
+import json
+
+import pytest
+from PyPDF2 import PdfReader
+
+import combine_pdfs
+
+
+def test_merge_pikepdf_under_fd_limit(tmp_path, many_pdfs, low_fd_limit):
+    """Test merging more files than RLIMIT_NOFILE allows open at once."""
+    pytest.importorskip("pikepdf")
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    output = tmp_path / "combined.pdf"
+    parts = [(path.name, path) for path in many_pdfs]
+    
+    processed, failed, total_pages = combine_pdfs._merge_pikepdf(parts, output, work_dir)
+    
+    assert failed == []
+    assert len(processed) == total_pages == len(many_pdfs)
+    assert len(PdfReader(str(output)).pages) == len(many_pdfs)
+    assert list(work_dir.iterdir()) == []
+
+
+def test_save_cache_drops_stale_entries(tmp_path, many_pdfs, monkeypatch):
+    """Test entries for deleted or modified files are pruned when the cache is saved."""
+    cache_file = tmp_path / "cache" / "text_probe.json"
+    monkeypatch.setattr(combine_pdfs, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(combine_pdfs, "_cache", None)
+    monkeypatch.setattr(combine_pdfs, "_cache_dirty", False)
+    monkeypatch.setattr(combine_pdfs, "_cache_new", {})
+    kept, deleted, modified = many_pdfs[:3]
+    for path in (kept, deleted, modified):
+        combine_pdfs.pdf_has_text(path)
+    deleted.unlink()
+    modified.write_bytes(modified.read_bytes() + b"\n")
+    
+    combine_pdfs._save_cache()
+    
+    entries = json.loads(cache_file.read_text())["text"]
+    assert [key.split("|")[0] for key in entries] == [str(kept.resolve())]
+
+
+def test_ocr_outputs_unique_per_source(tmp_path, monkeypatch):
+    """Test same-named inputs from different directories get separate OCR outputs."""
+    monkeypatch.setattr(combine_pdfs, "pdf_has_text", lambda path: False)
+    monkeypatch.setattr(combine_pdfs.subprocess, "run", lambda cmd, check: None)
+    sources = [tmp_path / "docs" / "a.pdf", tmp_path / "convert_0_0" / "a.pdf"]
+    
+    outputs = {combine_pdfs.ocr_pdf(source, tmp_path) for source in sources}
+    
+    assert len(outputs) == 2
+    assert all(path.parent == tmp_path and path.name.endswith("_a.pdf") for path in outputs)
@@ -0,0 +1,98 @@
+"""Tests for combine_pdfs_enhanced.py."""
+
+import logging
+import socket
+
+import pytest
+from PyPDF2 import PdfReader, PdfWriter
+
+import combine_pdfs_enhanced
+from combine_pdfs_enhanced import (
+    EnhancedPDFProcessor,
+    ProcessingConfig,
+    _subject_summary,
+    iter_documents,
+    verify_combined_pdf_enhanced,
+)
+
+
+def test_merge_pikepdf_under_fd_limit(tmp_path, many_pdfs, low_fd_limit):
+    """Test merging more files than RLIMIT_NOFILE allows open at once."""
+    pytest.importorskip("pikepdf")
+    output = tmp_path / "combined.pdf"
+    processor = EnhancedPDFProcessor(ProcessingConfig())
+    parts = [(path.name, path) for path in many_pdfs]
+    
+    total_pages = processor._merge_pikepdf(parts, output, tmp_path)
+    
+    assert total_pages == len(many_pdfs)
+    reader = PdfReader(str(output))
+    assert len(reader.pages) == len(many_pdfs)
+    assert len(reader.outline) == len(many_pdfs)
+
+
+def test_uno_port_starts_soffice_on_free_port(monkeypatch):
+    """Test the UNO server is started with valid options on a port picked for this run."""
+    launched = []
+    
+    class FakeServer:
+        def __init__(self, argv, **kwargs):
+            launched.append(argv)
+        
+        def poll(self):
+            return None
+        
+        def terminate(self):
+            pass
+        
+        def wait(self, timeout=None):
+            return 0
+    
+    monkeypatch.setattr(combine_pdfs_enhanced.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(combine_pdfs_enhanced.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(combine_pdfs_enhanced.subprocess, "Popen", FakeServer)
+    monkeypatch.setattr(combine_pdfs_enhanced.socket, "create_connection",
+                        lambda address, timeout=None: socket.socket())
+    
+    with EnhancedPDFProcessor(ProcessingConfig()) as processor:
+        port = processor.uno_port()
+        assert processor.uno_port() == port
+    
+    assert len(launched) == 1
+    argv = launched[0]
+    assert argv[0] == "soffice"
+    assert "--nofirststartwizard" in argv
+    assert "--nofirstwrapping" not in argv
+    assert f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ServiceManager" in argv
+    assert isinstance(port, int) and port > 0
+
+
+def test_verify_reports_truncated_subject(tmp_path, many_pdfs, caplog):
+    """Test a truncated /Subject without a manifest is reported instead of compared."""
+    names = [path.name for path in many_pdfs]
+    output = tmp_path / "combined.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    writer.add_metadata({"/Subject": _subject_summary(names, limit=100)})
+    with open(output, "wb") as f:
+        writer.write(f)
+    config = ProcessingConfig()
+    config.compile_patterns()
+    
+    with caplog.at_level(logging.INFO):
+        verify_combined_pdf_enhanced(output, many_pdfs[0].parent, config)
+    
+    assert "truncated" in caplog.text
+    assert "MISSING FILES" not in caplog.text
+
+
+def test_iter_documents_follows_symlinks(tmp_path, many_pdfs):
+    """Test symlinked documents are found alongside regular files."""
+    source_dir = tmp_path / "linked"
+    source_dir.mkdir()
+    (source_dir / "b.pdf").symlink_to(many_pdfs[0])
+    (source_dir / "a.pdf").write_bytes(many_pdfs[1].read_bytes())
+    config = ProcessingConfig()
+    config.compile_patterns()
+    
+    assert [path.name for path in iter_documents(source_dir, config)] == ["a.pdf", "b.pdf"]